@@ -1,4 +1,4 @@
-from .cache import MemoryTTLCache
+from .cache import MemoryTTLCache, SQLiteTTLCache
 from .models import (
     ChampionshipStandingRow,
     ClassificationRow,
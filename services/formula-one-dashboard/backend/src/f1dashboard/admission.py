@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Lock
+
+# `Warning` header sent with a snapshot served after it expired.
+STALE_WARNING = '110 - "Response is Stale"'
+
+
+class Overloaded(RuntimeError):
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__(f"overloaded; retry after {retry_after_seconds}s")
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(slots=True)
+class AdmissionStats:
+    active: int = 0
+    waiting: int = 0
+    admitted: int = 0
+    queued: int = 0
+    shed: int = 0
+
+
+class AdmissionGate:
+    """Bound how many requests may work on (or wait for) a snapshot at once.
+
+    Up to `max_active` requests run and up to `max_queued` more wait, each at
+    most `queue_timeout_seconds`; anything beyond that fails at once with
+    `Overloaded`, so a traffic spike cannot hold every worker thread.
+    """
+
+    def __init__(
+        self,
+        max_active: int | None = None,
+        max_queued: int | None = None,
+        queue_timeout_seconds: float | None = None,
+        retry_after_seconds: int | None = None,
+    ) -> None:
+        self.max_active = max_active or int(os.getenv("DASHBOARD_MAX_ACTIVE_REQUESTS", "4"))
+        self.max_queued = max_queued if max_queued is not None else int(os.getenv("DASHBOARD_MAX_QUEUED_REQUESTS", "16"))
+        self.queue_timeout_seconds = (
+            queue_timeout_seconds if queue_timeout_seconds is not None else float(os.getenv("DASHBOARD_QUEUE_TIMEOUT_SECONDS", "2"))
+        )
+        self.retry_after_seconds = retry_after_seconds or int(os.getenv("DASHBOARD_RETRY_AFTER_SECONDS", "5"))
+        self.stats = AdmissionStats()
+        self._slots = BoundedSemaphore(self.max_active)
+        self._lock = Lock()
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                if self.stats.waiting >= self.max_queued:
+                    self.stats.shed += 1
+                    raise Overloaded(self.retry_after_seconds)
+                self.stats.waiting += 1
+                self.stats.queued += 1
+            try:
+                acquired = self._slots.acquire(timeout=self.queue_timeout_seconds)
+            finally:
+                with self._lock:
+                    self.stats.waiting -= 1
+            if not acquired:
+                with self._lock:
+                    self.stats.shed += 1
+                raise Overloaded(self.retry_after_seconds)
+        with self._lock:
+            self.stats.active += 1
+            self.stats.admitted += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.stats.active -= 1
+            self._slots.release()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from functools import cache
+from statistics import median
+
+
+@dataclass(slots=True)
+class GroupSummary:
+    count: int
+    mean: float
+    median: float
+    minimum: float
+
+
+def summarize_groups(keys: Sequence[Hashable], values: Sequence[float]) -> dict[Hashable, GroupSummary]:
+    """Count, mean, median and minimum of `values` per key, in one pass over the columns.
+
+    With NumPy installed the groups are reduced with `bincount` and a single
+    sort instead of a Python loop per row.
+    """
+    if len(keys) != len(values):
+        raise ValueError("keys and values must have the same length")
+    if not keys:
+        return {}
+    numpy = optional_numpy()
+    if numpy is None:
+        grouped: dict[Hashable, list[float]] = {}
+        for key, value in zip(keys, values):
+            grouped.setdefault(key, []).append(float(value))
+        return {
+            key: GroupSummary(count=len(group), mean=sum(group) / len(group), median=median(group), minimum=min(group))
+            for key, group in grouped.items()
+        }
+
+    labels = list(dict.fromkeys(keys))
+    positions = {key: index for index, key in enumerate(labels)}
+    codes = numpy.fromiter((positions[key] for key in keys), dtype=numpy.intp, count=len(keys))
+    return dict(zip(labels, summarize_codes(codes, numpy.asarray(values, dtype=float), len(labels))))
+
+
+def summarize_codes(codes, column, groups: int) -> list[GroupSummary]:
+    """`summarize_groups` for NumPy columns already keyed by group code 0..groups-1.
+
+    Requires NumPy, and every code must occur at least once.
+    """
+    numpy = optional_numpy()
+    counts = numpy.bincount(codes, minlength=groups)
+    sums = numpy.bincount(codes, weights=column, minlength=groups)
+    # Sort by group, then value: each group is a contiguous sorted run.
+    order = numpy.lexsort((column, codes))
+    ordered = column[order]
+    starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+    lower = ordered[starts + (counts - 1) // 2]
+    upper = ordered[starts + counts // 2]
+    medians = (lower + upper) / 2
+    minimums = ordered[starts]
+    return [
+        GroupSummary(count=int(counts[index]), mean=float(sums[index] / counts[index]), median=float(medians[index]), minimum=float(minimums[index]))
+        for index in range(groups)
+    ]
+
+
+def grouped_slopes(keys: Sequence[Hashable], x: Sequence[float], y: Sequence[float]) -> dict[Hashable, float | None]:
+    """Least-squares slope of `y` over `x` per key; None for groups with fewer than two distinct `x`.
+
+    Only per-group sums (n, Σx, Σy, Σxy, Σx²) are needed, so with NumPy every
+    group is fitted at once from five `bincount`s.
+    """
+    if not len(keys) == len(x) == len(y):
+        raise ValueError("keys, x and y must have the same length")
+    labels = list(dict.fromkeys(keys))
+    positions = {key: index for index, key in enumerate(labels)}
+    numpy = optional_numpy()
+    if numpy is None:
+        sums = [[0.0] * 5 for _ in labels]
+        for key, x_value, y_value in zip(keys, x, y):
+            group = sums[positions[key]]
+            group[0] += 1
+            group[1] += x_value
+            group[2] += y_value
+            group[3] += x_value * y_value
+            group[4] += x_value * x_value
+        return {label: _slope(*group) for label, group in zip(labels, sums)}
+
+    codes = numpy.fromiter((positions[key] for key in keys), dtype=numpy.intp, count=len(keys))
+    return dict(zip(labels, coded_slopes(codes, numpy.asarray(x, dtype=float), numpy.asarray(y, dtype=float), len(labels))))
+
+
+def coded_slopes(codes, x_column, y_column, groups: int) -> list[float | None]:
+    """`grouped_slopes` for NumPy columns already keyed by group code 0..groups-1; requires NumPy."""
+    numpy = optional_numpy()
+    columns = [
+        numpy.bincount(codes, weights=weights, minlength=groups)
+        for weights in (None, x_column, y_column, x_column * y_column, x_column * x_column)
+    ]
+    return [_slope(*(float(column[index]) for column in columns)) for index in range(groups)]
+
+
+def _slope(n: float, sum_x: float, sum_y: float, sum_xy: float, sum_xx: float) -> float | None:
+    denominator = n * sum_xx - sum_x * sum_x
+    if n < 2 or abs(denominator) < 1e-9:
+        return None
+    return (n * sum_xy - sum_x * sum_y) / denominator
+
+
+@cache
+def optional_numpy():
+    # NumPy is optional; the pure-Python path gives the same results.
+    try:
+        import numpy
+    except ModuleNotFoundError:  # pragma: no cover - numpy is optional
+        return None
+    return numpy
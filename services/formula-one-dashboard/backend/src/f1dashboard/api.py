@@ -1,28 +1,192 @@
 from __future__ import annotations
 
+import json
+from contextlib import asynccontextmanager
 from dataclasses import asdict
+from functools import wraps
+from typing import Callable
 
 try:
-    from fastapi import FastAPI
+    from fastapi import FastAPI, Request, Response
 except ModuleNotFoundError:  # pragma: no cover - scaffold-friendly fallback
     class FastAPI:  # type: ignore[no-redef]
+        def __init__(self, **_kwargs) -> None:
+            pass
+
         def get(self, _path: str):
             def decorator(fn):
                 return fn
 
             return decorator
 
-from f1dashboard.services.dashboard import DashboardService
+    class Request:  # type: ignore[no-redef]
+        headers: dict[str, str] = {}
+
+    class Response:  # type: ignore[no-redef]
+        def __init__(self, content: bytes = b"", status_code: int = 200, headers: dict[str, str] | None = None) -> None:
+            self.body = content
+            self.status_code = status_code
+            self.headers = dict(headers or {})
+
+from f1dashboard.admission import STALE_WARNING, Overloaded
+from f1dashboard.assets import asset_response
+from f1dashboard.compression import IDENTITY
+from f1dashboard.models import DashboardSnapshot
+from f1dashboard.schedule import cache_headers, countdown, next_state_change
+from f1dashboard.services.dashboard import DashboardService, json_default
+
+_service: DashboardService | None = None
+
+
+def get_service() -> DashboardService:
+    # Built by the lifespan hook below, before the app accepts traffic.
+    global _service
+    if _service is None:
+        _service = DashboardService()
+    return _service
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    service = get_service()
+    service.warm_start()
+    service.refresh_in_background()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)  # type: ignore[call-arg]
+
+
+def _json_response(payload: object, headers: dict[str, str]) -> Response:
+    body = json.dumps(payload, default=json_default).encode("utf-8")
+    return Response(content=body, headers={**headers, "Content-Type": "application/json"})
+
+
+def _shed_when_overloaded(handler: Callable[..., object]) -> Callable[..., object]:
+    """Answer 503 with `Retry-After` when admission control turns the request away."""
+
+    @wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            return handler(*args, **kwargs)
+        except Overloaded as exc:
+            body = json.dumps({"detail": "The dashboard is overloaded; retry shortly."}).encode("utf-8")
+            headers = {"Retry-After": str(exc.retry_after_seconds), "Content-Type": "application/json", "Cache-Control": "no-store"}
+            return Response(content=body, status_code=503, headers=headers)
+
+    return wrapper
+
 
-app = FastAPI()  # type: ignore[call-arg]
-service = DashboardService()
+def _served_snapshot(service: DashboardService) -> tuple[DashboardSnapshot, dict[str, str]]:
+    snapshot, stale = service.serve_snapshot()
+    return snapshot, {"Warning": STALE_WARNING} if stale else {}
 
 
 @app.get("/api/dashboard")
-def get_dashboard() -> dict:
-    return asdict(service.get_snapshot())
+@_shed_when_overloaded
+def get_dashboard(request: Request) -> Response:
+    service = get_service()
+    snapshot, warning = _served_snapshot(service)
+    now = service.clock()
+    # The snapshot changes at the next session boundary or when it is
+    # refreshed, whichever comes first.
+    boundary = next_state_change(snapshot.sessions, now)
+    expires_at = min(filter(None, [boundary, service.snapshot_expires_at(snapshot)]))
+    encoded = service.encoded_snapshot(snapshot)
+    headers = {**cache_headers(expires_at, now), "ETag": encoded.etag, "Vary": "Accept-Encoding", **warning}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and encoded.etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(content=b"", status_code=304, headers=headers)
+
+    encoding, body = encoded.negotiate(request.headers.get("accept-encoding"))
+    headers["Content-Type"] = "application/json"
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, headers=headers)
+
+
+@app.get("/api/schedule/next")
+@_shed_when_overloaded
+def get_next_schedule() -> Response:
+    service = get_service()
+    snapshot, warning = _served_snapshot(service)
+    now = service.clock()
+    payload = {
+        "meeting": asdict(snapshot.meeting) if snapshot.meeting is not None else None,
+        "sessions": [asdict(session) for session in snapshot.sessions if session.date_end_utc is None or session.date_end_utc > now],
+    }
+    return _json_response(payload, {**cache_headers(next_state_change(snapshot.sessions, now), now), **warning})
+
+
+@app.get("/api/countdown")
+@_shed_when_overloaded
+def get_countdown() -> Response:
+    service = get_service()
+    snapshot, warning = _served_snapshot(service)
+    now = service.clock()
+    headers = {**cache_headers(next_state_change(snapshot.sessions, now), now), **warning}
+    return _json_response(asdict(countdown(snapshot.sessions, now)), headers)
+
+
+@app.get("/api/standings/drivers")
+@_shed_when_overloaded
+def get_driver_standings() -> Response:
+    snapshot, warning = _served_snapshot(get_service())
+    return _json_response([asdict(row) for row in snapshot.driver_standings], warning)
+
+
+@app.get("/api/standings/constructors")
+@_shed_when_overloaded
+def get_constructor_standings() -> Response:
+    snapshot, warning = _served_snapshot(get_service())
+    return _json_response([asdict(row) for row in snapshot.constructor_standings], warning)
+
+
+@app.get("/api/venue/assets/{name}")
+def get_venue_asset(name: str, request: Request) -> Response:
+    # Not gated: assets are immutable, held in memory after their first read
+    # and cached for a year by browsers and proxies, so they cost no more
+    # than the shed response would.
+    result = asset_response(
+        get_service().asset_store.get(name),
+        accept_encoding=request.headers.get("accept-encoding"),
+        if_none_match=request.headers.get("if-none-match"),
+    )
+    return Response(content=result.body, status_code=result.status_code, headers=result.headers)
+
+
+@app.get("/api/venue/pit-stops")
+@_shed_when_overloaded
+def get_pit_stops() -> dict:
+    # Built by the refresh leader with the snapshot; never fetched per request.
+    return get_service().pit_stops()
+
+
+@app.get("/api/venue/laps")
+@_shed_when_overloaded
+def get_lap_metrics() -> dict:
+    return get_service().lap_metrics()
+
+
+@app.get("/api/history/{season}")
+@_shed_when_overloaded
+def get_season_history(season: int) -> dict:
+    service = get_service()
+    if service.archive is None:
+        return {"season": season, "rounds": [], "meetings": []}
+    # Answered from SQLite, so it takes an admission slot like a snapshot build.
+    with service.admission.admit():
+        return {"season": season, "rounds": service.archive.season_rounds(season), "meetings": service.archive.meetings(season)}
 
 
 @app.get("/api/health")
-def health() -> dict[str, str]:
-    return {"status": "ok"}
+async def health() -> dict[str, object]:
+    # Runs on the event loop rather than the worker threadpool, so it answers
+    # even while every worker is busy; it only reads counters.
+    service = get_service()
+    return {
+        "status": "ok",
+        "refresh_lease": asdict(service.refresh_lease.stats),
+        "admission": asdict(service.admission.stats),
+        "decode_errors": dict(service.decode_errors),
+    }
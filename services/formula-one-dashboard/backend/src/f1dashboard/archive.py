@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+RACE = "race"
+QUALIFYING = "qualifying"
+DRIVER = "driver"
+CONSTRUCTOR = "constructor"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    race_name TEXT,
+    circuit_id TEXT,
+    date_utc TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (season, round, kind)
+);
+CREATE TABLE IF NOT EXISTS results (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    position INTEGER,
+    driver_id TEXT NOT NULL,
+    constructor_id TEXT,
+    points REAL,
+    PRIMARY KEY (season, round, kind, driver_id)
+);
+CREATE INDEX IF NOT EXISTS results_by_driver ON results (driver_id, season, round);
+CREATE TABLE IF NOT EXISTS standings (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    position INTEGER,
+    competitor_id TEXT NOT NULL,
+    points REAL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (season, round, kind, competitor_id)
+);
+CREATE INDEX IF NOT EXISTS standings_by_competitor ON standings (kind, competitor_id, season, round);
+CREATE TABLE IF NOT EXISTS meetings (
+    meeting_key INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    date_start TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS meetings_by_year ON meetings (year, date_start);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_key INTEGER PRIMARY KEY,
+    meeting_key INTEGER NOT NULL,
+    date_start TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_meeting ON sessions (meeting_key, date_start);
+CREATE TABLE IF NOT EXISTS feeds (
+    season INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    next_offset INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    newest_round INTEGER,
+    newest_round_offset INTEGER NOT NULL,
+    PRIMARY KEY (season, kind)
+);
+"""
+
+
+@dataclass(slots=True)
+class FeedState:
+    """How far a paginated season query has been read.
+
+    `newest_round_offset` is the row offset where the newest round starts, so
+    a refresh re-reads that round (for late penalties) and anything after it.
+    """
+
+    next_offset: int = 0
+    # -1 until the first page has been read.
+    total: int = -1
+    newest_round: int | None = None
+    newest_round_offset: int = 0
+
+    @property
+    def caught_up(self) -> bool:
+        return 0 <= self.total <= self.next_offset
+
+
+class SeasonArchive:
+    """Local SQLite archive of finished rounds, meetings and sessions.
+
+    Rounds are stored as the Jolpica race payloads they came from (plus
+    indexed columns for history queries), so readers get the same shape as a
+    live response. Only finished data belongs here; it is never refetched.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def put_round(self, kind: str, race: dict[str, Any]) -> None:
+        season = race_season(race)
+        round_number = int(race["round"])
+        rows_key = "Results" if kind == RACE else "QualifyingResults"
+        result_rows = []
+        for row in race.get(rows_key, []):
+            driver_id = row.get("Driver", {}).get("driverId")
+            if not driver_id:
+                continue
+            result_rows.append(
+                (
+                    season,
+                    round_number,
+                    kind,
+                    _optional_int(row.get("position")),
+                    driver_id,
+                    row.get("Constructor", {}).get("constructorId"),
+                    _optional_float(row.get("points")),
+                )
+            )
+        date_utc = f"{race['date']}T{race.get('time', '00:00:00Z')}" if race.get("date") else None
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO rounds (season, round, kind, race_name, circuit_id, date_utc, payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (season, round_number, kind, race.get("raceName"), race.get("Circuit", {}).get("circuitId"), date_utc, json.dumps(race)),
+            )
+            self._connection.execute("DELETE FROM results WHERE season = ? AND round = ? AND kind = ?", (season, round_number, kind))
+            self._connection.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)", result_rows)
+
+    def put_standings(self, kind: str, season: int, round_number: int, rows: list[dict[str, Any]]) -> None:
+        competitor_key, id_key = ("Driver", "driverId") if kind == DRIVER else ("Constructor", "constructorId")
+        values = [
+            (
+                season,
+                round_number,
+                kind,
+                _optional_int(row.get("position")),
+                row.get(competitor_key, {}).get(id_key) or str(index),
+                _optional_float(row.get("points")),
+                json.dumps(row),
+            )
+            for index, row in enumerate(rows)
+        ]
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.execute("DELETE FROM standings WHERE season = ? AND round = ? AND kind = ?", (season, round_number, kind))
+            self._connection.executemany("INSERT INTO standings VALUES (?, ?, ?, ?, ?, ?, ?)", values)
+
+    def put_meeting(self, row: dict[str, Any], sessions: list[dict[str, Any]]) -> None:
+        meeting_key = int(row["meeting_key"])
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meetings (meeting_key, year, date_start, payload) VALUES (?, ?, ?, ?)",
+                (meeting_key, int(row.get("year") or str(row.get("date_start", "0"))[:4]), row.get("date_start"), json.dumps(row)),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO sessions (session_key, meeting_key, date_start, payload) VALUES (?, ?, ?, ?)",
+                [
+                    (int(session["session_key"]), meeting_key, session.get("date_start"), json.dumps(session))
+                    for session in sessions
+                    if session.get("session_key") is not None
+                ],
+            )
+
+    def merge_round(self, kind: str, race: dict[str, Any]) -> None:
+        """Store `race`, keeping rows of an already stored copy that `race` (a partial page) lacks."""
+        rows_key = "Results" if kind == RACE else "QualifyingResults"
+        stored = self.race(race_season(race), int(race["round"]), kind)
+        if stored is not None:
+            rows = {_row_key(row): row for row in stored.get(rows_key, [])}
+            rows.update((_row_key(row), row) for row in race.get(rows_key, []))
+            race = {**race, rows_key: sorted(rows.values(), key=lambda row: _optional_int(row.get("position")) or 999)}
+        self.put_round(kind, race)
+
+    def feed_state(self, season: int, kind: str) -> FeedState:
+        rows = self._query("SELECT next_offset, total, newest_round, newest_round_offset FROM feeds WHERE season = ? AND kind = ?", (season, kind))
+        return FeedState(*rows[0]) if rows else FeedState()
+
+    def put_feed_state(self, season: int, kind: str, state: FeedState) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?, ?, ?)",
+                (season, kind, state.next_offset, state.total, state.newest_round, state.newest_round_offset),
+            )
+
+    def round_numbers(self, season: int, kind: str) -> set[int]:
+        return {row[0] for row in self._query("SELECT round FROM rounds WHERE season = ? AND kind = ?", (season, kind))}
+
+    def standings_rounds(self, season: int, kind: str) -> set[int]:
+        return {row[0] for row in self._query("SELECT DISTINCT round FROM standings WHERE season = ? AND kind = ?", (season, kind))}
+
+    def meeting_keys(self, year: int) -> set[int]:
+        return {row[0] for row in self._query("SELECT meeting_key FROM meetings WHERE year = ?", (year,))}
+
+    def race(self, season: int, round_number: int, kind: str) -> dict[str, Any] | None:
+        rows = self._query("SELECT payload FROM rounds WHERE season = ? AND round = ? AND kind = ?", (season, round_number, kind))
+        return json.loads(rows[0][0]) if rows else None
+
+    def latest_round(self, season: int, kind: str) -> int | None:
+        rows = self._query("SELECT MAX(round) FROM rounds WHERE season = ? AND kind = ?", (season, kind))
+        return rows[0][0] if rows else None
+
+    def standings(self, season: int, round_number: int, kind: str) -> list[dict[str, Any]]:
+        rows = self._query(
+            "SELECT payload FROM standings WHERE season = ? AND round = ? AND kind = ? ORDER BY position IS NULL, position",
+            (season, round_number, kind),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def season_rounds(self, season: int) -> list[dict[str, Any]]:
+        """Archived races of a season with their winner, in round order."""
+        rows = self._query(
+            """
+            SELECT rounds.round, rounds.race_name, rounds.circuit_id, rounds.date_utc, results.driver_id, results.constructor_id
+            FROM rounds
+            LEFT JOIN results
+              ON results.season = rounds.season AND results.round = rounds.round AND results.kind = rounds.kind AND results.position = 1
+            WHERE rounds.season = ? AND rounds.kind = ?
+            ORDER BY rounds.round
+            """,
+            (season, RACE),
+        )
+        return [
+            {
+                "round": row[0],
+                "race_name": row[1],
+                "circuit_id": row[2],
+                "date_utc": row[3],
+                "winner_driver_id": row[4],
+                "winner_constructor_id": row[5],
+            }
+            for row in rows
+        ]
+
+    def driver_results(self, driver_id: str, season: int | None = None) -> list[dict[str, Any]]:
+        query = "SELECT season, round, kind, position, constructor_id, points FROM results WHERE driver_id = ?"
+        params: tuple[Any, ...] = (driver_id,)
+        if season is not None:
+            query += " AND season = ?"
+            params += (season,)
+        rows = self._query(query + " ORDER BY season, round, kind", params)
+        return [
+            {"season": row[0], "round": row[1], "kind": row[2], "position": row[3], "constructor_id": row[4], "points": row[5]}
+            for row in rows
+        ]
+
+    def meetings(self, year: int) -> list[dict[str, Any]]:
+        rows = self._query("SELECT payload FROM meetings WHERE year = ? ORDER BY date_start", (year,))
+        return [json.loads(row[0]) for row in rows]
+
+    def sessions(self, meeting_key: int) -> list[dict[str, Any]]:
+        rows = self._query("SELECT payload FROM sessions WHERE meeting_key = ? ORDER BY date_start", (meeting_key,))
+        return [json.loads(row[0]) for row in rows]
+
+    def _query(self, sql: str, params: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+
+def race_season(race: dict[str, Any]) -> int:
+    return int(race.get("season") or str(race["date"])[:4])
+
+
+def _row_key(row: dict[str, Any]) -> str:
+    return str(row.get("Driver", {}).get("driverId") or row.get("position"))
+
+
+def _optional_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _optional_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
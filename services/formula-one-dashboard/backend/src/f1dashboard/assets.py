@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+
+from f1dashboard.compression import IDENTITY, compressed_variants, negotiate_encoding
+
+VENUE_ASSET_PATH = "/api/venue/assets"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+MEDIA_TYPES = {
+    "svg": "image/svg+xml",
+}
+
+_FILE_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+_ASSET_NAME = re.compile(r"^(?P<digest>[0-9a-f]{32})\.(?P<extension>[a-z0-9]+)$")
+
+
+@dataclass(slots=True)
+class Asset:
+    name: str
+    media_type: str
+    variants: dict[str, bytes]
+
+    @property
+    def etag(self) -> str:
+        # Weak, because the same tag covers every content coding of the asset.
+        return f'W/"{self.name.partition(".")[0]}"'
+
+    @property
+    def url(self) -> str:
+        return f"{VENUE_ASSET_PATH}/{self.name}"
+
+
+@dataclass(slots=True)
+class AssetResponse:
+    status_code: int
+    body: bytes
+    headers: dict[str, str]
+
+
+@dataclass(slots=True)
+class AssetStore:
+    """Content-addressed store for venue assets such as track maps.
+
+    Names are derived from the content hash, so a URL never changes meaning
+    and clients may cache it forever. Assets are optionally written to
+    `directory` with their precompressed variants, which keeps URLs from a
+    persisted snapshot valid across restarts.
+    """
+
+    directory: Path | None = None
+    _assets: dict[str, Asset] = field(default_factory=dict, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def put(self, content: bytes, extension: str) -> Asset:
+        name = f"{hashlib.sha256(content).hexdigest()[:32]}.{extension}"
+        existing = self.get(name)
+        if existing is not None:
+            return existing
+
+        asset = Asset(name=name, media_type=MEDIA_TYPES.get(extension, "application/octet-stream"), variants=compressed_variants(content))
+        with self._lock:
+            self._assets[name] = asset
+        self._write(asset)
+        return asset
+
+    def get(self, name: str) -> Asset | None:
+        asset = self._assets.get(name)
+        if asset is not None:
+            return asset
+        match = _ASSET_NAME.match(name)
+        if match is None:
+            return None
+        asset = self._read(name, match.group("extension"))
+        if asset is not None:
+            with self._lock:
+                self._assets[name] = asset
+        return asset
+
+    def _write(self, asset: Asset) -> None:
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for encoding, body in asset.variants.items():
+                target = self.directory / f"{asset.name}{_FILE_SUFFIXES.get(encoding, '')}"
+                if not target.exists():
+                    target.write_bytes(body)
+        except OSError:
+            return
+
+    def _read(self, name: str, extension: str) -> Asset | None:
+        if self.directory is None:
+            return None
+        try:
+            identity = (self.directory / name).read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(identity).hexdigest()[:32] != name.partition(".")[0]:
+            return None
+        variants = {IDENTITY: identity}
+        for encoding, suffix in _FILE_SUFFIXES.items():
+            try:
+                variants[encoding] = (self.directory / f"{name}{suffix}").read_bytes()
+            except OSError:
+                continue
+        return Asset(name=name, media_type=MEDIA_TYPES.get(extension, "application/octet-stream"), variants=variants)
+
+
+def asset_response(asset: Asset | None, accept_encoding: str | None, if_none_match: str | None = None) -> AssetResponse:
+    if asset is None:
+        return AssetResponse(status_code=404, body=b"", headers={"Cache-Control": "no-store"})
+
+    headers = {
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "ETag": asset.etag,
+        "Vary": "Accept-Encoding",
+    }
+    if if_none_match and asset.etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return AssetResponse(status_code=304, body=b"", headers=headers)
+
+    encoding = negotiate_encoding(accept_encoding, asset.variants)
+    headers["Content-Type"] = asset.media_type
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+    return AssetResponse(status_code=200, body=asset.variants[encoding], headers=headers)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import sqlite3
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Generic, TypeVar
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -22,7 +26,7 @@ class MemoryTTLCache(Generic[T]):
         if entry is None:
             return None
         if entry.expires_at <= datetime.now(timezone.utc):
-            self._entries.pop(key, None)
+            # Kept for `get_stale` until overwritten.
             return None
         return entry.value
 
@@ -40,3 +44,75 @@ class MemoryTTLCache(Generic[T]):
 
     def clear(self) -> None:
         self._entries.clear()
+
+
+class SQLiteTTLCache(Generic[T]):
+    """TTL cache shared by every process that opens the same database file.
+
+    Meant for several uvicorn/gunicorn workers or replicas on one cache
+    volume: a value set by one worker is read by all of them. Values are
+    stored as text via `encode`/`decode`; an entry that no longer decodes is
+    treated as missing. Expired entries are kept for `get_stale` until
+    overwritten. Each process keeps the last decoded value per key and only
+    reads and decodes the text again once the row has been replaced.
+    """
+
+    def __init__(self, path: str | Path, encode: Callable[[T], str], decode: Callable[[str], T | None]) -> None:
+        self.path = Path(path).expanduser()
+        self.encode = encode
+        self.decode = decode
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        # key -> ((rowid, expires_at), decoded value); a replaced row gets a
+        # new expires_at, so the pair identifies one stored value.
+        self._decoded: dict[str, tuple[tuple[int, float], T | None]] = {}
+        self._connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> T | None:
+        entry = self._entry(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def get_stale(self, key: str) -> T | None:
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: T, ttl_seconds: int) -> None:
+        encoded = self.encode(value)
+        expires_at = time.time() + ttl_seconds
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, encoded, expires_at),
+            )
+            self._decoded[key] = ((cursor.lastrowid, expires_at), value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache_entries")
+            self._decoded.clear()
+
+    def _entry(self, key: str) -> tuple[T | None, float] | None:
+        """The decoded value and its expiry; the stored text is only read when the row changed."""
+        with self._lock:
+            version = self._connection.execute("SELECT rowid, expires_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+            if version is None:
+                return None
+            decoded = self._decoded.get(key)
+            if decoded is not None and decoded[0] == version:
+                return decoded[1], version[1]
+            row = self._connection.execute("SELECT value, rowid, expires_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value = self.decode(row[0])
+        with self._lock:
+            self._decoded[key] = ((row[1], row[2]), value)
+        return value, row[2]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+# Substring lookups go through an index of this many characters; shorter
+# candidates are checked against every circuit.
+NGRAM = 3
+
+
+class CircuitMatcher:
+    """Find the Jolpica circuit a meeting takes place at.
+
+    Built once per circuit list. A circuit matches when a candidate equals
+    its normalized name, locality, country or id; failing that, when a
+    candidate is contained in its name, locality and country run together.
+    Either way the first matching circuit in list order wins. Exact keys are
+    a dict lookup and substrings are narrowed with a trigram index, so a
+    lookup costs O(candidates) rather than O(candidates x circuits).
+    """
+
+    def __init__(self, circuits: Iterable[dict[str, Any]]) -> None:
+        self.circuits = [circuit for circuit in circuits if isinstance(circuit, dict)]
+        self._exact: dict[str, int] = {}
+        self._haystacks: list[str] = []
+        self._ngrams: dict[str, set[int]] = {}
+        for index, circuit in enumerate(self.circuits):
+            location = circuit.get("Location") or {}
+            for value in (circuit.get("circuitName"), location.get("locality"), location.get("country"), circuit.get("circuitId")):
+                key = normalize(value)
+                if key:
+                    self._exact.setdefault(key, index)
+            haystack = normalize(" ".join(str(part) for part in (circuit.get("circuitName"), location.get("locality"), location.get("country")) if part))
+            self._haystacks.append(haystack)
+            for start in range(len(haystack) - NGRAM + 1):
+                self._ngrams.setdefault(haystack[start : start + NGRAM], set()).add(index)
+
+    def match(self, candidates: Iterable[Any]) -> dict[str, Any] | None:
+        keys = [key for candidate in candidates if (key := normalize(candidate))]
+        exact = [self._exact[key] for key in keys if key in self._exact]
+        if exact:
+            return self.circuits[min(exact)]
+        contained = [index for key in keys if (index := self._first_containing(key)) is not None]
+        return self.circuits[min(contained)] if contained else None
+
+    def _first_containing(self, key: str) -> int | None:
+        if len(key) < NGRAM:
+            indexes: Iterable[int] = range(len(self._haystacks))
+        else:
+            postings = [self._ngrams.get(key[start : start + NGRAM]) for start in range(len(key) - NGRAM + 1)]
+            if not all(postings):
+                return None
+            indexes = sorted(set.intersection(*postings))
+        return next((index for index in indexes if key in self._haystacks[index]), None)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return re.sub(r"[^a-z0-9]+", "", text.lower())
+
+
+def normalize(value: Any) -> str:
+    """Lowercase ASCII letters and digits only, e.g. "São Paulo" -> "saopaulo"."""
+    return _normalize_text(str(value or ""))
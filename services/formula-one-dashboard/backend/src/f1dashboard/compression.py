@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+from functools import cache
+
+IDENTITY = "identity"
+
+# Server preference when the client accepts several encodings equally.
+ENCODING_PREFERENCE = ("br", "gzip", IDENTITY)
+
+
+def compressed_variants(body: bytes, minimum_size: int = 256) -> dict[str, bytes]:
+    """Encode `body` once per supported content coding.
+
+    Variants that are not smaller than the identity body are dropped, so
+    negotiation never picks a coding that only costs client CPU.
+    """
+    variants = {IDENTITY: body}
+    if len(body) < minimum_size:
+        return variants
+    candidates = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    brotli = _brotli()
+    if brotli is not None:
+        candidates["br"] = brotli.compress(body, quality=11)
+    for encoding, encoded in candidates.items():
+        if len(encoded) < len(body):
+            variants[encoding] = encoded
+    return variants
+
+
+@dataclass(slots=True)
+class EncodedBody:
+    """A response body compressed once, ahead of the requests that serve it."""
+
+    variants: dict[str, bytes]
+    etag: str
+
+    @classmethod
+    def encode(cls, body: bytes) -> EncodedBody:
+        # Weak, because the same tag covers every content coding of the body.
+        return cls(variants=compressed_variants(body), etag=f'W/"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+    def negotiate(self, accept_encoding: str | None) -> tuple[str, bytes]:
+        encoding = negotiate_encoding(accept_encoding, self.variants)
+        return encoding, self.variants[encoding]
+
+
+def negotiate_encoding(accept_encoding: str | None, available: set[str] | dict[str, bytes]) -> str:
+    """Pick the best available coding for an `Accept-Encoding` header value."""
+    if not accept_encoding:
+        return IDENTITY
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+
+    def weight(coding: str) -> float:
+        if coding in weights:
+            return weights[coding]
+        if "*" in weights:
+            return weights["*"]
+        # identity stays acceptable unless explicitly refused, but only as
+        # the last resort when the client did not name it.
+        return 0.001 if coding == IDENTITY else 0.0
+
+    best = IDENTITY
+    best_weight = 0.0
+    for coding in ENCODING_PREFERENCE:
+        if coding not in available:
+            continue
+        coding_weight = weight(coding)
+        if coding_weight > best_weight:
+            best, best_weight = coding, coding_weight
+    return best
+
+
+@cache
+def _brotli():
+    # Imported on first compression rather than at startup.
+    try:
+        import brotli
+    except ModuleNotFoundError:  # pragma: no cover - brotli is optional
+        return None
+    return brotli
@@ -19,4 +19,6 @@ API_ENDPOINTS = {
     "results_latest": "/api/results/latest",
     "standings_drivers": "/api/standings/drivers",
     "standings_constructors": "/api/standings/constructors",
+    "venue_asset": "/api/venue/assets/{name}",
+    "history_season": "/api/history/{season}",
 }
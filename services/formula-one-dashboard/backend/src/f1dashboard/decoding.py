@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Generic, TypeVar
+
+from f1dashboard.models import ChampionshipStandingRow, ClassificationRow, LapSample, Meeting, RaceControlMessage, Session
+from f1dashboard.providers.openf1 import parse_utc_timestamp
+
+T = TypeVar("T")
+
+# Only these lap fields are kept in `LapSample.payload`.
+LAP_PAYLOAD_FIELDS = ("lap_duration", "duration_sector_1", "duration_sector_2", "duration_sector_3", "is_pit_out_lap")
+
+
+class DecodeError(ValueError):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class Field:
+    """Where a model attribute comes from in a provider row.
+
+    `key` is a row key, a path of keys into nested objects, or None for the
+    whole row (for values derived from several keys). A missing `required`
+    value rejects the row; other missing values become `default`.
+    """
+
+    key: str | tuple[str, ...] | None
+    convert: Callable[[Any], Any] | None = None
+    required: bool = False
+    default: Any = None
+
+
+class RowDecoder(Generic[T]):
+    """Decode provider rows of one endpoint into a slotted model in a single pass.
+
+    Field accessors are compiled once (`itemgetter` for plain keys), so
+    decoding a row is one lookup and one conversion per attribute. Rows that
+    fail validation are skipped and counted per endpoint in `errors`.
+    """
+
+    def __init__(self, endpoint: str, model: Callable[..., T], **fields: Field) -> None:
+        self.endpoint = endpoint
+        self.model = model
+        self.fields = fields
+        self._accessors = tuple((name, _accessor(spec.key), spec.convert, spec.required, spec.default) for name, spec in fields.items())
+
+    def decode(self, row: Mapping[str, Any], **defaults: Any) -> T:
+        """Decode one row; `defaults` fill attributes that are missing or not in the row at all."""
+        values = dict(defaults)
+        for name, access, convert, required, default in self._accessors:
+            try:
+                value = access(row)
+            except (KeyError, TypeError, AttributeError):
+                value = None
+            if value is not None and convert is not None:
+                try:
+                    value = convert(value)
+                except (TypeError, ValueError) as exc:
+                    if required:
+                        raise DecodeError(f"{self.endpoint}.{name}: {exc}") from exc
+                    value = None
+            if value is None:
+                if name in defaults:
+                    continue
+                if required:
+                    raise DecodeError(f"{self.endpoint}.{name} is missing")
+                value = default
+            values[name] = value
+        try:
+            return self.model(**values)
+        except TypeError as exc:
+            raise DecodeError(f"{self.endpoint}: {exc}") from exc
+
+    def replace(self, **fields: Field) -> RowDecoder[T]:
+        """A copy of this decoder with some fields taken from elsewhere."""
+        return RowDecoder(self.endpoint, self.model, **{**self.fields, **fields})
+
+    def decode_all(self, rows: Iterable[Mapping[str, Any]], errors: Counter[str] | None = None, **defaults: Any) -> list[T]:
+        decoded: list[T] = []
+        for row in rows:
+            try:
+                decoded.append(self.decode(row, **defaults))
+            except DecodeError as exc:
+                if errors is not None:
+                    errors[self.endpoint] += 1
+                print(f"INFO: skipped {exc}")
+        return decoded
+
+
+def optional_int(value: Any) -> int | None:
+    if value == "":
+        return None
+    return int(value)
+
+
+def optional_float(value: Any) -> float | None:
+    if value == "":
+        return None
+    return float(value)
+
+
+def float_or_zero(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def jolpica_driver_name(driver: Mapping[str, Any], driver_number: int | None = None) -> str:
+    given_name = str(driver.get("givenName", "")).strip()
+    family_name = str(driver.get("familyName", "")).strip()
+    name = " ".join(part for part in [given_name, family_name] if part)
+    if name:
+        return name
+    driver_id = str(driver.get("driverId", "")).strip()
+    if driver_id:
+        return driver_id
+    return f"Driver {driver_number}" if driver_number is not None else "Unknown driver"
+
+
+def _accessor(key: str | tuple[str, ...] | None) -> Callable[[Mapping[str, Any]], Any]:
+    if key is None:
+        return lambda row: row
+    if isinstance(key, str):
+        return itemgetter(key)
+    first, *rest = key
+    head = itemgetter(first)
+
+    def nested(row: Mapping[str, Any]) -> Any:
+        value = head(row)
+        for part in rest:
+            value = value[part]
+        return value
+
+    return nested
+
+
+def _jolpica_number(row: Mapping[str, Any]) -> int | None:
+    try:
+        return optional_int(row.get("number") or row.get("Driver", {}).get("permanentNumber"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _jolpica_result_driver_name(row: Mapping[str, Any]) -> str:
+    return jolpica_driver_name(row.get("Driver", {}), _jolpica_number(row))
+
+
+def _qualifying_status(row: Mapping[str, Any]) -> str:
+    best_time = row.get("Q3") or row.get("Q2") or row.get("Q1")
+    return f"Qualifying result · {best_time}" if best_time else "Qualifying result"
+
+
+def _standing_driver_name(driver: Mapping[str, Any]) -> str:
+    given_name = str(driver.get("givenName", "")).strip()
+    family_name = str(driver.get("familyName", "")).strip()
+    return " ".join(part for part in [given_name, family_name] if part) or str(driver.get("driverId", "Unknown driver"))
+
+
+def _constructor_name(constructor: Mapping[str, Any]) -> str:
+    return str(constructor.get("name") or constructor.get("constructorId") or "Unknown constructor")
+
+
+def _lap_payload(row: Mapping[str, Any]) -> dict[str, Any]:
+    return {key: row[key] for key in LAP_PAYLOAD_FIELDS if key in row}
+
+
+MEETINGS = RowDecoder(
+    "openf1.meetings",
+    Meeting,
+    meeting_key=Field("meeting_key", int, required=True),
+    meeting_name=Field("meeting_name", str, default=""),
+    meeting_official_name=Field("meeting_official_name"),
+    location=Field("location"),
+    country_code=Field("country_code"),
+    country_name=Field("country_name"),
+)
+
+SESSIONS = RowDecoder(
+    "openf1.sessions",
+    Session,
+    session_key=Field("session_key", int, required=True),
+    meeting_key=Field("meeting_key", int, required=True),
+    session_name=Field(None, lambda row: str(row.get("session_name", row.get("session_type", "Session")))),
+    session_type=Field("session_type", str, default="unknown"),
+    date_start_utc=Field("date_start", parse_utc_timestamp, required=True),
+    date_end_utc=Field("date_end", parse_utc_timestamp),
+)
+
+LAPS = RowDecoder(
+    "openf1.laps",
+    LapSample,
+    driver_number=Field("driver_number", int, required=True),
+    lap_number=Field("lap_number", int, required=True),
+    date_start_utc=Field("date_start", parse_utc_timestamp),
+    payload=Field(None, _lap_payload),
+)
+
+RACE_CONTROL = RowDecoder(
+    "openf1.race_control",
+    RaceControlMessage,
+    date_utc=Field("date", parse_utc_timestamp, required=True),
+    category=Field("category"),
+    message=Field("message", str, default=""),
+)
+
+JOLPICA_RACE_RESULTS = RowDecoder(
+    "jolpica.results",
+    ClassificationRow,
+    position=Field("position", optional_int),
+    driver_number=Field(None, _jolpica_number),
+    driver_name=Field(None, _jolpica_result_driver_name),
+    team_name=Field(("Constructor", "name")),
+    points=Field("points", optional_float),
+)
+
+JOLPICA_QUALIFYING_RESULTS = RowDecoder(
+    "jolpica.qualifying",
+    ClassificationRow,
+    position=Field("position", optional_int),
+    driver_number=Field(None, _jolpica_number),
+    driver_name=Field(None, _jolpica_result_driver_name),
+    team_name=Field(("Constructor", "name")),
+    status=Field(None, _qualifying_status),
+)
+
+DRIVER_STANDINGS = RowDecoder(
+    "jolpica.driver_standings",
+    ChampionshipStandingRow,
+    position=Field("position", optional_int),
+    competitor_name=Field(None, lambda row: _standing_driver_name(row.get("Driver", {}))),
+    points=Field(None, lambda row: float_or_zero(row.get("points"))),
+    wins=Field("wins", optional_int),
+    competitor_id=Field(("Driver", "driverId")),
+)
+
+CONSTRUCTOR_STANDINGS = RowDecoder(
+    "jolpica.constructor_standings",
+    ChampionshipStandingRow,
+    position=Field("position", optional_int),
+    competitor_name=Field(None, lambda row: _constructor_name(row.get("Constructor", {}))),
+    points=Field(None, lambda row: float_or_zero(row.get("points"))),
+    wins=Field("wins", optional_int),
+    competitor_id=Field(("Constructor", "constructorId")),
+)
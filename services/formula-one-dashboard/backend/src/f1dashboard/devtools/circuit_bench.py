@@ -0,0 +1,92 @@
+"""Benchmark circuit lookups: the indexed matcher against a linear scan.
+
+Queries are meeting-like candidate tuples built from every circuit of the
+list (locality, country, circuit name and "<country> Grand Prix"), plus a few
+that match nothing. Both lookups must agree on every query::
+
+    python -m f1dashboard.devtools.circuit_bench --circuits tests/fixtures/jolpica/current-circuits.json
+
+Without ``--circuits`` the current list is fetched from Jolpica.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from f1dashboard.circuits import CircuitMatcher, normalize
+from f1dashboard.providers.jolpica import JolpicaClient
+
+
+def linear_match(circuits: list[dict[str, Any]], candidates: tuple[Any, ...]) -> dict[str, Any] | None:
+    """The lookup the matcher replaced: normalize and compare every circuit on every call."""
+    normalized_candidates = [normalized for candidate in candidates if (normalized := normalize(candidate))]
+    for circuit in circuits:
+        location = circuit.get("Location", {})
+        values = [circuit.get("circuitName"), location.get("locality"), location.get("country"), circuit.get("circuitId")]
+        normalized_circuit = [normalized for value in values if (normalized := normalize(value))]
+        if any(candidate == value for candidate in normalized_candidates for value in normalized_circuit):
+            return circuit
+    for circuit in circuits:
+        location = circuit.get("Location", {})
+        haystack = normalize(" ".join(str(part) for part in (circuit.get("circuitName"), location.get("locality"), location.get("country")) if part))
+        if any(candidate in haystack for candidate in normalized_candidates):
+            return circuit
+    return None
+
+
+def queries(circuits: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    built = []
+    for circuit in circuits:
+        location = circuit.get("Location", {})
+        locality, country = location.get("locality"), location.get("country")
+        built.append((None, locality, country, f"{country} Grand Prix"))
+        built.append((circuit.get("circuitName"), None, None, None))
+        built.append((str(circuit.get("circuitName", "")).split()[-1], None, None, None))
+    built.append(("Nowhere", "Atlantis", "Oceania", "Atlantis Grand Prix"))
+    return built
+
+
+def time_lookups(lookup, queries: list[tuple[Any, ...]], rounds: int) -> float:
+    """Mean microseconds per lookup."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for candidates in queries:
+            lookup(candidates)
+    return (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+
+
+def load_circuits(path: str | None) -> list[dict[str, Any]]:
+    if path is None:
+        return JolpicaClient().current_circuits()
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return payload["MRData"]["CircuitTable"]["Circuits"] if isinstance(payload, dict) else payload
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark circuit lookups.")
+    parser.add_argument("--circuits", default=None, help="Jolpica circuits.json response; fetched when omitted")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    circuits = load_circuits(args.circuits)
+    built = queries(circuits)
+    start = time.perf_counter()
+    matcher = CircuitMatcher(circuits)
+    build_us = (time.perf_counter() - start) * 1e6
+
+    mismatches = [candidates for candidates in built if matcher.match(candidates) is not linear_match(circuits, candidates)]
+    if mismatches:
+        raise SystemExit(f"matcher disagrees with the linear scan on {mismatches}")
+
+    linear_us = time_lookups(lambda candidates: linear_match(circuits, candidates), built, args.rounds)
+    indexed_us = time_lookups(matcher.match, built, args.rounds)
+    print(f"circuits={len(circuits)} queries={len(built)} index_build={build_us:.0f}us")
+    print(f"linear={linear_us:.2f}us/lookup indexed={indexed_us:.2f}us/lookup speedup={linear_us / indexed_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
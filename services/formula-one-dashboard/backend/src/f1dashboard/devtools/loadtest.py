@@ -0,0 +1,136 @@
+"""Concurrent load driver for the dashboard API.
+
+Hits ``/api/dashboard`` with N concurrent clients and, when pointed at the
+replay server's stats endpoint, reports how many provider requests the backend
+made per dashboard request (request amplification).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.request import urlopen
+
+
+@dataclass(slots=True)
+class LoadReport:
+    requests: int
+    errors: int
+    elapsed_seconds: float
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    provider_requests: int | None = None
+
+    @property
+    def throughput_rps(self) -> float:
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def amplification(self) -> float | None:
+        successful = self.requests - self.errors
+        if self.provider_requests is None or successful <= 0:
+            return None
+        return self.provider_requests / successful
+
+    def format(self) -> str:
+        lines = [
+            f"requests:    {self.requests} ({self.errors} errors) in {self.elapsed_seconds:.2f}s, {self.throughput_rps:.1f} req/s",
+            f"latency:     p50 {_format_ms(self.p50_ms)}  p95 {_format_ms(self.p95_ms)}  p99 {_format_ms(self.p99_ms)}",
+        ]
+        if self.provider_requests is not None:
+            amplification = self.amplification
+            suffix = f", amplification {amplification:.3f}" if amplification is not None else ""
+            lines.append(f"providers:   {self.provider_requests} upstream requests{suffix}")
+        return "\n".join(lines)
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; `pct` is in the 0-100 range."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_load(
+    url: str,
+    clients: int,
+    requests_per_client: int,
+    stats_url: str | None = None,
+    timeout_seconds: float = 30.0,
+) -> LoadReport:
+    provider_before = _provider_total(stats_url) if stats_url else None
+
+    def worker() -> list[tuple[float, bool]]:
+        results: list[tuple[float, bool]] = []
+        for _ in range(requests_per_client):
+            started = time.perf_counter()
+            ok = True
+            try:
+                with urlopen(url, timeout=timeout_seconds) as response:
+                    response.read()
+            except (HTTPError, URLError, TimeoutError, OSError):
+                ok = False
+            results.append(((time.perf_counter() - started) * 1000.0, ok))
+        return results
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        futures = [executor.submit(worker) for _ in range(clients)]
+        samples = [sample for future in futures for sample in future.result()]
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for latency, ok in samples if ok]
+    provider_after = _provider_total(stats_url) if stats_url else None
+    provider_requests = (
+        provider_after - provider_before
+        if provider_before is not None and provider_after is not None
+        else None
+    )
+    return LoadReport(
+        requests=len(samples),
+        errors=sum(1 for _, ok in samples if not ok),
+        elapsed_seconds=elapsed,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        p99_ms=percentile(latencies, 99),
+        provider_requests=provider_requests,
+    )
+
+
+def _provider_total(stats_url: str) -> int | None:
+    try:
+        with urlopen(stats_url, timeout=5) as response:
+            payload: Any = json.loads(response.read().decode("utf-8"))
+    except (HTTPError, URLError, TimeoutError, OSError, json.JSONDecodeError):
+        return None
+    return int(payload.get("total", 0)) if isinstance(payload, dict) else None
+
+
+def _format_ms(value: float | None) -> str:
+    return f"{value:.1f}ms" if value is not None else "n/a"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Load test the dashboard API.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/api/dashboard")
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=20, help="Requests per client")
+    parser.add_argument("--stats-url", default=None, help="Replay server stats URL, e.g. http://127.0.0.1:8100/__stats")
+    parser.add_argument("--timeout-seconds", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    report = run_load(args.url, args.clients, args.requests, stats_url=args.stats_url, timeout_seconds=args.timeout_seconds)
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Local record/replay stand-in for the dashboard's upstream providers.
+
+Every upstream is mounted under its own path prefix, so pointing the backend at
+the server only needs base URL overrides::
+
+    OPENF1_BASE_URL=http://127.0.0.1:8100/openf1
+    JOLPICA_BASE_URL=http://127.0.0.1:8100/jolpica/ergast/f1/
+    OPEN_METEO_BASE_URL=http://127.0.0.1:8100/open-meteo
+    WIKIPEDIA_BASE_URL=http://127.0.0.1:8100/wikipedia
+    MULTIVIEWER_BASE_URL=http://127.0.0.1:8100/multiviewer
+
+Run once with ``--mode record`` on a host with network access, then copy the
+recording directory to the load-test host and run with ``--mode replay``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from urllib.request import Request, urlopen
+
+UPSTREAMS = {
+    "openf1": "https://api.openf1.org",
+    "jolpica": "https://api.jolpi.ca",
+    "open-meteo": "https://api.open-meteo.com",
+    "wikipedia": "https://en.wikipedia.org",
+    "multiviewer": "https://api.multiviewer.app",
+}
+
+STATS_PATH = "/__stats"
+RESET_PATH = "/__reset"
+
+
+@dataclass(slots=True)
+class FaultProfile:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit_ratio: float = 0.0
+    server_error_ratio: float = 0.0
+    timeout_ratio: float = 0.0
+    timeout_seconds: float = 30.0
+    seed: int | None = None
+    _random: random.Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    def draw(self) -> tuple[float, str | None]:
+        """Return the injected delay in seconds and the fault to inject, if any."""
+        with self._lock:
+            delay = max(self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms), 0.0) / 1000.0
+            roll = self._random.random()
+        if roll < self.timeout_ratio:
+            return self.timeout_seconds, "timeout"
+        roll -= self.timeout_ratio
+        if roll < self.rate_limit_ratio:
+            return delay, "rate_limit"
+        roll -= self.rate_limit_ratio
+        if roll < self.server_error_ratio:
+            return delay, "server_error"
+        return delay, None
+
+
+@dataclass(slots=True)
+class RecordedResponse:
+    url: str
+    status: int
+    content_type: str
+    body: bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        try:
+            encoded: dict[str, Any] = {"body": self.body.decode("utf-8")}
+        except UnicodeDecodeError:
+            encoded = {"body_b64": base64.b64encode(self.body).decode("ascii")}
+        return {"url": self.url, "status": self.status, "content_type": self.content_type, **encoded}
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> RecordedResponse:
+        if "body_b64" in payload:
+            body = base64.b64decode(payload["body_b64"])
+        else:
+            body = str(payload.get("body", "")).encode("utf-8")
+        return cls(
+            url=str(payload.get("url", "")),
+            status=int(payload.get("status", 200)),
+            content_type=str(payload.get("content_type") or "application/json"),
+            body=body,
+        )
+
+
+class RecordingStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path_for(self, upstream: str, path: str, query: str) -> Path:
+        canonical_query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+        digest = hashlib.sha256(f"{path}?{canonical_query}".encode("utf-8")).hexdigest()[:24]
+        return self.root / upstream / f"{digest}.json"
+
+    def load(self, upstream: str, path: str, query: str) -> RecordedResponse | None:
+        target = self.path_for(upstream, path, query)
+        try:
+            return RecordedResponse.from_dict(json.loads(target.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError, TypeError, ValueError):
+            return None
+
+    def save(self, upstream: str, path: str, query: str, response: RecordedResponse) -> None:
+        target = self.path_for(upstream, path, query)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(response.to_dict()), encoding="utf-8")
+
+
+class ReplayStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = {}
+
+    def record(self, upstream: str, outcome: str) -> None:
+        with self._lock:
+            for key in ("total", f"upstream:{upstream}", f"outcome:{outcome}"):
+                self._counts[key] = self._counts.get(key, 0) + 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        store: RecordingStore,
+        mode: str = "replay",
+        faults: FaultProfile | None = None,
+        upstreams: dict[str, str] | None = None,
+        upstream_timeout_seconds: int = 20,
+    ) -> None:
+        if mode not in {"record", "replay"}:
+            raise ValueError(f"Unknown replay mode: {mode}")
+        super().__init__(address, ReplayHandler)
+        self.store = store
+        self.mode = mode
+        self.faults = faults or FaultProfile()
+        self.upstreams = upstreams or dict(UPSTREAMS)
+        self.upstream_timeout_seconds = upstream_timeout_seconds
+        self.stats = ReplayStats()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def fetch(self, upstream: str, path: str, query: str) -> RecordedResponse | None:
+        recorded = self.store.load(upstream, path, query)
+        if recorded is not None or self.mode == "replay":
+            return recorded
+
+        url = f"{self.upstreams[upstream]}{path}{'?' + query if query else ''}"
+        request = Request(url, headers={"User-Agent": "Mozilla/5.0", "Accept": "application/json"})
+        try:
+            with urlopen(request, timeout=self.upstream_timeout_seconds) as response:
+                recorded = RecordedResponse(
+                    url=url,
+                    status=response.status,
+                    content_type=response.headers.get("Content-Type", "application/json"),
+                    body=response.read(),
+                )
+        except HTTPError as exc:
+            # Upstream errors are passed through but never persisted, so a
+            # rate-limited recording run can simply be repeated.
+            return RecordedResponse(url=url, status=exc.code, content_type="text/plain", body=str(exc.reason).encode("utf-8"))
+        except (URLError, TimeoutError, OSError) as exc:
+            return RecordedResponse(url=url, status=502, content_type="text/plain", body=str(exc).encode("utf-8"))
+        self.store.save(upstream, path, query, recorded)
+        return recorded
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        split = urlsplit(self.path)
+        if split.path == STATS_PATH:
+            self._send(200, "application/json", json.dumps(self.server.stats.snapshot()).encode("utf-8"))
+            return
+        if split.path == RESET_PATH:
+            self.server.stats.reset()
+            self._send(200, "application/json", b"{}")
+            return
+
+        upstream, _, rest = split.path.lstrip("/").partition("/")
+        if upstream not in self.server.upstreams:
+            self._send(404, "text/plain", f"Unknown upstream: {upstream}".encode("utf-8"))
+            return
+        path = f"/{rest}"
+
+        delay, fault = self.server.faults.draw()
+        if delay:
+            time.sleep(delay)
+        if fault is not None:
+            self.server.stats.record(upstream, fault)
+            if fault == "rate_limit":
+                self._send(429, "text/plain", b"Too Many Requests", extra_headers={"Retry-After": "1"})
+            elif fault == "server_error":
+                self._send(503, "text/plain", b"Service Unavailable")
+            else:
+                self.close_connection = True
+            return
+
+        recorded = self.server.fetch(upstream, path, split.query)
+        if recorded is None:
+            self.server.stats.record(upstream, "miss")
+            self._send(404, "text/plain", f"No recording for {self.path}".encode("utf-8"))
+            return
+        self.server.stats.record(upstream, "hit" if recorded.status < 400 else "upstream_error")
+        self._send(recorded.status, recorded.content_type, recorded.body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature
+        return
+
+    def _send(self, status: int, content_type: str, body: bytes, extra_headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Record and replay dashboard provider responses.")
+    parser.add_argument("--mode", choices=["record", "replay"], default="replay")
+    parser.add_argument("--dir", default="recordings", help="Recording directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--server-error-ratio", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--timeout-ratio", type=float, default=0.0, help="Share of requests that stall and drop")
+    parser.add_argument("--timeout-seconds", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    faults = FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        server_error_ratio=args.server_error_ratio,
+        timeout_ratio=args.timeout_ratio,
+        timeout_seconds=args.timeout_seconds,
+        seed=args.seed,
+    )
+    server = ReplayServer((args.host, args.port), RecordingStore(Path(args.dir)), mode=args.mode, faults=faults)
+    print(f"INFO: provider {args.mode} server listening on {server.base_url} (recordings: {args.dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+Point = tuple[float, float]
+
+
+@dataclass(slots=True, frozen=True)
+class ViewBox:
+    width: float = 180.0
+    height: float = 120.0
+    padding: float = 14.0
+
+
+def fit_to_viewbox(xs: Sequence[float], ys: Sequence[float], view: ViewBox) -> list[Point]:
+    """Scale and centre a raw outline into `view`, flipping the y axis for SVG."""
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    width = max(max_x - min_x, 1.0)
+    height = max(max_y - min_y, 1.0)
+    drawable_w = view.width - view.padding * 2
+    drawable_h = view.height - view.padding * 2
+    scale = min(drawable_w / width, drawable_h / height)
+    offset_x = view.padding + (drawable_w - width * scale) / 2 - min_x * scale
+    offset_y = view.padding + (drawable_h - height * scale) / 2 + max_y * scale
+    return [(x * scale + offset_x, offset_y - y * scale) for x, y in zip(xs, ys)]
+
+
+def simplify(points: Sequence[Point], tolerance: float) -> list[Point]:
+    """Douglas–Peucker simplification keeping every point further than `tolerance` from the chord."""
+    if len(points) < 3:
+        return list(points)
+
+    keep = bytearray(len(points))
+    keep[0] = keep[-1] = 1
+    tolerance_sq = tolerance * tolerance
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        max_distance_sq = -1.0
+        max_index = first
+        for index in range(first + 1, last):
+            px, py = points[index]
+            if length_sq == 0.0:
+                distance_sq = (px - ax) ** 2 + (py - ay) ** 2
+            else:
+                cross = dx * (py - ay) - dy * (px - ax)
+                distance_sq = cross * cross / length_sq
+            if distance_sq > max_distance_sq:
+                max_distance_sq = distance_sq
+                max_index = index
+        if max_distance_sq > tolerance_sq:
+            keep[max_index] = 1
+            stack.append((first, max_index))
+            stack.append((max_index, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def encode_path(points: Sequence[Point], precision: int = 1) -> str:
+    """Encode a polyline as one absolute move followed by relative line segments.
+
+    Coordinates are quantised before differencing so rounding never drifts
+    along the path.
+    """
+    if not points:
+        return ""
+    factor = 10**precision
+    quantised = [(round(x * factor), round(y * factor)) for x, y in points]
+    start_x, start_y = quantised[0]
+    path = f"M{_join_numbers([_format_fixed(start_x, precision), _format_fixed(start_y, precision)])}"
+    deltas: list[str] = []
+    previous_x, previous_y = start_x, start_y
+    for x, y in quantised[1:]:
+        dx, dy = x - previous_x, y - previous_y
+        previous_x, previous_y = x, y
+        if dx == 0 and dy == 0:
+            continue
+        deltas.append(_format_fixed(dx, precision))
+        deltas.append(_format_fixed(dy, precision))
+    if deltas:
+        path += "l" + _join_numbers(deltas)
+    return path
+
+
+def quantised_point(point: Point, precision: int = 1) -> tuple[str, str]:
+    factor = 10**precision
+    return _format_fixed(round(point[0] * factor), precision), _format_fixed(round(point[1] * factor), precision)
+
+
+def _format_fixed(value: int, precision: int) -> str:
+    """Format an integer number of 10^-precision units with no redundant zeros."""
+    if precision == 0:
+        return str(value)
+    sign = "-" if value < 0 else ""
+    whole, fraction = divmod(abs(value), 10**precision)
+    fraction_text = str(fraction).rjust(precision, "0").rstrip("0")
+    if not fraction_text:
+        return f"{sign}{whole}"
+    return f"{sign}{whole if whole else ''}.{fraction_text}"
+
+
+def _join_numbers(values: list[str]) -> str:
+    parts = [values[0]]
+    for previous, value in zip(values, values[1:]):
+        # A minus sign already separates numbers, and so does a leading dot
+        # after a number that has one (".5.5" parses as 0.5 0.5).
+        if not (value.startswith("-") or (value.startswith(".") and "." in previous)):
+            parts.append(" ")
+        parts.append(value)
+    return "".join(parts)
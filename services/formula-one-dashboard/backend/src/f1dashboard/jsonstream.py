@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import codecs
+from collections.abc import Callable, Collection, Iterable, Iterator
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, BinaryIO
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONStreamError(ValueError):
+    pass
+
+
+def iter_chunks(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    fields: Collection[str] | None = None,
+    where: Callable[[dict[str, Any]], bool] | None = None,
+) -> Iterator[Any]:
+    """Decode a top-level JSON array element by element.
+
+    Only the undecoded tail of the stream is buffered, so memory stays bound
+    by the largest single row rather than the response size. With `fields`,
+    top-level object rows keep the selected keys only (nested objects are
+    left whole); `where` drops rows after projection. Anything but an array,
+    such as an error object, raises `JSONStreamError`; an empty body yields
+    nothing.
+    """
+    projection = frozenset(fields) if fields is not None else None
+    decoder = JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    started = False
+    # Inside the array: a value may follow "[" or ","; "]" may follow "[" or a value.
+    expect_value = True
+    after_comma = False
+    finished = False
+    exhausted = False
+    source = iter(chunks)
+
+    while not finished:
+        if not exhausted:
+            chunk = next(source, None)
+            if chunk is None:
+                exhausted = True
+                buffer += text_decoder.decode(b"", final=True)
+            else:
+                buffer = buffer[position:] + text_decoder.decode(chunk)
+                position = 0
+
+        while True:
+            position = _skip_whitespace(buffer, position)
+            if position >= len(buffer):
+                break
+            char = buffer[position]
+            if not started:
+                if char != "[":
+                    raise JSONStreamError(f"Expected a JSON array, got {buffer[position:position + 40]!r}")
+                started = True
+                position += 1
+                continue
+            if char == "]":
+                if after_comma:
+                    raise JSONStreamError(f"Trailing comma in JSON array at offset {position}")
+                position += 1
+                finished = True
+                break
+            if char == ",":
+                if expect_value:
+                    raise JSONStreamError(f"Unexpected comma in JSON array at offset {position}")
+                position += 1
+                expect_value = after_comma = True
+                continue
+            if not expect_value:
+                raise JSONStreamError(f"Missing comma in JSON array at offset {position}")
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except JSONDecodeError:
+                if exhausted:
+                    raise JSONStreamError("Truncated JSON array") from None
+                break
+            if end >= len(buffer) and not exhausted:
+                # A scalar may continue in the next chunk ("12" of "123").
+                break
+            position = end
+            expect_value = after_comma = False
+            if projection is not None and isinstance(value, dict):
+                value = {key: item for key, item in value.items() if key in projection}
+            if where is None or where(value):
+                yield value
+
+        if exhausted and not finished:
+            if started:
+                raise JSONStreamError("Truncated JSON array")
+            return
+
+    if buffer[position:].strip() or any(text_decoder.decode(chunk).strip() for chunk in source):
+        raise JSONStreamError("Unexpected data after JSON array")
+
+
+def _skip_whitespace(buffer: str, position: int) -> int:
+    length = len(buffer)
+    while position < length and buffer[position] in _WHITESPACE:
+        position += 1
+    return position
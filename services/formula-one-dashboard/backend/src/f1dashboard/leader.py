@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import os
+import socket
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+from uuid import uuid4
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# A leader renews on every refresh attempt; followers take over once a lease
+# has not been renewed for this long, e.g. after the leader's process died.
+DEFAULT_LEASE_SECONDS = 90.0
+
+
+def default_holder_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+@dataclass(slots=True)
+class LeaseStats:
+    holder: str
+    is_leader: bool = False
+    acquisitions: int = 0
+    takeovers: int = 0
+    losses: int = 0
+
+
+class _Lease:
+    """Shared bookkeeping: log and count every leadership change."""
+
+    def __init__(self, name: str, holder: str | None) -> None:
+        self.name = name
+        self.stats = LeaseStats(holder=holder or default_holder_id())
+
+    @property
+    def holder(self) -> str:
+        return self.stats.holder
+
+    @property
+    def is_leader(self) -> bool:
+        return self.stats.is_leader
+
+    def _record(self, is_leader: bool, previous_holder: str | None = None) -> bool:
+        if is_leader and not self.stats.is_leader:
+            self.stats.acquisitions += 1
+            if previous_holder and previous_holder != self.holder:
+                self.stats.takeovers += 1
+                print(f"INFO: {self.holder} took over refresh lease {self.name} from {previous_holder}")
+            else:
+                print(f"INFO: {self.holder} acquired refresh lease {self.name}")
+        elif not is_leader and self.stats.is_leader:
+            self.stats.losses += 1
+            print(f"INFO: {self.holder} lost refresh lease {self.name}")
+        self.stats.is_leader = is_leader
+        return is_leader
+
+
+class LocalLease(_Lease):
+    """Lease for single-process deployments: this process always leads."""
+
+    def __init__(self, name: str = "dashboard-refresh", holder: str | None = None) -> None:
+        super().__init__(name, holder)
+
+    def acquire(self) -> bool:
+        return self._record(True)
+
+    def extend(self, seconds: float) -> None:
+        pass
+
+    def release(self) -> None:
+        self._record(False)
+
+
+class FileLease(_Lease):
+    """Leadership held through an exclusive `fcntl` lock on a file.
+
+    The kernel drops the lock when the holding process exits, so a dead
+    leader is replaced on the next refresh attempt without waiting for an
+    expiry. The holder id is written to the file for the next leader's log.
+    Only suitable for workers on one host (or a volume with working locks).
+    """
+
+    def __init__(self, path: str | Path, name: str = "dashboard-refresh", holder: str | None = None) -> None:
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError("FileLease requires fcntl")
+        super().__init__(name, holder)
+        self.path = Path(path).expanduser()
+        self._file = None
+        self._lock = Lock()
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self._file is not None:
+                return self._record(True)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(self.path, "a+", encoding="utf-8")
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                handle.close()
+                return self._record(False)
+            handle.seek(0)
+            previous_holder = handle.read().strip() or None
+            handle.seek(0)
+            handle.truncate()
+            handle.write(self.holder)
+            handle.flush()
+            self._file = handle
+            return self._record(True, previous_holder)
+
+    def extend(self, seconds: float) -> None:
+        # Held until released or the process exits; nothing expires.
+        pass
+
+    def release(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.seek(0)
+            self._file.truncate()
+            self._file.flush()
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+            self._record(False)
+
+
+class SQLiteLease(_Lease):
+    """Leadership held as an expiring lease row in a shared SQLite database.
+
+    Works across replicas that share the cache volume. The leader extends the
+    lease on every `acquire`, and with `extend` up to its next planned
+    refresh; anyone may take it over once it has expired.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        name: str = "dashboard-refresh",
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        holder: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(name, holder)
+        self.path = Path(path).expanduser()
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS refresh_leases (name TEXT PRIMARY KEY, holder TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def acquire(self) -> bool:
+        now = self.clock()
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute("SELECT holder, expires_at FROM refresh_leases WHERE name = ?", (self.name,)).fetchone()
+                previous_holder = row[0] if row is not None else None
+                acquired = row is None or row[0] == self.holder or row[1] <= now
+                if acquired:
+                    # Never shorten a lease this holder already extended.
+                    expires_at = max(now + self.lease_seconds, row[1] if row is not None and row[0] == self.holder else 0.0)
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO refresh_leases (name, holder, expires_at) VALUES (?, ?, ?)",
+                        (self.name, self.holder, expires_at),
+                    )
+            except sqlite3.Error:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return self._record(acquired, previous_holder)
+
+    def extend(self, seconds: float) -> None:
+        """Keep the lease for at least `seconds` from now, if this worker still holds it."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE refresh_leases SET expires_at = MAX(expires_at, ?) WHERE name = ? AND holder = ?",
+                (self.clock() + seconds, self.name, self.holder),
+            )
+
+    def release(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM refresh_leases WHERE name = ? AND holder = ?", (self.name, self.holder))
+        self._record(False)
+
+
+RefreshLease = LocalLease | FileLease | SQLiteLease
+
+
+def lease_from_env(shared_cache_path: str | None = None, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> RefreshLease:
+    """Pick the refresh lease for this deployment.
+
+    `DASHBOARD_REFRESH_LOCK_PATH` selects an `fcntl` lock file; otherwise a
+    lease row is kept in the shared cache database, if there is one.
+    """
+    lock_path = os.getenv("DASHBOARD_REFRESH_LOCK_PATH")
+    if lock_path and fcntl is not None:
+        return FileLease(lock_path)
+    if shared_cache_path:
+        lease_seconds = float(os.getenv("DASHBOARD_REFRESH_LEASE_SECONDS", str(lease_seconds)))
+        return SQLiteLease(shared_cache_path, lease_seconds=lease_seconds)
+    return LocalLease()
@@ -84,11 +84,20 @@ class VenueContext:
     circuit_short_name: str | None = None
     circuit_image_url: str | None = None
     circuit_wiki_url: str | None = None
-    track_map_svg: str | None = None
+    track_map_url: str | None = None
     track_length_km: float | None = None
     fastest_lap_seconds: float | None = None
     average_pit_stop_seconds: float | None = None
     weather_forecast: list[WeatherForecastDay] = field(default_factory=list)
+    weather_forecast_fetched_at_utc: datetime | None = None
+    weather_forecast_is_stale: bool = False
+
+
+@dataclass(slots=True)
+class StandingsHistoryPoint:
+    round: int
+    position: int | None
+    points: float
 
 
 @dataclass(slots=True)
@@ -97,7 +106,12 @@ class ChampionshipStandingRow:
     competitor_name: str
     points: float
     wins: int | None = None
+    # Jolpica driver or constructor id; stable when the display name is not.
+    competitor_id: str | None = None
     gap: str | None = None
+    gap_to_leader: float | None = None
+    gap_to_ahead: float | None = None
+    history: list[StandingsHistoryPoint] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -112,3 +126,4 @@ class DashboardSnapshot:
     constructor_standings: list[ChampionshipStandingRow]
     generated_at_utc: datetime
     venue: VenueContext | None = None
+    next_refresh_utc: datetime | None = None
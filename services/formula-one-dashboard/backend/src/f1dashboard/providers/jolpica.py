@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from json import loads
 from socket import timeout as SocketTimeout
 from typing import Any
@@ -13,9 +14,30 @@ class JolpicaError(RuntimeError):
     pass
 
 
+# Jolpica caps `limit` at 100 rows per response.
+PAGE_SIZE = 100
+
+
+@dataclass(slots=True)
+class RacePage:
+    """One page of a season-wide result query.
+
+    Pagination counts result rows, not races, so the first and last race of
+    a page may only carry part of their rows.
+    """
+
+    races: list[dict[str, Any]]
+    offset: int
+    total: int
+
+    @property
+    def row_count(self) -> int:
+        return sum(len(race.get("Results") or race.get("QualifyingResults") or []) for race in self.races)
+
+
 @dataclass(slots=True)
 class JolpicaClient:
-    base_url: str = "https://api.jolpi.ca/ergast/f1/"
+    base_url: str = field(default_factory=lambda: os.getenv("JOLPICA_BASE_URL", "https://api.jolpi.ca/ergast/f1/"))
     timeout_seconds: int = 20
 
     def _get_json(self, path: str) -> dict[str, Any]:
@@ -36,12 +58,12 @@ class JolpicaClient:
             raise JolpicaError(f"Jolpica returned unexpected payload for {url}")
         return data
 
-    def driver_standings(self, season: str = "current") -> list[dict[str, Any]]:
-        payload = self._get_json(f"{season}/driverStandings.json")
+    def driver_standings(self, season: str = "current", round_number: int | None = None) -> list[dict[str, Any]]:
+        payload = self._get_json(f"{_season_path(season, round_number)}/driverStandings.json")
         return _extract_standings_list(payload, "DriverStandings")
 
-    def constructor_standings(self, season: str = "current") -> list[dict[str, Any]]:
-        payload = self._get_json(f"{season}/constructorStandings.json")
+    def constructor_standings(self, season: str = "current", round_number: int | None = None) -> list[dict[str, Any]]:
+        payload = self._get_json(f"{_season_path(season, round_number)}/constructorStandings.json")
         return _extract_standings_list(payload, "ConstructorStandings")
 
     def current_circuits(self) -> list[dict[str, Any]]:
@@ -61,6 +83,47 @@ class JolpicaClient:
         races = _extract_race_table(payload)
         return races[0] if races else None
 
+    def season_results(self, season: str, offset: int = 0, limit: int = PAGE_SIZE) -> RacePage:
+        return self._race_page(f"{season}/results.json", offset, limit)
+
+    def season_qualifying(self, season: str, offset: int = 0, limit: int = PAGE_SIZE) -> RacePage:
+        return self._race_page(f"{season}/qualifying.json", offset, limit)
+
+    def standings(self, kind: str, season: str = "current", round_number: int | None = None) -> tuple[int | None, list[dict[str, Any]]]:
+        """Driver or constructor standings with the round they are after."""
+        table = "driverStandings" if kind == "driver" else "constructorStandings"
+        payload = self._get_json(f"{_season_path(season, round_number)}/{table}.json?limit={PAGE_SIZE}")
+        key = "DriverStandings" if kind == "driver" else "ConstructorStandings"
+        try:
+            standings_lists = payload["MRData"]["StandingsTable"]["StandingsLists"]
+            standings_round = int(standings_lists[0]["round"]) if standings_lists else None
+        except (KeyError, TypeError, ValueError) as exc:
+            raise JolpicaError("Jolpica standings response is missing MRData.StandingsTable.StandingsLists") from exc
+        return standings_round, _extract_standings_list(payload, key)
+
+    def _race_page(self, path: str, offset: int, limit: int) -> RacePage:
+        payload = self._get_json(f"{path}?limit={limit}&offset={offset}")
+        races = _extract_race_table(payload)
+        try:
+            total = int(payload["MRData"]["total"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise JolpicaError("Jolpica race response is missing MRData.total") from exc
+        return RacePage(races=races, offset=offset, total=total)
+
+    def race_results(self, season: str, round_number: int) -> dict[str, Any] | None:
+        payload = self._get_json(f"{season}/{round_number}/results.json")
+        races = _extract_race_table(payload)
+        return races[0] if races else None
+
+    def qualifying_results(self, season: str, round_number: int) -> dict[str, Any] | None:
+        payload = self._get_json(f"{season}/{round_number}/qualifying.json")
+        races = _extract_race_table(payload)
+        return races[0] if races else None
+
+
+def _season_path(season: str, round_number: int | None) -> str:
+    return season if round_number is None else f"{season}/{round_number}"
+
 
 def _extract_race_table(payload: dict[str, Any]) -> list[dict[str, Any]]:
     try:
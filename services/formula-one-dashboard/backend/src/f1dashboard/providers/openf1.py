@@ -1,22 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from json import loads
 from socket import timeout as SocketTimeout
-from typing import Any
+from typing import Any, Callable, Collection, Iterator
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
+from urllib.parse import quote, urlencode
 from urllib.request import Request, urlopen
 
+from f1dashboard.jsonstream import JSONStreamError, iter_chunks, iter_json_array
+
 
 class OpenF1Error(RuntimeError):
     pass
 
 
+# `field__op=value` keyword suffixes and the operator OpenF1 expects in the query string.
+FILTER_OPERATORS = {
+    "gt": ">",
+    "gte": ">=",
+    "lt": "<",
+    "lte": "<=",
+}
+
+
 @dataclass(slots=True)
 class OpenF1Client:
-    base_url: str = "https://api.openf1.org"
+    base_url: str = field(default_factory=lambda: os.getenv("OPENF1_BASE_URL", "https://api.openf1.org"))
     timeout_seconds: int = 20
 
     def _get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
@@ -34,6 +46,44 @@ class OpenF1Client:
         except (TimeoutError, SocketTimeout, OSError) as exc:
             raise OpenF1Error(f"OpenF1 request timed out for {url}") from exc
 
+    def iter_rows(
+        self,
+        path: str,
+        params: dict[str, Any] | str | None = None,
+        fields: Collection[str] | None = None,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream rows of a list endpoint straight from the socket.
+
+        Rows are projected to `fields` while decoding and filtered by `where`,
+        so long sessions never hold the full body, its text, or unused fields.
+        `params` may be a prebuilt query string (see `OpenF1Query`).
+        """
+        if isinstance(params, str):
+            query = f"?{params}" if params else ""
+        else:
+            query = f"?{urlencode(params)}" if params else ""
+        url = f"{self.base_url}{path}{query}"
+        print(f"INFO: send streaming api request to {url}")
+        try:
+            with urlopen(url, timeout=self.timeout_seconds) as response:
+                for row in iter_json_array(iter_chunks(response), fields=fields, where=where):
+                    if not isinstance(row, dict):
+                        raise OpenF1Error(f"OpenF1 returned unexpected payload for {url}")
+                    yield row
+        except HTTPError as exc:
+            raise OpenF1Error(f"OpenF1 request failed: {exc.code} {exc.reason} for {url}") from exc
+        except URLError as exc:
+            raise OpenF1Error(f"OpenF1 request failed: {exc.reason} for {url}") from exc
+        except JSONStreamError as exc:
+            raise OpenF1Error(f"OpenF1 returned invalid JSON for {url}: {exc}") from exc
+        except (TimeoutError, SocketTimeout, OSError) as exc:
+            raise OpenF1Error(f"OpenF1 request timed out for {url}") from exc
+
+    def query(self, endpoint: str) -> OpenF1Query:
+        """Start a filter-pushdown query, e.g. ``client.query("position").filter(session_key=1, date__gt=cursor)``."""
+        return OpenF1Query(client=self, path=f"/v1/{endpoint.strip('/')}")
+
     def latest_meeting(self) -> dict[str, Any] | None:
         data = self._get_json("/v1/meetings", {"meeting_key": "latest"})
         return data[0] if data else None
@@ -52,13 +102,41 @@ class OpenF1Client:
         return self._get_json("/v1/sessions", {"date_start>=": since_utc_iso})
 
     def positions(self, session_key: int) -> list[dict[str, Any]]:
-        return self._get_json("/v1/position", {"session_key": session_key})
+        return list(self.iter_positions(session_key))
+
+    def iter_positions(
+        self,
+        session_key: int,
+        fields: Collection[str] | None = None,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        return self.query("position").filter(session_key=session_key).select(*fields or ()).where(where).iter()
 
     def drivers(self, session_key: int) -> list[dict[str, Any]]:
         return self._get_json("/v1/drivers", {"session_key": session_key})
 
     def laps(self, session_key: int) -> list[dict[str, Any]]:
-        return self._get_json("/v1/laps", {"session_key": session_key})
+        return list(self.iter_laps(session_key))
+
+    def iter_laps(
+        self,
+        session_key: int,
+        fields: Collection[str] | None = None,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        return self.query("laps").filter(session_key=session_key).select(*fields or ()).where(where).iter()
+
+    def iter_car_data(
+        self,
+        session_key: int,
+        driver_number: int | None = None,
+        fields: Collection[str] | None = None,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        query = self.query("car_data").filter(session_key=session_key)
+        if driver_number is not None:
+            query = query.filter(driver_number=driver_number)
+        return query.select(*fields or ()).where(where).iter()
 
     def stints(self, session_key: int) -> list[dict[str, Any]]:
         return self._get_json("/v1/stints", {"session_key": session_key})
@@ -70,6 +148,60 @@ class OpenF1Client:
         return self._get_json("/v1/race_control", {"session_key": session_key})
 
 
+@dataclass(slots=True, frozen=True)
+class OpenF1Query:
+    """Immutable query against one OpenF1 list endpoint.
+
+    Filters are pushed down to OpenF1 (``date>``, ``position<=`` ...), so only
+    matching rows cross the wire. Field selection and `where` predicates are
+    applied while the response is stream-decoded, since OpenF1 itself always
+    returns whole rows.
+    """
+
+    client: OpenF1Client
+    path: str
+    filters: tuple[tuple[str, str, Any], ...] = ()
+    fields: tuple[str, ...] = ()
+    predicate: Callable[[dict[str, Any]], bool] | None = None
+
+    def filter(self, **conditions: Any) -> OpenF1Query:
+        filters = list(self.filters)
+        for key, value in conditions.items():
+            name, _, suffix = key.partition("__")
+            if suffix and suffix not in FILTER_OPERATORS:
+                raise ValueError(f"Unsupported OpenF1 filter operator: {suffix}")
+            filters.append((name, FILTER_OPERATORS.get(suffix, "="), _query_value(value)))
+        return replace(self, filters=tuple(filters))
+
+    def select(self, *fields: str) -> OpenF1Query:
+        return replace(self, fields=tuple(dict.fromkeys((*self.fields, *fields))))
+
+    def where(self, predicate: Callable[[dict[str, Any]], bool] | None) -> OpenF1Query:
+        if predicate is None:
+            return self
+        if self.predicate is None:
+            return replace(self, predicate=predicate)
+        previous = self.predicate
+        return replace(self, predicate=lambda row: previous(row) and predicate(row))
+
+    def query_string(self) -> str:
+        # OpenF1 reads comparison operators from the raw query string
+        # (`date>2026-06-07T13:00:00`, `position<=3`), so they are not escaped.
+        return "&".join(f"{quote(name)}{operator}{quote(str(value), safe=':')}" for name, operator, value in self.filters)
+
+    def iter(self) -> Iterator[dict[str, Any]]:
+        return self.client.iter_rows(self.path, self.query_string(), fields=self.fields or None, where=self.predicate)
+
+    def fetch(self) -> list[dict[str, Any]]:
+        return list(self.iter())
+
+
+def _query_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).isoformat() if value.tzinfo else value.isoformat()
+    return value
+
+
 def parse_utc_timestamp(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from html import unescape
 from json import loads
 from math import hypot
 from socket import timeout as SocketTimeout
-from typing import Any
+from typing import Any, Iterator
 from urllib.error import HTTPError, URLError
-from urllib.parse import quote, urlparse
+from urllib.parse import quote, unquote, urlparse, urlunparse
 from urllib.request import Request, urlopen
+import os
 import re
-import unicodedata
 
+from f1dashboard.circuits import CircuitMatcher
+from f1dashboard.geometry import ViewBox, encode_path, fit_to_viewbox, quantised_point, simplify
 from f1dashboard.providers.jolpica import JolpicaClient, JolpicaError
+from f1dashboard.registry import Circuit, EntityRegistry
+
+# Maximum deviation, in viewBox units, between the simplified and raw outline.
+# A 2.5 unit stroke hides anything below a quarter unit.
+TRACK_MAP_TOLERANCE = 0.25
 
 
 class VenueError(RuntimeError):
@@ -24,6 +31,16 @@ class VenueError(RuntimeError):
 class VenueClient:
     circuits_client: JolpicaClient | None = None
     timeout_seconds: int = 20
+    # Matched circuits resolve to the registry's records (the dashboard passes its own).
+    registry: EntityRegistry = field(default_factory=EntityRegistry)
+    weather_base_url: str = field(default_factory=lambda: os.getenv("OPEN_METEO_BASE_URL", "https://api.open-meteo.com"))
+    wikipedia_base_url: str = field(default_factory=lambda: os.getenv("WIKIPEDIA_BASE_URL", "https://en.wikipedia.org"))
+    # Track outlines are addressed by the absolute `circuit_info_url` OpenF1
+    # returns; when set, this replaces its scheme and host (e.g. a local replay server).
+    track_map_base_url: str | None = field(default_factory=lambda: os.getenv("MULTIVIEWER_BASE_URL") or None)
+    _track_maps: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _circuit_lengths: dict[str, float | None] = field(default_factory=dict, init=False, repr=False)
+    _matcher: tuple[int, CircuitMatcher] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.circuits_client is None:
@@ -35,19 +52,20 @@ class VenueClient:
         circuit_short_name = str(meeting_raw.get("circuit_short_name", "")).strip() or None
         circuit_name = circuit_short_name or str(meeting_raw.get("meeting_name", "Track")).strip() or "Track"
 
-        latlon = self._lookup_latlon(meeting_raw)
+        circuit = self._lookup_circuit(meeting_raw)
+        wiki_url = circuit.wiki_url if circuit is not None else None
         track_map_svg = self._track_map_svg(circuit_info_url) if circuit_info_url else None
-        circuit_length_km = self._circuit_length_km(latlon.get("wiki_url")) if latlon.get("wiki_url") else None
+        circuit_length_km = self._circuit_length_km(wiki_url) if wiki_url else None
 
         return {
             "circuit_name": circuit_name,
             "circuit_short_name": circuit_short_name,
             "circuit_image_url": circuit_image_url,
-            "circuit_wiki_url": latlon.get("wiki_url"),
+            "circuit_wiki_url": wiki_url,
             "track_map_svg": track_map_svg,
             "track_length_km": circuit_length_km,
-            "latitude": latlon.get("latitude"),
-            "longitude": latlon.get("longitude"),
+            "latitude": circuit.latitude if circuit is not None else None,
+            "longitude": circuit.longitude if circuit is not None else None,
         }
 
     def weather_forecast(self, latitude: float, longitude: float, start_date: date, end_date: date) -> list[dict[str, Any]]:
@@ -70,7 +88,7 @@ class VenueClient:
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         }
-        data = self._get_json("https://api.open-meteo.com/v1/forecast", params=params)
+        data = self._get_json(f"{self.weather_base_url.rstrip('/')}/v1/forecast", params=params)
         daily = data.get("daily", {}) if isinstance(data, dict) else {}
         times = daily.get("time", []) if isinstance(daily, dict) else []
         result: list[dict[str, Any]] = []
@@ -102,52 +120,44 @@ class VenueClient:
             )
         return result
 
-    def _lookup_latlon(self, meeting_raw: dict[str, Any]) -> dict[str, Any]:
+    def locate(self, meeting_raw: dict[str, Any]) -> tuple[float, float] | None:
+        circuit = self._lookup_circuit(meeting_raw)
+        if circuit is None or circuit.latitude is None or circuit.longitude is None:
+            return None
+        return circuit.latitude, circuit.longitude
+
+    def _lookup_circuit(self, meeting_raw: dict[str, Any]) -> Circuit | None:
+        circuit = self._circuit_matcher().match(
+            (
+                meeting_raw.get("circuit_short_name"),
+                meeting_raw.get("location"),
+                meeting_raw.get("country_name"),
+                meeting_raw.get("meeting_name"),
+            )
+        )
+        return self.registry.circuit(circuit) if circuit is not None else None
+
+    def _circuit_matcher(self) -> CircuitMatcher:
+        # The calendar's circuits are fixed for a season: fetch and index
+        # them once per year rather than on every lookup.
+        year = datetime.now(timezone.utc).year
+        if self._matcher is not None and self._matcher[0] == year:
+            return self._matcher[1]
         try:
             circuits = self.circuits_client.current_circuits() if self.circuits_client else []
         except JolpicaError:
-            circuits = []
-
-        candidates = [
-            meeting_raw.get("circuit_short_name"),
-            meeting_raw.get("location"),
-            meeting_raw.get("country_name"),
-            meeting_raw.get("meeting_name"),
-        ]
-        normalized_candidates = [normalized for candidate in candidates if (normalized := _normalize(candidate))]
-        for circuit in circuits:
-            location = circuit.get("Location", {}) if isinstance(circuit, dict) else {}
-            circuit_candidates = [
-                circuit.get("circuitName"),
-                location.get("locality"),
-                location.get("country"),
-                circuit.get("circuitId"),
-            ]
-            normalized_circuit = [normalized for candidate in circuit_candidates if (normalized := _normalize(candidate))]
-            if any(candidate == circuit_value for candidate in normalized_candidates for circuit_value in normalized_circuit):
-                return {
-                    "latitude": _optional_float(location.get("lat")),
-                    "longitude": _optional_float(location.get("long")),
-                    "wiki_url": circuit.get("url"),
-                }
-
-        for circuit in circuits:
-            location = circuit.get("Location", {}) if isinstance(circuit, dict) else {}
-            circuit_values = " ".join(
-                part for part in [str(circuit.get("circuitName", "")), str(location.get("locality", "")), str(location.get("country", ""))] if part
-            )
-            if any(candidate and candidate in _normalize(circuit_values) for candidate in normalized_candidates):
-                return {
-                    "latitude": _optional_float(location.get("lat")),
-                    "longitude": _optional_float(location.get("long")),
-                    "wiki_url": circuit.get("url"),
-                }
-
-        return {"latitude": None, "longitude": None, "wiki_url": None}
+            return self._matcher[1] if self._matcher is not None else CircuitMatcher([])
+        matcher = CircuitMatcher(circuits)
+        self._matcher = (year, matcher)
+        return matcher
 
     def _track_map_svg(self, circuit_info_url: str) -> str | None:
+        cache_key = _track_map_cache_key(circuit_info_url)
+        cached = self._track_maps.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            data = self._get_json(circuit_info_url, headers={"User-Agent": "Mozilla/5.0", "Accept": "application/json"})
+            data = self._get_json(self._track_map_url(circuit_info_url), headers={"User-Agent": "Mozilla/5.0", "Accept": "application/json"})
         except VenueError:
             return None
         if not isinstance(data, dict):
@@ -156,78 +166,65 @@ class VenueClient:
         y_values = data.get("y") or []
         if not x_values or not y_values or len(x_values) != len(y_values):
             return None
-
-        points = list(zip(x_values, y_values))
-        if not points:
+        try:
+            xs = [float(value) for value in x_values]
+            ys = [float(value) for value in y_values]
+        except (TypeError, ValueError):
             return None
-        step = max(len(points) // 220, 1)
-        sampled = points[::step]
-        xs = [float(point[0]) for point in sampled]
-        ys = [float(point[1]) for point in sampled]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
-        width = max(max_x - min_x, 1.0)
-        height = max(max_y - min_y, 1.0)
-        pad = 14
-        view_w = 180
-        view_h = 120
-        drawable_w = view_w - pad * 2
-        drawable_h = view_h - pad * 2
-        scale = min(drawable_w / width, drawable_h / height)
-        offset_x = pad + (drawable_w - width * scale) / 2
-        offset_y = pad + (drawable_h - height * scale) / 2
-
-        def tx(x: float) -> float:
-            return (x - min_x) * scale + offset_x
-
-        def ty(y: float) -> float:
-            return (max_y - y) * scale + offset_y
-
-        path = " ".join([
-            f"M {tx(sampled[0][0]):.1f} {ty(sampled[0][1]):.1f}",
-            *[f"L {tx(x):.1f} {ty(y):.1f}" for x, y in sampled[1:]],
-        ])
-        return (
-            '<svg viewBox="0 0 180 120" role="img" aria-label="Circuit minimap" xmlns="http://www.w3.org/2000/svg">'
-            '<rect x="0" y="0" width="180" height="120" rx="16" fill="#0b0b0d"/>'
-            '<path d="{path}" fill="none" stroke="#ff1e2d" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round"/>'
-            '<circle cx="{start_x}" cy="{start_y}" r="4.2" fill="#ffffff" stroke="#ff1e2d" stroke-width="2"/>'
-            '<circle cx="{end_x}" cy="{end_y}" r="4.2" fill="#ff1e2d" stroke="#ffffff" stroke-width="1.5"/>'
-            '</svg>'
-        ).format(
-            path=path,
-            start_x=f"{tx(sampled[0][0]):.1f}",
-            start_y=f"{ty(sampled[0][1]):.1f}",
-            end_x=f"{tx(sampled[-1][0]):.1f}",
-            end_y=f"{ty(sampled[-1][1]):.1f}",
-        )
+
+        svg = render_track_map_svg(xs, ys)
+        self._track_maps[cache_key] = svg
+        return svg
+
+    def _track_map_url(self, circuit_info_url: str) -> str:
+        if not self.track_map_base_url:
+            return circuit_info_url
+        base = urlparse(self.track_map_base_url)
+        original = urlparse(circuit_info_url)
+        return urlunparse(original._replace(scheme=base.scheme, netloc=base.netloc, path=f"{base.path.rstrip('/')}{original.path}"))
 
     def _circuit_length_km(self, wiki_url: str | None) -> float | None:
         if not wiki_url:
             return None
-        page = urlparse(wiki_url).path.rsplit("/", 1)[-1]
+        page = unquote(urlparse(wiki_url).path.rsplit("/", 1)[-1])
         if not page:
             return None
-        api_url = "https://en.wikipedia.org/w/api.php"
+        # Circuit lengths change at most between seasons; layout changes land
+        # in the infobox before the season they apply to.
+        cache_key = f"{datetime.now(timezone.utc).year}:{wiki_url}"
+        if cache_key in self._circuit_lengths:
+            return self._circuit_lengths[cache_key]
+
+        # The infobox lives in the lead section, so ask for that section's raw
+        # wikitext only and stop reading at the first length parameter.
+        index_url = f"{self.wikipedia_base_url.rstrip('/')}/w/index.php"
+        length_km: float | None = None
         try:
-            html = self._get_json(api_url, params={"action": "parse", "page": page, "prop": "text", "format": "json", "formatversion": 2}, headers={"User-Agent": "Mozilla/5.0"})
+            for line in self._iter_lines(index_url, params={"title": page, "action": "raw", "section": 0}, headers={"User-Agent": "Mozilla/5.0"}):
+                length_km = _infobox_length_km(line)
+                if length_km is not None:
+                    break
         except VenueError:
             return None
-        text = html.get("parse", {}).get("text", "") if isinstance(html, dict) else ""
-        if not text:
-            return None
-        match = re.search(r'<th[^>]*>Length</th><td class="infobox-data">([0-9.,]+)\s*km', text)
-        if not match:
-            return None
+        self._circuit_lengths[cache_key] = length_km
+        return length_km
+
+    def _iter_lines(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Iterator[str]:
+        url = _with_query(url, params)
+        request = Request(url, headers=headers or {})
         try:
-            return float(match.group(1).replace(",", "")) if "," in match.group(1) and "." not in match.group(1) else float(match.group(1).replace(",", "."))
-        except ValueError:
-            return None
+            with urlopen(request, timeout=self.timeout_seconds) as response:
+                for raw_line in response:
+                    yield raw_line.decode("utf-8", errors="replace")
+        except HTTPError as exc:
+            raise VenueError(f"Venue request failed: {exc.code} {exc.reason} for {url}") from exc
+        except URLError as exc:
+            raise VenueError(f"Venue request failed: {exc.reason} for {url}") from exc
+        except (TimeoutError, SocketTimeout, OSError) as exc:
+            raise VenueError(f"Venue request timed out for {url}") from exc
 
     def _get_json(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
-        if params:
-            query = "&".join(f"{quote(str(key))}={quote(str(value))}" for key, value in params.items())
-            url = f"{url}?{query}"
+        url = _with_query(url, params)
         request = Request(url, headers=headers or {})
         try:
             with urlopen(request, timeout=self.timeout_seconds) as response:
@@ -240,10 +237,63 @@ class VenueClient:
             raise VenueError(f"Venue request timed out for {url}") from exc
 
 
-def _normalize(value: Any) -> str:
-    text = unicodedata.normalize("NFKD", str(value or ""))
-    text = "".join(char for char in text if not unicodedata.combining(char))
-    return re.sub(r"[^a-z0-9]+", "", text.lower())
+def _with_query(url: str, params: dict[str, Any] | None) -> str:
+    if not params:
+        return url
+    query = "&".join(f"{quote(str(key))}={quote(str(value))}" for key, value in params.items())
+    return f"{url}?{query}"
+
+
+_INFOBOX_LENGTH_PATTERNS = (
+    # | length_km = 3.337
+    re.compile(r"\|\s*length_km\s*=\s*([0-9][0-9.,]*)", re.IGNORECASE),
+    # | length = {{convert|5.891|km|mi|abbr=on}}
+    re.compile(r"\|\s*length\s*=\s*\{\{\s*convert\s*\|\s*([0-9][0-9.,]*)\s*\|\s*km\b", re.IGNORECASE),
+    # | length = 4.361 km
+    re.compile(r"\|\s*length\s*=\s*([0-9][0-9.,]*)\s*(?:&nbsp;|\s)*km\b", re.IGNORECASE),
+)
+
+
+def _infobox_length_km(line: str) -> float | None:
+    for pattern in _INFOBOX_LENGTH_PATTERNS:
+        match = pattern.search(line)
+        if match:
+            return _parse_decimal(match.group(1))
+    return None
+
+
+def _parse_decimal(value: str) -> float | None:
+    value = value.rstrip(".,")
+    # No circuit is a thousand kilometres long, so a lone comma is a decimal separator.
+    value = value.replace(",", ".") if "," in value and "." not in value else value.replace(",", "")
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def render_track_map_svg(xs: list[float], ys: list[float]) -> str:
+    view = ViewBox()
+    points = simplify(fit_to_viewbox(xs, ys, view), TRACK_MAP_TOLERANCE)
+    start_x, start_y = quantised_point(points[0])
+    end_x, end_y = quantised_point(points[-1])
+    return (
+        f'<svg viewBox="0 0 {view.width:g} {view.height:g}" role="img" aria-label="Circuit minimap" xmlns="http://www.w3.org/2000/svg">'
+        f'<rect x="0" y="0" width="{view.width:g}" height="{view.height:g}" rx="16" fill="#0b0b0d"/>'
+        f'<path d="{encode_path(points)}" fill="none" stroke="#ff1e2d" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round"/>'
+        f'<circle cx="{start_x}" cy="{start_y}" r="4.2" fill="#ffffff" stroke="#ff1e2d" stroke-width="2"/>'
+        f'<circle cx="{end_x}" cy="{end_y}" r="4.2" fill="#ff1e2d" stroke="#ffffff" stroke-width="1.5"/>'
+        "</svg>"
+    )
+
+
+def _track_map_cache_key(circuit_info_url: str) -> str:
+    # Multiviewer outlines live at /api/v1/circuits/<circuit>/<year>; one
+    # outline per circuit and season regardless of host or query string.
+    match = re.search(r"/circuits/([^/?#]+)/([^/?#]+)", circuit_info_url)
+    if match:
+        return f"{match.group(1)}:{match.group(2)}"
+    return circuit_info_url
 
 
 def _optional_int(value: Any) -> int | None:
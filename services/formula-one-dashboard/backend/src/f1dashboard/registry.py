@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from f1dashboard.decoding import (
+    CONSTRUCTOR_STANDINGS,
+    DRIVER_STANDINGS,
+    JOLPICA_QUALIFYING_RESULTS,
+    JOLPICA_RACE_RESULTS,
+    Field,
+    jolpica_driver_name,
+    optional_int,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Driver:
+    driver_id: str
+    name: str
+    number: int | None = None
+    code: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Constructor:
+    constructor_id: str
+    name: str
+
+
+@dataclass(slots=True, frozen=True)
+class Circuit:
+    circuit_id: str
+    name: str
+    locality: str | None = None
+    country: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    wiki_url: str | None = None
+
+
+class EntityRegistry:
+    """Drivers, constructors and circuits of one season, keyed by Jolpica id.
+
+    A record is built the first time its id is seen; later rows look it up
+    and share its strings, so rebuilds neither reassemble names nor copy
+    them. OpenF1 drivers resolve to the same records by car number. Numbers
+    and seats change between seasons, so everything is dropped when the
+    season does.
+    """
+
+    def __init__(self) -> None:
+        self.season: int | None = None
+        self._drivers: dict[str, Driver] = {}
+        self._drivers_by_number: dict[int, Driver] = {}
+        self._constructors: dict[str, Constructor] = {}
+        self._circuits: dict[str, Circuit] = {}
+        self._names: dict[str, str] = {}
+        self._lock = Lock()
+        self.race_results = JOLPICA_RACE_RESULTS.replace(
+            driver_name=Field(None, self._result_driver_name),
+            team_name=Field("Constructor", self._constructor_name),
+        )
+        self.qualifying_results = JOLPICA_QUALIFYING_RESULTS.replace(
+            driver_name=Field(None, self._result_driver_name),
+            team_name=Field("Constructor", self._constructor_name),
+        )
+        self.driver_standings = DRIVER_STANDINGS.replace(
+            competitor_name=Field(None, lambda row: self.driver(row.get("Driver", {})).name),
+            competitor_id=Field(None, lambda row: self.driver(row.get("Driver", {})).driver_id),
+        )
+        self.constructor_standings = CONSTRUCTOR_STANDINGS.replace(
+            competitor_name=Field(None, lambda row: self.constructor(row.get("Constructor", {})).name),
+            competitor_id=Field(None, lambda row: self.constructor(row.get("Constructor", {})).constructor_id),
+        )
+
+    def start_season(self, season: int) -> None:
+        with self._lock:
+            if season == self.season:
+                return
+            self.season = season
+            self._drivers.clear()
+            self._drivers_by_number.clear()
+            self._constructors.clear()
+            self._circuits.clear()
+            self._names.clear()
+
+    def driver(self, driver: Mapping[str, Any], number: int | None = None) -> Driver:
+        """The record for a Jolpica `Driver` object."""
+        driver_id = str(driver.get("driverId") or "")
+        record = self._drivers.get(driver_id) if driver_id else None
+        if record is not None:
+            return record
+        if number is None:
+            number = _number(driver.get("permanentNumber"))
+        name = jolpica_driver_name(driver, number)
+        with self._lock:
+            record = self._drivers.setdefault(driver_id or name, Driver(driver_id or name, self._intern(name), number, driver.get("code")))
+            if number is not None:
+                self._drivers_by_number[number] = record
+        return record
+
+    def openf1_driver(self, row: Mapping[str, Any], number: int) -> Driver:
+        """The record for an OpenF1 `drivers` row; Jolpica's record when the number is known."""
+        record = self._drivers_by_number.get(number)
+        if record is not None:
+            return record
+        name = _openf1_driver_name(row, number)
+        with self._lock:
+            record = self._drivers_by_number.setdefault(number, Driver(f"#{number}", self._intern(name), number, row.get("name_acronym")))
+        return record
+
+    def constructor(self, constructor: Mapping[str, Any]) -> Constructor:
+        constructor_id = str(constructor.get("constructorId") or "")
+        record = self._constructors.get(constructor_id) if constructor_id else None
+        if record is not None:
+            return record
+        name = str(constructor.get("name") or constructor_id or "Unknown constructor")
+        with self._lock:
+            return self._constructors.setdefault(constructor_id or name, Constructor(constructor_id or name, self._intern(name)))
+
+    def circuit(self, circuit: Mapping[str, Any]) -> Circuit:
+        """The record for a Jolpica `Circuit` object."""
+        circuit_id = str(circuit.get("circuitId") or "")
+        record = self._circuits.get(circuit_id) if circuit_id else None
+        if record is not None:
+            return record
+        location = circuit.get("Location") or {}
+        name = str(circuit.get("circuitName") or circuit_id or "Unknown circuit")
+        with self._lock:
+            return self._circuits.setdefault(
+                circuit_id or name,
+                Circuit(
+                    circuit_id=circuit_id or name,
+                    name=self._intern(name),
+                    locality=location.get("locality"),
+                    country=location.get("country"),
+                    latitude=_coordinate(location.get("lat")),
+                    longitude=_coordinate(location.get("long")),
+                    wiki_url=circuit.get("url"),
+                ),
+            )
+
+    def circuits(self) -> list[Circuit]:
+        return list(self._circuits.values())
+
+    def team_name(self, name: str | None) -> str | None:
+        """The shared copy of a team name from a provider that has no constructor ids."""
+        if not name:
+            return None
+        shared = self._names.get(name)
+        if shared is None:
+            with self._lock:
+                shared = self._intern(name)
+        return shared
+
+    def _intern(self, name: str) -> str:
+        # Callers hold the lock.
+        return self._names.setdefault(name, name)
+
+    def _result_driver_name(self, row: Mapping[str, Any]) -> str:
+        return self.driver(row.get("Driver", {}), _number(row.get("number"))).name
+
+    def _constructor_name(self, constructor: Mapping[str, Any]) -> str | None:
+        return self.constructor(constructor).name if constructor else None
+
+
+def _openf1_driver_name(row: Mapping[str, Any], number: int) -> str:
+    full_name = str(row.get("full_name", "")).strip()
+    if full_name:
+        return full_name
+    name = " ".join(part for part in (str(row.get("first_name", "")).strip(), str(row.get("last_name", "")).strip()) if part)
+    if name:
+        return name
+    for key in ("broadcast_name", "name_acronym"):
+        value = str(row.get(key, "")).strip()
+        if value:
+            return value
+    return f"Driver {number}"
+
+
+def _number(value: Any) -> int | None:
+    try:
+        return optional_int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _coordinate(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from f1dashboard.models import Session
+
+# Without a known boundary (e.g. no schedule yet), shared caches keep a
+# response no longer than this.
+MAX_CACHE_AGE = timedelta(hours=1)
+
+UPCOMING = "upcoming"
+LIVE = "live"
+NONE = "none"
+
+
+@dataclass(slots=True)
+class Countdown:
+    state: str
+    session_key: int | None = None
+    session_name: str | None = None
+    target_utc: datetime | None = None
+
+
+def next_state_change(sessions: Iterable[Session], now: datetime) -> datetime | None:
+    """Return the next session start or end after `now`, i.e. when the schedule view changes."""
+    upcoming = [
+        instant
+        for session in sessions
+        for instant in (session.date_start_utc, session.date_end_utc)
+        if instant is not None and instant > now
+    ]
+    return min(upcoming, default=None)
+
+
+def countdown(sessions: Iterable[Session], now: datetime) -> Countdown:
+    """Count down to the end of the live session, or else to the next session start."""
+    ordered = sorted(sessions, key=lambda session: session.date_start_utc)
+    for session in ordered:
+        if session.date_start_utc <= now and session.date_end_utc is not None and session.date_end_utc > now:
+            return Countdown(state=LIVE, session_key=session.session_key, session_name=session.session_name, target_utc=session.date_end_utc)
+    for session in ordered:
+        if session.date_start_utc > now:
+            return Countdown(state=UPCOMING, session_key=session.session_key, session_name=session.session_name, target_utc=session.date_start_utc)
+    return Countdown(state=NONE)
+
+
+def cache_headers(expires_at: datetime | None, now: datetime) -> dict[str, str]:
+    """`Cache-Control`/`Expires` that let clients and proxies cache up to `expires_at` and no further."""
+    limit = now + MAX_CACHE_AGE
+    if expires_at is None or expires_at > limit:
+        expires_at = limit
+    max_age = max(0, int((expires_at - now).total_seconds()))
+    return {
+        "Cache-Control": f"public, max-age={max_age}",
+        "Expires": format_datetime(expires_at.astimezone(timezone.utc), usegmt=True),
+    }
+
+
+# Data sections of the snapshot that refresh on their own timetable.
+SCHEDULE = "schedule"
+RESULTS = "results"
+STANDINGS = "standings"
+VENUE = "venue"
+SECTIONS = (SCHEDULE, RESULTS, STANDINGS, VENUE)
+
+LIVE_SESSION = "live"
+RACE_WEEKEND = "weekend"
+BETWEEN_WEEKENDS = "between"
+OFF_SEASON = "off_season"
+
+REFRESH_INTERVALS = {
+    LIVE_SESSION: {SCHEDULE: timedelta(minutes=1), RESULTS: timedelta(minutes=5), STANDINGS: timedelta(minutes=30), VENUE: timedelta(minutes=30)},
+    RACE_WEEKEND: {SCHEDULE: timedelta(minutes=10), RESULTS: timedelta(minutes=30), STANDINGS: timedelta(hours=1), VENUE: timedelta(hours=1)},
+    BETWEEN_WEEKENDS: {SCHEDULE: timedelta(hours=2), RESULTS: timedelta(hours=6), STANDINGS: timedelta(hours=6), VENUE: timedelta(hours=6)},
+    OFF_SEASON: {SCHEDULE: timedelta(hours=12), RESULTS: timedelta(hours=24), STANDINGS: timedelta(hours=24), VENUE: timedelta(hours=24)},
+}
+
+# A weekend starts this long before its next session and lasts this long
+# after its last one; with no session this far ahead it is the off-season.
+WEEKEND_LEAD = timedelta(days=3)
+WEEKEND_TAIL = timedelta(days=1)
+OFF_SEASON_GAP = timedelta(days=21)
+
+# Classifications and standings are published some minutes after a session
+# ends (and corrected later), so results are re-checked at these offsets.
+POST_SESSION_CHECKS = (timedelta(minutes=5), timedelta(minutes=20), timedelta(hours=1))
+
+
+@dataclass(slots=True)
+class RefreshPlan:
+    phase: str
+    due_utc: dict[str, datetime]
+
+    @property
+    def next_refresh_utc(self) -> datetime:
+        return min(self.due_utc.values())
+
+    def is_due(self, section: str, now: datetime) -> bool:
+        return self.due_utc.get(section, now) <= now
+
+
+def refresh_phase(sessions: Iterable[Session], now: datetime, last_session_end: datetime | None = None) -> str:
+    sessions = list(sessions)
+    if any(session.date_start_utc <= now and (session.date_end_utc is None or session.date_end_utc > now) for session in sessions):
+        return LIVE_SESSION
+    next_start = min((session.date_start_utc for session in sessions if session.date_start_utc > now), default=None)
+    if (next_start is not None and next_start - now <= WEEKEND_LEAD) or (
+        last_session_end is not None and timedelta(0) <= now - last_session_end <= WEEKEND_TAIL
+    ):
+        return RACE_WEEKEND
+    if next_start is None or next_start - now > OFF_SEASON_GAP:
+        return OFF_SEASON
+    return BETWEEN_WEEKENDS
+
+
+def plan_refresh(sessions: Iterable[Session], now: datetime, last_session_end: datetime | None = None) -> RefreshPlan:
+    """Pick when each section is next refreshed from the weekend state.
+
+    The schedule is also refreshed at the next session start/end (where the
+    phase changes), and results and standings shortly after every session end.
+    """
+    sessions = list(sessions)
+    phase = refresh_phase(sessions, now, last_session_end)
+    due = {section: now + interval for section, interval in REFRESH_INTERVALS[phase].items()}
+
+    boundary = next_state_change(sessions, now)
+    if boundary is not None:
+        due[SCHEDULE] = min(due[SCHEDULE], boundary)
+
+    session_ends = [session.date_end_utc for session in sessions if session.date_end_utc is not None]
+    if last_session_end is not None:
+        session_ends.append(last_session_end)
+    checks = [end + offset for end in session_ends for offset in POST_SESSION_CHECKS if end + offset > now]
+    if checks:
+        for section in (RESULTS, STANDINGS):
+            due[section] = min(due[section], min(checks))
+    return RefreshPlan(phase=phase, due_utc=due)
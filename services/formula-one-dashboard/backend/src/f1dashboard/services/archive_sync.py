@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from f1dashboard.archive import CONSTRUCTOR, DRIVER, QUALIFYING, RACE, FeedState, SeasonArchive
+from f1dashboard.providers.jolpica import JolpicaClient, JolpicaError
+from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error, parse_utc_timestamp
+from f1dashboard.schedule import POST_SESSION_CHECKS
+
+MAX_MEETINGS_PER_SYNC = 3
+
+# Season-wide feeds kept in the archive, refreshed in this order once caught up.
+FEEDS = (RACE, QUALIFYING, DRIVER, CONSTRUCTOR)
+
+# The feed an OpenF1 session (by `session_name`) changes; a sprint only
+# shows up in the standings. Until the last post-session check has passed it
+# is refreshed ahead of the rotation.
+SESSION_FEEDS = {"Race": RACE, "Qualifying": QUALIFYING, "Sprint": DRIVER}
+POST_SESSION_WINDOW = POST_SESSION_CHECKS[-1] + timedelta(minutes=10)
+
+
+@dataclass(slots=True)
+class SyncResult:
+    season: int | None = None
+    latest_race_round: int | None = None
+    latest_qualifying_round: int | None = None
+    # The single Jolpica request made by this run, e.g. "race@200".
+    request: str | None = None
+    fetched_rounds: list[int] = field(default_factory=list)
+    fetched_meetings: list[int] = field(default_factory=list)
+
+
+class ArchiveSync:
+    """Incrementally copy the current season into a `SeasonArchive`.
+
+    Results and qualifying are read as paginated season queries and
+    standings per round, with at most one Jolpica request per run: first the
+    pages not read yet, then standings of rounds that lack them (newest
+    first), and once caught up a rotating refresh of the newest round of one
+    feed. Right after a session ends its own feed goes ahead of the rotation
+    (and of older standings gaps). Finished OpenF1 meetings are archived with their sessions from the
+    meeting rows the caller already fetched. Readers always get their data
+    from the archive.
+    """
+
+    def __init__(
+        self,
+        archive: SeasonArchive,
+        standings_client: JolpicaClient,
+        client: OpenF1Client | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self.archive = archive
+        self.standings_client = standings_client
+        self.client = client
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self._refresh_turn = 0
+        self._backfill_turn = False
+
+    def sync(self, meetings: list[dict[str, Any]] | None = None, last_session: dict[str, Any] | None = None) -> SyncResult:
+        """Sync the current season.
+
+        `meetings` are its OpenF1 meeting rows and `last_session` the latest
+        OpenF1 session, if the caller has them.
+        """
+        season = self.clock().year
+        result = SyncResult(season=season)
+        try:
+            self._step(season, result, self._post_session_feed(last_session))
+        except (AttributeError, KeyError, TypeError, ValueError, JolpicaError) as exc:
+            print(f"INFO: archive sync of {season} stopped after {result.request}: {exc}")
+        result.latest_race_round = self.archive.latest_round(season, RACE)
+        result.latest_qualifying_round = self.archive.latest_round(season, QUALIFYING)
+        if self.client is not None and meetings:
+            result.fetched_meetings = self._archive_finished_meetings(season, meetings)
+        return result
+
+    def _step(self, season: int, result: SyncResult, post_session_feed: str | None = None) -> None:
+        for kind in (RACE, QUALIFYING):
+            state = self.archive.feed_state(season, kind)
+            if not state.caught_up:
+                self._read_page(season, kind, state, state.next_offset, result)
+                return
+
+        latest_race_round = self.archive.latest_round(season, RACE)
+        missing = self._missing_standings(season, latest_race_round)
+        # The newest round's standings are fetched straight away; older gaps
+        # alternate with refreshes so the newest data stays current meanwhile.
+        if missing and missing[0][0] == latest_race_round:
+            self._backfill_turn = False
+            round_number, kind = missing[0]
+            self._read_standings(season, kind, round_number, result)
+            return
+        if post_session_feed is not None:
+            self._refresh_feed(season, post_session_feed, result)
+            return
+        if missing and self._backfill_turn:
+            self._backfill_turn = False
+            round_number, kind = missing[0]
+            self._read_standings(season, kind, round_number, result)
+            return
+        self._backfill_turn = bool(missing)
+
+        kind = FEEDS[self._refresh_turn % len(FEEDS)]
+        self._refresh_turn += 1
+        self._refresh_feed(season, kind, result)
+
+    def _post_session_feed(self, session: dict[str, Any] | None) -> str | None:
+        """The feed `session` changes, while its post-session checks are still running."""
+        if not session:
+            return None
+        kind = SESSION_FEEDS.get(str(session.get("session_name")))
+        end = parse_utc_timestamp(session.get("date_end"))
+        if kind is None or end is None or not timedelta(0) <= self.clock() - end <= POST_SESSION_WINDOW:
+            return None
+        return kind
+
+    def _refresh_feed(self, season: int, kind: str, result: SyncResult) -> None:
+        if kind in (RACE, QUALIFYING):
+            state = self.archive.feed_state(season, kind)
+            self._read_page(season, kind, state, state.newest_round_offset, result)
+        else:
+            # Current standings, which include sprint points scored before
+            # the weekend's race.
+            self._read_standings(season, kind, None, result)
+
+    def _read_page(self, season: int, kind: str, state: FeedState, offset: int, result: SyncResult) -> None:
+        fetch = self.standings_client.season_results if kind == RACE else self.standings_client.season_qualifying
+        result.request = f"{kind}@{offset}"
+        page = fetch(str(season), offset=offset)
+        row_offset = page.offset
+        for race in page.races:
+            round_number = int(race["round"])
+            if state.newest_round is None or round_number > state.newest_round:
+                state.newest_round, state.newest_round_offset = round_number, row_offset
+            row_offset += len(race.get("Results") or race.get("QualifyingResults") or [])
+            self.archive.merge_round(kind, race)
+            result.fetched_rounds.append(round_number)
+        state.total = page.total
+        state.next_offset = page.offset + page.row_count if page.row_count else max(page.offset, page.total)
+        self.archive.put_feed_state(season, kind, state)
+
+    def _read_standings(self, season: int, kind: str, round_number: int | None, result: SyncResult) -> None:
+        result.request = f"{kind}@{round_number or 'current'}"
+        standings_round, rows = self.standings_client.standings(kind, str(season), round_number)
+        standings_round = standings_round or round_number
+        if standings_round is not None and rows:
+            self.archive.put_standings(kind, season, standings_round, rows)
+            result.fetched_rounds.append(standings_round)
+
+    def _missing_standings(self, season: int, latest_race_round: int | None) -> list[tuple[int, str]]:
+        if latest_race_round is None:
+            return []
+        races = self.archive.round_numbers(season, RACE)
+        stored = {kind: self.archive.standings_rounds(season, kind) for kind in (DRIVER, CONSTRUCTOR)}
+        return [
+            (round_number, kind)
+            for round_number in sorted(races, reverse=True)
+            for kind in (DRIVER, CONSTRUCTOR)
+            if round_number not in stored[kind]
+        ]
+
+    def _archive_finished_meetings(self, year: int, meetings: list[dict[str, Any]]) -> list[int]:
+        now = self.clock()
+        archived = self.archive.meeting_keys(year)
+        fetched: list[int] = []
+        for row in meetings:
+            meeting_key = row.get("meeting_key")
+            end = parse_utc_timestamp(row.get("date_end"))
+            if meeting_key is None or int(meeting_key) in archived or end is None or end > now:
+                continue
+            if len(fetched) >= MAX_MEETINGS_PER_SYNC:
+                break
+            try:
+                sessions = self.client.sessions(int(meeting_key))
+            except (AttributeError, OpenF1Error):
+                break
+            self.archive.put_meeting(row, sessions)
+            fetched.append(int(meeting_key))
+        return fetched
@@ -2,12 +2,29 @@ from __future__ import annotations
 
 import json
 import os
+import time
+from collections import Counter
 from dataclasses import asdict
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable
-
-from f1dashboard.cache import MemoryTTLCache
+from threading import Lock, Thread
+from typing import Any, Callable, Iterable
+
+from f1dashboard.admission import AdmissionGate, Overloaded
+from f1dashboard.archive import CONSTRUCTOR, DRIVER, QUALIFYING, RACE, SeasonArchive
+from f1dashboard.assets import AssetStore
+from f1dashboard.cache import MemoryTTLCache, SQLiteTTLCache
+from f1dashboard.compression import EncodedBody
+from f1dashboard.decoding import (
+    LAP_PAYLOAD_FIELDS,
+    LAPS,
+    MEETINGS,
+    RACE_CONTROL,
+    SESSIONS,
+    DecodeError,
+)
+from f1dashboard.leader import RefreshLease, lease_from_env
 from f1dashboard.models import (
     ChampionshipStandingRow,
     ClassificationRow,
@@ -17,12 +34,43 @@ from f1dashboard.models import (
     PositionSample,
     RaceControlMessage,
     Session,
+    StandingsHistoryPoint,
     VenueContext,
     WeatherForecastDay,
 )
 from f1dashboard.providers.jolpica import JolpicaClient, JolpicaError
-from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error, parse_utc_timestamp
+from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error, OpenF1Query, parse_utc_timestamp
 from f1dashboard.providers.venue import VenueClient, VenueError
+from f1dashboard.registry import EntityRegistry
+from f1dashboard.schedule import RESULTS, STANDINGS, VENUE, RefreshPlan, plan_refresh
+from f1dashboard.services.archive_sync import ArchiveSync, SyncResult
+from f1dashboard.services.forecast import ForecastCache, ForecastResult
+from f1dashboard.services.lap_analytics import LapAnalytics, LapMetrics
+from f1dashboard.services.pit_analytics import PitAnalytics, PitStopBreakdown
+from f1dashboard.standings import StandingsEngine
+
+# Only these fields of OpenF1 position rows are used; the rest is dropped while decoding.
+POSITION_FIELDS = ("date", "driver_number", "position")
+DRIVER_FIELDS = ("driver_number", "full_name", "first_name", "last_name", "broadcast_name", "name_acronym", "team_name")
+
+# Position requests resume this far before the newest row already seen, so
+# rows OpenF1 publishes late (with an earlier timestamp) are still picked up.
+POSITION_CURSOR_OVERLAP_SECONDS = 5
+
+SNAPSHOT_CACHE_KEY = "dashboard:snapshot"
+SNAPSHOT_TTL_SECONDS = 600
+
+# Analytics the leader builds with the snapshot, served by their own endpoints.
+PIT_STOPS_CACHE_KEY = "dashboard:pit-stops"
+LAP_METRICS_CACHE_KEY = "dashboard:laps"
+
+# Followers without any snapshot to serve wait this long for the leader, then
+# answer 503 rather than building next to it.
+SNAPSHOT_BUILD_WAIT_SECONDS = 30.0
+SNAPSHOT_BUILD_POLL_SECONDS = 0.25
+
+# Forecasts are warmed for this many meetings after the current one.
+FORECAST_PREFETCH_MEETINGS = 2
 
 
 class DashboardService:
@@ -31,25 +79,198 @@ class DashboardService:
         client: OpenF1Client | None = None,
         standings_client: JolpicaClient | None = None,
         venue_client: VenueClient | None = None,
-        cache: MemoryTTLCache[DashboardSnapshot] | None = None,
+        cache: MemoryTTLCache[DashboardSnapshot] | SQLiteTTLCache[DashboardSnapshot] | None = None,
         clock: Callable[[], datetime] | None = None,
         snapshot_cache_path: str | None = None,
+        asset_store: AssetStore | None = None,
+        refresh_lease: RefreshLease | None = None,
+        archive: SeasonArchive | None = None,
+        admission: AdmissionGate | None = None,
     ) -> None:
         self.client = client or OpenF1Client()
         self.standings_client = standings_client or JolpicaClient()
-        self.venue_client = venue_client or VenueClient()
-        self.cache = cache or MemoryTTLCache[DashboardSnapshot]()
+        # Snapshot rows share the registry's driver and team names; venue
+        # lookups resolve to its circuit records.
+        self.registry = EntityRegistry()
+        self.venue_client = venue_client or VenueClient(registry=self.registry)
         self.clock = clock or (lambda: datetime.now(timezone.utc))
         configured_cache_path = snapshot_cache_path or os.getenv("DASHBOARD_SNAPSHOT_CACHE_PATH")
         self.snapshot_cache_path = Path(configured_cache_path).expanduser() if configured_cache_path else None
+        shared_cache_path = os.getenv("DASHBOARD_SHARED_CACHE_PATH") if cache is None else None
+        if cache is None:
+            if shared_cache_path:
+                cache = SQLiteTTLCache[DashboardSnapshot](shared_cache_path, encode=_encode_snapshot, decode=_decode_snapshot)
+            else:
+                cache = MemoryTTLCache[DashboardSnapshot]()
+        self.cache = cache
+        # Analytics payloads live next to the snapshot, so followers serve the
+        # leader's figures instead of fetching them per request.
+        if shared_cache_path:
+            self.analytics_cache: MemoryTTLCache[dict[str, Any]] | SQLiteTTLCache[dict[str, Any]] = SQLiteTTLCache[dict[str, Any]](
+                shared_cache_path, encode=json.dumps, decode=json.loads
+            )
+        else:
+            self.analytics_cache = MemoryTTLCache[dict[str, Any]]()
+        # A configured TTL pins the refresh interval; otherwise it follows the
+        # race-weekend calendar (see `plan_refresh`).
+        configured_ttl = os.getenv("DASHBOARD_CACHE_TTL_SECONDS")
+        self.fixed_ttl_seconds = int(configured_ttl) if configured_ttl else None
+        self.cache_ttl_seconds = self.fixed_ttl_seconds or SNAPSHOT_TTL_SECONDS
+        self.refresh_plan: RefreshPlan | None = None
+        # Only the lease holder runs the provider pipeline. Each build extends
+        # the lease past its planned next refresh, so the leader keeps it
+        # between refreshes however far apart the plan spaces them.
+        self.refresh_lease = refresh_lease or lease_from_env(
+            shared_cache_path,
+            lease_seconds=self.cache_ttl_seconds + SNAPSHOT_BUILD_WAIT_SECONDS,
+        )
+        # Every build runs under this lock: builds share the refresh plan,
+        # position cursors, standings engines and registry. Requests arriving
+        # mid-build wait for it and take its snapshot instead of building again.
+        self._build_lock = Lock()
+        self._builds_completed = 0
+        self._last_built: DashboardSnapshot | None = None
+        self._background_refresh = Lock()
+        self.admission = admission or AdmissionGate()
+        if asset_store is None:
+            configured_asset_dir = os.getenv("DASHBOARD_ASSET_DIR")
+            if configured_asset_dir:
+                asset_store = AssetStore(Path(configured_asset_dir).expanduser())
+            elif self.snapshot_cache_path is not None:
+                asset_store = AssetStore(self.snapshot_cache_path.parent / "assets")
+            else:
+                asset_store = AssetStore()
+        self.asset_store = asset_store
+        if archive is None and os.getenv("DASHBOARD_ARCHIVE_PATH"):
+            archive = SeasonArchive(os.environ["DASHBOARD_ARCHIVE_PATH"])
+        self.archive = archive
+        self.archive_sync = ArchiveSync(archive, self.standings_client, self.client, clock=self.clock) if archive is not None else None
+        self.standings_engines = {DRIVER: StandingsEngine(), CONSTRUCTOR: StandingsEngine()}
+        self.forecasts = ForecastCache(self.venue_client, clock=self.clock)
+        self.pit_analytics = PitAnalytics(self.client, clock=self.clock)
+        self.lap_analytics = LapAnalytics(self.client, clock=self.clock)
+        # The current season's OpenF1 meetings as fetched by the last build,
+        # handed to the archive sync so it does not fetch them again.
+        self._season_meetings: list[dict[str, Any]] = []
+        # For the current session only: the newest position timestamp seen and
+        # the latest row per driver, so later refreshes only ask OpenF1 for
+        # rows since (shortly before) that cursor.
+        self._position_cursors: dict[int, tuple[datetime | None, dict[int, tuple[datetime, dict[str, Any]]]]] = {}
+        self._encoded: tuple[datetime, EncodedBody] | None = None
+        # Provider rows rejected while decoding, per endpoint.
+        self.decode_errors: Counter[str] = Counter()
+        self._encoded_lock = Lock()
+
+    def warm_start(self) -> DashboardSnapshot | None:
+        """Load the persisted snapshot into the cache before serving traffic.
+
+        It is stored as already expired: requests are answered from it right
+        away while the first refresh runs in the background.
+        """
+        cached = self.cache.get_stale(SNAPSHOT_CACHE_KEY)
+        if cached is not None:
+            return cached
+        snapshot = self._load_persisted_snapshot()
+        if snapshot is not None:
+            self.cache.set(SNAPSHOT_CACHE_KEY, snapshot, ttl_seconds=0)
+            print(f"INFO: warm start from persisted snapshot generated at {snapshot.generated_at_utc.isoformat()}")
+        return snapshot
 
-    def get_snapshot(self, refresh: bool = False) -> DashboardSnapshot:
-        cache_key = "dashboard:snapshot"
+    def refresh_in_background(self) -> bool:
+        """Start a snapshot refresh on a daemon thread unless one is already running."""
+        if not self._background_refresh.acquire(blocking=False):
+            return False
+
+        def run() -> None:
+            try:
+                self.get_snapshot(refresh=True, reuse_sections=True)
+            except Exception as exc:  # noqa: BLE001 - keep serving the stale snapshot
+                print(f"WARNING: background dashboard refresh failed: {exc}")
+            finally:
+                self._background_refresh.release()
+
+        Thread(target=run, name="dashboard-refresh", daemon=True).start()
+        return True
+
+    def snapshot_expires_at(self, snapshot: DashboardSnapshot) -> datetime:
+        """When the shared cache stops serving `snapshot` as fresh."""
+        if snapshot.next_refresh_utc is not None:
+            return _as_utc(snapshot.next_refresh_utc)
+        return _as_utc(snapshot.generated_at_utc) + timedelta(seconds=self.cache_ttl_seconds)
+
+    def get_snapshot(self, refresh: bool = False, reuse_sections: bool = False) -> DashboardSnapshot:
+        """Return the cached snapshot, or rebuild it.
+
+        An explicit `refresh` rebuilds every section unless `reuse_sections`
+        lets sections that are not due yet come from the previous snapshot.
+        """
+        cache_key = SNAPSHOT_CACHE_KEY
         if not refresh:
             cached = self.cache.get(cache_key)
             if cached is not None:
                 return cached
 
+        if self.refresh_lease.acquire():
+            if not refresh:
+                # Serve the expired snapshot at once and rebuild off the request path.
+                stale_snapshot = self.cache.get_stale(cache_key)
+                if stale_snapshot is not None:
+                    self.refresh_in_background()
+                    return stale_snapshot
+            return self._build_once(cache_key, reset_plan=refresh and not reuse_sections)
+        # Followers only read: serve what the leader last built, or wait for
+        # its first snapshot rather than multiplying provider traffic.
+        stale_snapshot = self._stale_snapshot(cache_key)
+        if stale_snapshot is not None:
+            return stale_snapshot
+        deadline = time.monotonic() + SNAPSHOT_BUILD_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(SNAPSHOT_BUILD_POLL_SECONDS)
+            cached = self._stale_snapshot(cache_key)
+            if cached is not None:
+                return cached
+            # Only build once the leader's lease has actually run out.
+            if self.refresh_lease.acquire():
+                return self._build_once(cache_key)
+        print("WARNING: no dashboard snapshot from the refresh leader yet; not building one as a follower")
+        raise Overloaded(self.admission.retry_after_seconds)
+
+    def serve_snapshot(self) -> tuple[DashboardSnapshot, bool]:
+        """The snapshot for an API request, and whether it is served stale.
+
+        A fresh cached snapshot needs no admission. Otherwise the request
+        takes an admission slot; when none frees up in time the last snapshot
+        is served as is, and `Overloaded` is only raised when there is none.
+        A snapshot the shared cache no longer holds as fresh (an expired one
+        served while the leader rebuilds) counts as stale.
+        """
+        cached = self.cache.get(SNAPSHOT_CACHE_KEY)
+        if cached is not None:
+            return cached, False
+        try:
+            with self.admission.admit():
+                snapshot = self.get_snapshot()
+            return snapshot, self.cache.get(SNAPSHOT_CACHE_KEY) is None
+        except Overloaded:
+            stale_snapshot = self._stale_snapshot(SNAPSHOT_CACHE_KEY)
+            if stale_snapshot is None:
+                raise
+            return stale_snapshot, True
+
+    def _build_once(self, cache_key: str, reset_plan: bool = False) -> DashboardSnapshot:
+        """Build under the build lock; a caller that waited on another build gets that build's snapshot."""
+        builds_seen = self._builds_completed
+        with self._build_lock:
+            if self._builds_completed != builds_seen and self._last_built is not None:
+                return self._last_built
+            if reset_plan:
+                self.refresh_plan = None
+            snapshot = self._build_snapshot(cache_key)
+            self._last_built = snapshot
+            self._builds_completed += 1
+            return snapshot
+
+    def _build_snapshot(self, cache_key: str) -> DashboardSnapshot:
         critical_provider_error = False
         latest_session_raw = None
         stale_snapshot = self._stale_snapshot(cache_key)
@@ -59,8 +280,10 @@ class DashboardService:
         except (AttributeError, OpenF1Error):
             latest_session_raw = None
 
+        upcoming_meeting_rows: list[dict[str, Any]] = []
         try:
-            meeting_raw = self._next_meeting_row()
+            upcoming_meeting_rows = self._upcoming_meeting_rows()
+            meeting_raw = upcoming_meeting_rows[0] if upcoming_meeting_rows else None
         except OpenF1Error:
             meeting_raw = None
             critical_provider_error = True
@@ -81,7 +304,8 @@ class DashboardService:
         session_rows = self._open_session_rows(meeting_raw)
 
         meeting = self._meeting_from_raw(meeting_raw) if meeting_raw else None
-        sessions = [self._session_from_raw(row) for row in session_rows]
+        self.registry.start_season(_as_utc(self.clock()).year)
+        sessions = SESSIONS.decode_all(session_rows, self.decode_errors, date_start_utc=self.clock())
 
         # The dashboard is intentionally focused on the next session, venue,
         # the latest qualifying/race result, and the two championship tables.
@@ -89,11 +313,51 @@ class DashboardService:
         latest_positions: list[PositionSample] = []
         latest_laps: list[LapSample] = []
         race_control: list[RaceControlMessage] = []
-        latest_results = self._latest_completed_results(latest_session_raw)
-
-        driver_standings = self._driver_standings()
-        constructor_standings = self._constructor_standings()
-        venue = self._venue_context(meeting_raw, latest_session_raw, latest_laps)
+        # Sections that are not due yet are carried over from the previous
+        # snapshot, so between weekends only the schedule is fetched.
+        now = _as_utc(self.clock())
+        previous = stale_snapshot if self.refresh_plan is not None else None
+
+        if previous is not None and not self.refresh_plan.is_due(RESULTS, now):
+            latest_results = previous.latest_results
+            archive_state = None
+        else:
+            archive_state = self._sync_archive(latest_session_raw)
+            latest_results = self._latest_completed_results(latest_session_raw, archive_state)
+
+        if previous is not None and not self.refresh_plan.is_due(STANDINGS, now):
+            driver_standings = previous.driver_standings
+            constructor_standings = previous.constructor_standings
+        else:
+            if archive_state is None:
+                archive_state = self._sync_archive(latest_session_raw)
+            driver_standings = self._driver_standings(archive_state)
+            constructor_standings = self._constructor_standings(archive_state)
+
+        same_meeting = (
+            previous is not None
+            and previous.meeting is not None
+            and meeting is not None
+            and previous.meeting.meeting_key == meeting.meeting_key
+        )
+        lap_metrics: LapMetrics | None = None
+        pit_breakdown: PitStopBreakdown | None = None
+        if same_meeting and not self.refresh_plan.is_due(VENUE, now):
+            venue = previous.venue
+        else:
+            # OpenF1 analytics do not depend on the circuit lookup below.
+            lap_metrics = self.lap_analytics.session(latest_session_raw)
+            pit_breakdown = self.meeting_pit_breakdown(latest_session_raw)
+            venue = self._venue_context(meeting_raw, lap_metrics, pit_breakdown)
+            self._prefetch_forecasts(upcoming_meeting_rows[1 : 1 + FORECAST_PREFETCH_MEETINGS])
+
+        last_session_end = parse_utc_timestamp(latest_session_raw.get("date_end")) if latest_session_raw else None
+        plan = plan_refresh(sessions, now, last_session_end)
+        if self.fixed_ttl_seconds is not None:
+            fixed_due = now + timedelta(seconds=self.fixed_ttl_seconds)
+            plan = RefreshPlan(phase=plan.phase, due_utc={section: fixed_due for section in plan.due_utc})
+        self.refresh_plan = plan
+        ttl_seconds = max(1, int((plan.next_refresh_utc - now).total_seconds()))
 
         snapshot = DashboardSnapshot(
             meeting=meeting,
@@ -106,11 +370,38 @@ class DashboardService:
             constructor_standings=constructor_standings,
             venue=venue,
             generated_at_utc=self.clock(),
+            next_refresh_utc=plan.next_refresh_utc,
         )
-        self.cache.set(cache_key, snapshot, ttl_seconds=600)
+        self.cache.set(cache_key, snapshot, ttl_seconds=ttl_seconds)
+        if lap_metrics is not None:
+            self.analytics_cache.set(LAP_METRICS_CACHE_KEY, asdict(lap_metrics), ttl_seconds=ttl_seconds)
+        if pit_breakdown is not None:
+            self.analytics_cache.set(PIT_STOPS_CACHE_KEY, asdict(pit_breakdown), ttl_seconds=ttl_seconds)
+        self.refresh_lease.extend(ttl_seconds + SNAPSHOT_BUILD_WAIT_SECONDS)
         self._persist_snapshot(snapshot)
+        # Compress on the refreshing thread rather than on the first request.
+        self.encoded_snapshot(snapshot)
         return snapshot
 
+    def pit_stops(self) -> dict[str, Any]:
+        """The pit-stop breakdown the leader built last; an empty one until then."""
+        return self.analytics_cache.get_stale(PIT_STOPS_CACHE_KEY) or asdict(PitStopBreakdown())
+
+    def lap_metrics(self) -> dict[str, Any]:
+        """The lap metrics the leader built last; empty ones until then."""
+        return self.analytics_cache.get_stale(LAP_METRICS_CACHE_KEY) or asdict(LapMetrics())
+
+    def encoded_snapshot(self, snapshot: DashboardSnapshot) -> EncodedBody:
+        """The snapshot's JSON body with its gzip/brotli variants, built once per snapshot."""
+        version = snapshot.generated_at_utc
+        with self._encoded_lock:
+            if self._encoded is not None and self._encoded[0] == version:
+                return self._encoded[1]
+        encoded = EncodedBody.encode(_encode_snapshot(snapshot).encode("utf-8"))
+        with self._encoded_lock:
+            self._encoded = (version, encoded)
+        return encoded
+
     def _snapshot_has_open_or_future_session(self, snapshot: DashboardSnapshot) -> bool:
         now = _as_utc(self.clock())
         return any(self._session_is_open_or_future(session.date_start_utc, session.date_end_utc, now) for session in snapshot.sessions)
@@ -121,26 +412,30 @@ class DashboardService:
             return cached
         return self._load_persisted_snapshot()
 
-    def _next_meeting_row(self) -> dict[str, Any] | None:
+    def _upcoming_meeting_rows(self) -> list[dict[str, Any]]:
         now = _as_utc(self.clock())
         candidate_rows: list[dict[str, Any]] = []
         years = [now.year, now.year + 1]
+        self._season_meetings = []
         for year in years:
             try:
-                candidate_rows.extend(self.client.meetings(year))
+                rows = self.client.meetings(year)
+                if year == now.year:
+                    self._season_meetings = rows
+                candidate_rows.extend(rows)
             except AttributeError:
                 # Compatibility for tests/older clients: fall back to the old latest endpoint.
                 latest = self.client.latest_meeting()
-                return latest if self._meeting_has_future_time(latest, now) else None
+                return [latest] if self._meeting_has_future_time(latest, now) else []
             except OpenF1Error:
                 if not candidate_rows:
                     raise
 
             future_rows = [row for row in candidate_rows if self._meeting_has_future_time(row, now)]
             if future_rows:
-                return sorted(future_rows, key=lambda row: parse_utc_timestamp(row.get("date_start")) or datetime.max.replace(tzinfo=timezone.utc))[0]
+                return sorted(future_rows, key=lambda row: parse_utc_timestamp(row.get("date_start")) or datetime.max.replace(tzinfo=timezone.utc))
 
-        return None
+        return []
 
     def _meeting_has_future_time(self, row: dict[str, Any] | None, now: datetime) -> bool:
         if not row or row.get("is_cancelled") is True:
@@ -151,34 +446,20 @@ class DashboardService:
             return end > now
         return start is not None and start > now
 
-    def _meeting_from_raw(self, raw: dict[str, Any]) -> Meeting:
-        return Meeting(
-            meeting_key=int(raw["meeting_key"]),
-            meeting_name=str(raw.get("meeting_name", "")),
-            meeting_official_name=raw.get("meeting_official_name"),
-            location=raw.get("location"),
-            country_code=raw.get("country_code"),
-            country_name=raw.get("country_name"),
-        )
-
-    def _session_from_raw(self, raw: dict[str, Any]) -> Session:
-        start = parse_utc_timestamp(raw.get("date_start")) or self.clock()
-        end = parse_utc_timestamp(raw.get("date_end"))
-        return Session(
-            session_key=int(raw["session_key"]),
-            meeting_key=int(raw["meeting_key"]),
-            session_name=str(raw.get("session_name", raw.get("session_type", "Session"))),
-            session_type=str(raw.get("session_type", "unknown")),
-            date_start_utc=start,
-            date_end_utc=end,
-        )
+    def _meeting_from_raw(self, raw: dict[str, Any]) -> Meeting | None:
+        try:
+            return MEETINGS.decode(raw)
+        except DecodeError as exc:
+            self.decode_errors[MEETINGS.endpoint] += 1
+            print(f"INFO: skipped {exc}")
+            return None
 
     def _open_session_rows(self, meeting_raw: dict[str, Any] | None) -> list[dict[str, Any]]:
         if not meeting_raw:
             return []
 
         try:
-            rows = self.client.sessions(int(meeting_raw["meeting_key"]))
+            rows = self._meeting_sessions(int(meeting_raw["meeting_key"]))
         except (KeyError, OpenF1Error):
             rows = []
 
@@ -192,8 +473,12 @@ class DashboardService:
         meeting_key = _optional_int(meeting_raw.get("meeting_key"))
         if meeting_key is None:
             return []
+        query = self._query("sessions")
         try:
-            rows = self.client.future_sessions(now.isoformat())
+            if query is not None:
+                rows = query.filter(meeting_key=meeting_key, date_end__gt=now).fetch()
+            else:
+                rows = self.client.future_sessions(now.isoformat())
         except (AttributeError, OpenF1Error):
             return []
         return [
@@ -215,15 +500,42 @@ class DashboardService:
             return True
         return end is None or end > now
 
-    def _position_rows(self, session_raw: dict[str, Any] | None) -> list[dict[str, Any]]:
+    def _query(self, endpoint: str) -> OpenF1Query | None:
+        """Start a pushdown query, or return None for clients without `query()`."""
+        try:
+            return self.client.query(endpoint)
+        except AttributeError:
+            return None
+
+    def _position_rows(self, session_raw: dict[str, Any] | None, since: datetime | None = None) -> Iterable[dict[str, Any]]:
+        """Return position rows for the session, streamed when the client supports it.
+
+        With `since`, only rows newer than that timestamp are requested from
+        OpenF1. Streaming errors surface while iterating, so callers catch
+        `OpenF1Error` around their loop rather than around this call.
+        """
         if not session_raw:
             return []
         try:
-            return self.client.positions(int(session_raw["session_key"]))
-        except (KeyError, OpenF1Error):
+            session_key = int(session_raw["session_key"])
+        except (KeyError, TypeError, ValueError):
+            return []
+        query = self._query("position")
+        if query is not None:
+            query = query.filter(session_key=session_key)
+            if since is not None:
+                query = query.filter(date__gt=since)
+            return query.select(*POSITION_FIELDS).iter()
+        try:
+            return self.client.iter_positions(session_key, fields=POSITION_FIELDS)
+        except AttributeError:
+            pass
+        try:
+            return self.client.positions(session_key)
+        except OpenF1Error:
             return []
 
-    def _latest_positions(self, session_raw: dict[str, Any] | None, rows: list[dict[str, Any]] | None = None) -> list[PositionSample]:
+    def _latest_positions(self, session_raw: dict[str, Any] | None, rows: Iterable[dict[str, Any]] | None = None) -> list[PositionSample]:
         if not session_raw:
             return []
         session_key = int(session_raw["session_key"])
@@ -231,85 +543,96 @@ class DashboardService:
         if rows is None:
             rows = self._position_rows(session_raw)
         parsed: list[PositionSample] = []
-        for row in rows:
-            parsed.append(
-                PositionSample(
-                    date_utc=parse_utc_timestamp(row["date"]) or self.clock(),
-                    session_key=session_key,
-                    meeting_key=meeting_key,
-                    driver_number=int(row["driver_number"]),
-                    position=int(row["position"]),
+        try:
+            for row in rows:
+                parsed.append(
+                    PositionSample(
+                        date_utc=parse_utc_timestamp(row["date"]) or self.clock(),
+                        session_key=session_key,
+                        meeting_key=meeting_key,
+                        driver_number=int(row["driver_number"]),
+                        position=int(row["position"]),
+                    )
                 )
-            )
-        return parsed[:20]
+                if len(parsed) == 20:
+                    break
+        except OpenF1Error:
+            return []
+        return parsed
 
     def _latest_laps(self, session_raw: dict[str, Any] | None) -> list[LapSample]:
         if not session_raw:
             return []
         session_key = int(session_raw["session_key"])
         meeting_key = int(session_raw["meeting_key"])
+        query = self._query("laps")
         try:
-            rows = self.client.laps(session_key)
+            # Stop the stream after the rows that are shown instead of
+            # downloading every lap of the session.
+            if query is not None:
+                rows = islice(query.filter(session_key=session_key).select("driver_number", "lap_number", "date_start", *LAP_PAYLOAD_FIELDS).iter(), 20)
+            else:
+                rows = self.client.laps(session_key)[:20]
+            return LAPS.decode_all(rows, self.decode_errors, meeting_key=meeting_key, session_key=session_key)
         except OpenF1Error:
             return []
-        parsed: list[LapSample] = []
-        for row in rows[:20]:
-            payload = dict(row)
-            parsed.append(
-                LapSample(
-                    meeting_key=meeting_key,
-                    session_key=session_key,
-                    driver_number=int(row["driver_number"]),
-                    lap_number=int(row["lap_number"]),
-                    date_start_utc=parse_utc_timestamp(row.get("date_start")),
-                    payload=payload,
-                )
-            )
-        return parsed
 
     def _latest_race_control(self, session_raw: dict[str, Any] | None) -> list[RaceControlMessage]:
         if not session_raw:
             return []
         session_key = int(session_raw["session_key"])
         meeting_key = int(session_raw["meeting_key"])
+        query = self._query("race_control")
         try:
-            rows = self.client.race_control(session_key)
+            if query is not None:
+                rows = islice(query.filter(session_key=session_key).select("date", "category", "message").iter(), 30)
+            else:
+                rows = self.client.race_control(session_key)[:30]
+            return RACE_CONTROL.decode_all(rows, self.decode_errors, meeting_key=meeting_key, session_key=session_key, date_utc=self.clock())
         except OpenF1Error:
             return []
-        parsed: list[RaceControlMessage] = []
-        for row in rows[:30]:
-            parsed.append(
-                RaceControlMessage(
-                    meeting_key=meeting_key,
-                    session_key=session_key,
-                    date_utc=parse_utc_timestamp(row["date"]) or self.clock(),
-                    category=row.get("category"),
-                    message=str(row.get("message", "")),
-                )
-            )
-        return parsed
 
-    def _latest_completed_results(self, fallback_session_raw: dict[str, Any] | None = None) -> list[ClassificationRow]:
+    def _sync_archive(self, latest_session_raw: dict[str, Any] | None = None) -> SyncResult | None:
+        """Advance the season archive by at most one Jolpica request; results and standings are then read locally."""
+        if self.archive_sync is None:
+            return None
+        return self.archive_sync.sync(self._season_meetings, last_session=latest_session_raw)
+
+    def _meeting_sessions(self, meeting_key: int) -> list[dict[str, Any]]:
+        """Sessions of a meeting: from the archive once the meeting is finished, otherwise from OpenF1."""
+        if self.archive is not None:
+            archived = self.archive.sessions(meeting_key)
+            if archived:
+                return archived
+        return self.client.sessions(meeting_key)
+
+    def _latest_completed_results(
+        self,
+        fallback_session_raw: dict[str, Any] | None = None,
+        archive_state: SyncResult | None = None,
+    ) -> list[ClassificationRow]:
         race_result: dict[str, Any] | None = None
         qualifying_result: dict[str, Any] | None = None
-        try:
-            race_result = self.standings_client.latest_race_results()
-        except (AttributeError, JolpicaError):
-            race_result = None
-        try:
-            qualifying_result = self.standings_client.latest_qualifying_results()
-        except (AttributeError, JolpicaError):
-            qualifying_result = None
+        if archive_state is not None and (archive_state.latest_race_round is not None or archive_state.latest_qualifying_round is not None):
+            if archive_state.latest_race_round is not None:
+                race_result = self.archive.race(archive_state.season, archive_state.latest_race_round, RACE)
+            if archive_state.latest_qualifying_round is not None:
+                qualifying_result = self.archive.race(archive_state.season, archive_state.latest_qualifying_round, QUALIFYING)
+        else:
+            try:
+                race_result = self.standings_client.latest_race_results()
+            except (AttributeError, JolpicaError):
+                race_result = None
+            try:
+                qualifying_result = self.standings_client.latest_qualifying_results()
+            except (AttributeError, JolpicaError):
+                qualifying_result = None
 
         selected = self._newer_jolpica_event(race_result, qualifying_result)
         if selected is race_result and race_result is not None:
-            rows = race_result.get("Results", [])
-            parsed = [self._classification_from_jolpica_race_row(row, "Race result") for row in rows]
-            return [row for row in parsed if row is not None]
+            return self.registry.race_results.decode_all(race_result.get("Results", []), self.decode_errors, status="Race result")
         if selected is qualifying_result and qualifying_result is not None:
-            rows = qualifying_result.get("QualifyingResults", [])
-            parsed = [self._classification_from_jolpica_qualifying_row(row, "Qualifying result") for row in rows]
-            return [row for row in parsed if row is not None]
+            return self.registry.qualifying_results.decode_all(qualifying_result.get("QualifyingResults", []), self.decode_errors)
 
         # Fallback for tests/local development when Jolpica does not provide result endpoints.
         return self._latest_results(fallback_session_raw)
@@ -332,56 +655,28 @@ class DashboardService:
             return race_result
         return qualifying_result if qualifying_time > race_time else race_result
 
-    def _classification_from_jolpica_race_row(self, row: dict[str, Any], status: str) -> ClassificationRow | None:
-        driver = row.get("Driver", {})
-        constructor = row.get("Constructor", {})
-        driver_number = _optional_int(row.get("number") or driver.get("permanentNumber"))
-        return ClassificationRow(
-            position=_optional_int(row.get("position")),
-            driver_number=driver_number,
-            driver_name=_jolpica_driver_name(driver, driver_number),
-            team_name=constructor.get("name"),
-            points=_optional_float(row.get("points")),
-            status=status,
-        )
-
-    def _classification_from_jolpica_qualifying_row(self, row: dict[str, Any], status: str) -> ClassificationRow | None:
-        driver = row.get("Driver", {})
-        constructor = row.get("Constructor", {})
-        driver_number = _optional_int(row.get("number") or driver.get("permanentNumber"))
-        best_time = row.get("Q3") or row.get("Q2") or row.get("Q1")
-        return ClassificationRow(
-            position=_optional_int(row.get("position")),
-            driver_number=driver_number,
-            driver_name=_jolpica_driver_name(driver, driver_number),
-            team_name=constructor.get("name"),
-            points=None,
-            status=f"{status} · {best_time}" if best_time else status,
-        )
-
-    def _latest_results(self, session_raw: dict[str, Any] | None, position_rows: list[dict[str, Any]] | None = None) -> list[ClassificationRow]:
+    def _latest_results(self, session_raw: dict[str, Any] | None, position_rows: Iterable[dict[str, Any]] | None = None) -> list[ClassificationRow]:
         if not session_raw:
             return []
 
         session_key = int(session_raw["session_key"])
         if position_rows is None:
-            position_rows = self._position_rows(session_raw)
+            latest_by_driver = self._latest_position_by_driver(session_raw)
+        else:
+            latest_by_driver = {}
+            try:
+                _fold_latest_by_driver(position_rows, latest_by_driver)
+            except OpenF1Error:
+                latest_by_driver = {}
+        query = self._query("drivers")
         try:
-            driver_rows = self.client.drivers(session_key)
+            if query is not None:
+                driver_rows = query.filter(session_key=session_key).select(*DRIVER_FIELDS).fetch()
+            else:
+                driver_rows = self.client.drivers(session_key)
         except OpenF1Error:
             driver_rows = []
 
-        latest_by_driver: dict[int, dict[str, Any]] = {}
-        for row in position_rows:
-            driver_number = _optional_int(row.get("driver_number"))
-            if driver_number is None:
-                continue
-            row_date = parse_utc_timestamp(row.get("date")) or datetime.min.replace(tzinfo=timezone.utc)
-            previous = latest_by_driver.get(driver_number)
-            previous_date = parse_utc_timestamp(previous.get("date")) if previous else None
-            if previous is None or previous_date is None or row_date >= previous_date:
-                latest_by_driver[driver_number] = row
-
         drivers_by_number = {
             int(row["driver_number"]): row
             for row in driver_rows
@@ -390,7 +685,7 @@ class DashboardService:
 
         session_name = str(session_raw.get("session_name", session_raw.get("session_type", "Session")))
         parsed: list[ClassificationRow] = []
-        sorted_positions = sorted(latest_by_driver.values(), key=lambda row: _optional_int(row.get("position")) or 999)
+        sorted_positions = sorted((row for _, row in latest_by_driver.values()), key=lambda row: _optional_int(row.get("position")) or 999)
         for row in sorted_positions:
             driver_number = _optional_int(row.get("driver_number"))
             if driver_number is None:
@@ -400,142 +695,165 @@ class DashboardService:
                 ClassificationRow(
                     position=_optional_int(row.get("position")),
                     driver_number=driver_number,
-                    driver_name=_driver_display_name(driver, driver_number),
-                    team_name=driver.get("team_name"),
+                    driver_name=self.registry.openf1_driver(driver, driver_number).name,
+                    team_name=self.registry.team_name(driver.get("team_name")),
                     points=None,
                     status=session_name,
                 )
             )
         return parsed
 
-    def _driver_standings(self) -> list[ChampionshipStandingRow]:
-        try:
-            rows = self.standings_client.driver_standings()
-        except JolpicaError:
-            return []
-
-        parsed: list[ChampionshipStandingRow] = []
-        for row in rows:
-            driver = row.get("Driver", {})
-            given_name = str(driver.get("givenName", "")).strip()
-            family_name = str(driver.get("familyName", "")).strip()
-            competitor_name = " ".join(part for part in [given_name, family_name] if part) or str(driver.get("driverId", "Unknown driver"))
-            parsed.append(
-                ChampionshipStandingRow(
-                    position=_optional_int(row.get("position")),
-                    competitor_name=competitor_name,
-                    points=_float_or_zero(row.get("points")),
-                    wins=_optional_int(row.get("wins")),
-                    gap=None,
-                )
-            )
-        return parsed
+    def _latest_position_by_driver(self, session_raw: dict[str, Any]) -> dict[int, tuple[datetime, dict[str, Any]]]:
+        """Fold position rows into the latest row per driver, resuming from the session's cursor.
 
-    def _constructor_standings(self) -> list[ChampionshipStandingRow]:
+        Only rows from shortly before the previous refresh's newest timestamp
+        are requested, so a live session costs a few dozen rows per refresh
+        instead of every sample since lights out. Rows seen twice in the
+        overlap fold to the same result. Cursors of earlier sessions are
+        dropped.
+        """
+        session_key = int(session_raw["session_key"])
+        cursor, previous = self._position_cursors.get(session_key, (None, {}))
+        latest_by_driver = dict(previous)
+        since = cursor - timedelta(seconds=POSITION_CURSOR_OVERLAP_SECONDS) if cursor is not None else None
         try:
-            rows = self.standings_client.constructor_standings()
-        except JolpicaError:
-            return []
+            newest = _fold_latest_by_driver(self._position_rows(session_raw, since=since), latest_by_driver)
+        except OpenF1Error:
+            return previous
+        if newest is not None and (cursor is None or newest > cursor):
+            cursor = newest
+        self._position_cursors = {session_key: (cursor, latest_by_driver)}
+        return latest_by_driver
+
+    def _archived_standings(self, archive_state: SyncResult | None, kind: str) -> list[dict[str, Any]] | None:
+        # The archive keeps the newest standings current (including sprint
+        # points); Jolpica is only asked directly while it has none yet.
+        if archive_state is None or archive_state.season is None:
+            return None
+        rounds = self.archive.standings_rounds(archive_state.season, kind)
+        if not rounds:
+            return None
+        return self.archive.standings(archive_state.season, max(rounds), kind) or None
 
-        parsed: list[ChampionshipStandingRow] = []
-        for row in rows:
-            constructor = row.get("Constructor", {})
-            competitor_name = str(constructor.get("name") or constructor.get("constructorId") or "Unknown constructor")
-            parsed.append(
-                ChampionshipStandingRow(
-                    position=_optional_int(row.get("position")),
-                    competitor_name=competitor_name,
-                    points=_float_or_zero(row.get("points")),
-                    wins=_optional_int(row.get("wins")),
-                    gap=None,
-                )
-            )
-        return parsed
+    def _driver_standings(self, archive_state: SyncResult | None = None) -> list[ChampionshipStandingRow]:
+        rows = self._archived_standings(archive_state, DRIVER)
+        if rows is None:
+            try:
+                rows = self.standings_client.driver_standings()
+            except JolpicaError:
+                return []
+        engine = self._standings_history(archive_state, DRIVER, self.registry.driver_standings.decode_all)
+        return engine.annotate(self.registry.driver_standings.decode_all(rows, self.decode_errors))
+
+    def _constructor_standings(self, archive_state: SyncResult | None = None) -> list[ChampionshipStandingRow]:
+        rows = self._archived_standings(archive_state, CONSTRUCTOR)
+        if rows is None:
+            try:
+                rows = self.standings_client.constructor_standings()
+            except JolpicaError:
+                return []
+        engine = self._standings_history(archive_state, CONSTRUCTOR, self.registry.constructor_standings.decode_all)
+        return engine.annotate(self.registry.constructor_standings.decode_all(rows, self.decode_errors))
 
+    def _standings_history(
+        self,
+        archive_state: SyncResult | None,
+        kind: str,
+        parse: Callable[[list[dict[str, Any]]], list[ChampionshipStandingRow]],
+    ) -> StandingsEngine:
+        """Feed archived rounds the engine has not seen yet; earlier rounds are never re-read."""
+        engine = self.standings_engines[kind]
+        if archive_state is None or archive_state.season is None:
+            return engine
+        applied = engine.rounds if engine.season == archive_state.season else set()
+        for round_number in sorted(self.archive.standings_rounds(archive_state.season, kind) - applied):
+            engine.apply_round(archive_state.season, round_number, parse(self.archive.standings(archive_state.season, round_number, kind)))
+        return engine
 
     def _venue_context(
         self,
         meeting_raw: dict[str, Any] | None,
-        session_raw: dict[str, Any] | None,
-        latest_laps: list[LapSample],
+        lap_metrics: LapMetrics,
+        pit_breakdown: PitStopBreakdown,
     ) -> VenueContext | None:
         if not meeting_raw:
             return None
 
         try:
-            circuit_details = self.venue_client.resolve_circuit(meeting_raw)
+            circuit_details = self.venue_client.resolve_circuit(meeting_raw) or {}
         except VenueError:
-            return None
+            circuit_details = {}
+        fastest_lap_seconds = lap_metrics.fastest_lap_seconds
+        average_pit_stop_seconds = pit_breakdown.average_seconds
         if not circuit_details:
-            return None
-
-        fastest_lap_seconds = self._fastest_lap_seconds(latest_laps)
-        average_pit_stop_seconds = self._average_pit_stop_seconds(self._pit_rows(session_raw))
+            if fastest_lap_seconds is None and average_pit_stop_seconds is None:
+                return None
+            # Keep the OpenF1 figures when the circuit lookup fails.
+            circuit_details = {"circuit_name": meeting_raw.get("circuit_short_name")}
 
         weather_forecast: list[WeatherForecastDay] = []
+        forecast = ForecastResult()
         latitude = circuit_details.get("latitude")
         longitude = circuit_details.get("longitude")
         start_date = parse_utc_timestamp(meeting_raw.get("date_start"))
         end_date = parse_utc_timestamp(meeting_raw.get("date_end")) or start_date
         if latitude is not None and longitude is not None and start_date and end_date:
-            try:
-                forecast_rows = self.venue_client.weather_forecast(latitude, longitude, start_date.date(), end_date.date())
-                weather_forecast = [WeatherForecastDay(**row) for row in forecast_rows]
-            except VenueError:
-                weather_forecast = []
+            forecast = self.forecasts.get(latitude, longitude, start_date.date(), end_date.date())
+            weather_forecast = [WeatherForecastDay(**row) for row in forecast.days]
 
         return VenueContext(
             circuit_name=str(circuit_details.get("circuit_name") or "Track"),
             circuit_short_name=circuit_details.get("circuit_short_name"),
             circuit_image_url=circuit_details.get("circuit_image_url"),
             circuit_wiki_url=circuit_details.get("circuit_wiki_url"),
-            track_map_svg=circuit_details.get("track_map_svg"),
+            track_map_url=self._track_map_url(circuit_details.get("track_map_svg")),
             track_length_km=circuit_details.get("track_length_km"),
             fastest_lap_seconds=fastest_lap_seconds,
             average_pit_stop_seconds=average_pit_stop_seconds,
             weather_forecast=weather_forecast,
+            weather_forecast_fetched_at_utc=forecast.fetched_at_utc,
+            weather_forecast_is_stale=forecast.is_stale,
         )
 
-    def _pit_rows(self, session_raw: dict[str, Any] | None) -> list[dict[str, Any]]:
-        if not session_raw:
-            return []
-        try:
-            return self.client.pit(int(session_raw["session_key"]))
-        except (AttributeError, KeyError, OpenF1Error):
-            return []
-
-    def _fastest_lap_seconds(self, latest_laps: list[LapSample]) -> float | None:
-        lap_durations = [
-            float(duration)
-            for duration in (row.payload.get("lap_duration") for row in latest_laps)
-            if isinstance(duration, (int, float))
-        ]
-        if not lap_durations:
-            return None
-        return min(lap_durations)
-
-    def _average_pit_stop_seconds(self, pit_rows: list[dict[str, Any]]) -> float | None:
-        durations = []
-        for row in pit_rows:
-            value = row.get("pit_duration")
-            if value in (None, ""):
-                value = row.get("stop_duration")
-            if value in (None, ""):
-                value = row.get("lane_duration")
-            duration = _optional_float(value)
-            if duration is None:
+    def _prefetch_forecasts(self, meeting_rows: list[dict[str, Any]]) -> None:
+        locations: list[tuple[float, float, date, date]] = []
+        for row in meeting_rows:
+            start = parse_utc_timestamp(row.get("date_start"))
+            end = parse_utc_timestamp(row.get("date_end")) or start
+            if start is None or end is None:
                 continue
-            durations.append(duration / 100.0 if duration > 100 else duration)
-        if not durations:
+            try:
+                coordinates = self.venue_client.locate(row)
+            except AttributeError:
+                return
+            if coordinates is not None:
+                locations.append((coordinates[0], coordinates[1], start.date(), end.date()))
+        self.forecasts.prefetch(locations)
+
+    def _track_map_url(self, track_map_svg: str | None) -> str | None:
+        # The outline only changes between events; publish it as an immutable,
+        # content-addressed asset instead of inlining it in every snapshot.
+        if not track_map_svg:
             return None
-        return sum(durations) / len(durations)
+        return self.asset_store.put(track_map_svg.encode("utf-8"), "svg").url
+
+    def meeting_pit_breakdown(self, session_raw: dict[str, Any] | None) -> PitStopBreakdown:
+        """Pit-stop statistics for every session so far of `session_raw`'s meeting."""
+        if not session_raw or session_raw.get("meeting_key") is None:
+            return PitStopBreakdown()
+        meeting_key = int(session_raw["meeting_key"])
+        try:
+            session_rows = self._meeting_sessions(meeting_key)
+        except (AttributeError, OpenF1Error):
+            session_rows = [session_raw]
+        return self.pit_analytics.breakdown(meeting_key, session_rows)
 
     def _persist_snapshot(self, snapshot: DashboardSnapshot) -> None:
         if self.snapshot_cache_path is None:
             return
         try:
             self.snapshot_cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.snapshot_cache_path.write_text(json.dumps(asdict(snapshot), default=_json_default), encoding="utf-8")
+            self.snapshot_cache_path.write_text(_encode_snapshot(snapshot), encoding="utf-8")
         except OSError:
             return
 
@@ -543,24 +861,60 @@ class DashboardService:
         if self.snapshot_cache_path is None or not self.snapshot_cache_path.exists():
             return None
         try:
-            payload = json.loads(self.snapshot_cache_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            return None
-        if not isinstance(payload, dict):
-            return None
-        try:
-            return _snapshot_from_dict(payload)
-        except (KeyError, TypeError, ValueError):
+            return _decode_snapshot(self.snapshot_cache_path.read_text(encoding="utf-8"))
+        except OSError:
             return None
 
 
+def _fold_latest_by_driver(
+    rows: Iterable[dict[str, Any]],
+    latest_by_driver: dict[int, tuple[datetime, dict[str, Any]]],
+) -> datetime | None:
+    """Keep the latest row per driver in place and return the newest row timestamp.
+
+    Rows arrive one at a time from the stream, so memory does not grow with
+    the session length.
+    """
+    newest: datetime | None = None
+    for row in rows:
+        driver_number = _optional_int(row.get("driver_number"))
+        if driver_number is None:
+            continue
+        row_date = parse_utc_timestamp(row.get("date"))
+        if row_date is not None and (newest is None or row_date > newest):
+            newest = row_date
+        row_date = row_date or datetime.min.replace(tzinfo=timezone.utc)
+        previous = latest_by_driver.get(driver_number)
+        if previous is None or row_date >= previous[0]:
+            latest_by_driver[driver_number] = (row_date, row)
+    return newest
+
+
 def _as_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
         return value.replace(tzinfo=timezone.utc)
     return value.astimezone(timezone.utc)
 
 
-def _json_default(value: Any) -> str:
+def _encode_snapshot(snapshot: DashboardSnapshot) -> str:
+    return json.dumps(asdict(snapshot), default=json_default)
+
+
+def _decode_snapshot(text: str) -> DashboardSnapshot | None:
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    try:
+        return _snapshot_from_dict(payload)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def json_default(value: Any) -> str:
+    """`json.dumps` default for API payloads: datetimes as UTC ISO 8601 with a `Z` suffix."""
     if isinstance(value, datetime):
         return _as_utc(value).isoformat().replace("+00:00", "Z")
     raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -578,6 +932,7 @@ def _snapshot_from_dict(payload: dict[str, Any]) -> DashboardSnapshot:
         constructor_standings=[_championship_row_from_dict(row) for row in payload.get("constructor_standings", [])],
         generated_at_utc=parse_utc_timestamp(payload["generated_at_utc"]) or datetime.now(timezone.utc),
         venue=_venue_from_dict(payload.get("venue")),
+        next_refresh_utc=parse_utc_timestamp(payload.get("next_refresh_utc")),
     )
 
 
@@ -664,11 +1019,13 @@ def _venue_from_dict(payload: dict[str, Any] | None) -> VenueContext | None:
         circuit_short_name=payload.get("circuit_short_name"),
         circuit_image_url=payload.get("circuit_image_url"),
         circuit_wiki_url=payload.get("circuit_wiki_url"),
-        track_map_svg=payload.get("track_map_svg"),
+        track_map_url=payload.get("track_map_url"),
         track_length_km=_optional_float(payload.get("track_length_km")),
         fastest_lap_seconds=_optional_float(payload.get("fastest_lap_seconds")),
         average_pit_stop_seconds=_optional_float(payload.get("average_pit_stop_seconds")),
         weather_forecast=[_weather_day_from_dict(row) for row in payload.get("weather_forecast", [])],
+        weather_forecast_fetched_at_utc=parse_utc_timestamp(payload.get("weather_forecast_fetched_at_utc")),
+        weather_forecast_is_stale=bool(payload.get("weather_forecast_is_stale", False)),
     )
 
 
@@ -678,7 +1035,18 @@ def _championship_row_from_dict(payload: dict[str, Any]) -> ChampionshipStanding
         competitor_name=str(payload.get("competitor_name") or "Unknown competitor"),
         points=_float_or_zero(payload.get("points")),
         wins=_optional_int(payload.get("wins")),
+        competitor_id=payload.get("competitor_id"),
         gap=payload.get("gap"),
+        gap_to_leader=_optional_float(payload.get("gap_to_leader")),
+        gap_to_ahead=_optional_float(payload.get("gap_to_ahead")),
+        history=[
+            StandingsHistoryPoint(
+                round=int(point["round"]),
+                position=_optional_int(point.get("position")),
+                points=_float_or_zero(point.get("points")),
+            )
+            for point in payload.get("history", [])
+        ],
     )
 
 
@@ -690,40 +1058,6 @@ def _jolpica_event_datetime(event: dict[str, Any]) -> datetime | None:
     return parse_utc_timestamp(f"{date}T{time}")
 
 
-def _jolpica_driver_name(driver: dict[str, Any], driver_number: int | None) -> str:
-    given_name = str(driver.get("givenName", "")).strip()
-    family_name = str(driver.get("familyName", "")).strip()
-    name = " ".join(part for part in [given_name, family_name] if part)
-    if name:
-        return name
-    driver_id = str(driver.get("driverId", "")).strip()
-    if driver_id:
-        return driver_id
-    return f"Driver {driver_number}" if driver_number is not None else "Unknown driver"
-
-
-def _driver_display_name(driver: dict[str, Any], driver_number: int) -> str:
-    full_name = str(driver.get("full_name", "")).strip()
-    if full_name:
-        return full_name
-
-    first_name = str(driver.get("first_name", "")).strip()
-    last_name = str(driver.get("last_name", "")).strip()
-    name = " ".join(part for part in [first_name, last_name] if part)
-    if name:
-        return name
-
-    broadcast_name = str(driver.get("broadcast_name", "")).strip()
-    if broadcast_name:
-        return broadcast_name
-
-    acronym = str(driver.get("name_acronym", "")).strip()
-    if acronym:
-        return acronym
-
-    return f"Driver {driver_number}"
-
-
 def _optional_int(value: Any) -> int | None:
     if value in (None, ""):
         return None
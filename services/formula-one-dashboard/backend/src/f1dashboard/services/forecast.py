@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Protocol
+
+from f1dashboard.cache import MemoryTTLCache
+from f1dashboard.providers.venue import VenueError
+
+# Open-Meteo's blended forecast is driven by global models that run every
+# three hours (00, 03, ... UTC) and show up in the API roughly 45 minutes
+# after the run. Refreshing more often than that only returns the same data.
+MODEL_RUN_INTERVAL = timedelta(hours=3)
+MODEL_PUBLICATION_DELAY = timedelta(minutes=45)
+
+# Daily forecasts are only available this far ahead.
+FORECAST_HORIZON = timedelta(days=16)
+
+# Two decimals is about one kilometre, well inside a single model grid cell.
+COORDINATE_PRECISION = 2
+
+# Stale forecasts are kept this long after expiry as a fallback when
+# Open-Meteo is unreachable.
+STALE_RETENTION = timedelta(days=2)
+
+
+class ForecastProvider(Protocol):
+    def weather_forecast(self, latitude: float, longitude: float, start_date: date, end_date: date) -> list[dict[str, Any]]: ...
+
+
+@dataclass(slots=True)
+class CachedForecast:
+    days: list[dict[str, Any]]
+    fetched_at_utc: datetime
+    expires_at_utc: datetime
+
+
+@dataclass(slots=True)
+class ForecastResult:
+    days: list[dict[str, Any]] = field(default_factory=list)
+    fetched_at_utc: datetime | None = None
+    is_stale: bool = False
+
+
+class ForecastCache:
+    def __init__(
+        self,
+        provider: ForecastProvider,
+        cache: MemoryTTLCache[CachedForecast] | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self.provider = provider
+        self.cache = cache or MemoryTTLCache[CachedForecast]()
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+
+    def get(self, latitude: float, longitude: float, start_date: date, end_date: date) -> ForecastResult:
+        key = forecast_cache_key(latitude, longitude, start_date, end_date)
+        now = self.clock()
+        cached = self.cache.get_stale(key)
+        if cached is not None and cached.expires_at_utc > now:
+            return ForecastResult(days=cached.days, fetched_at_utc=cached.fetched_at_utc)
+
+        try:
+            days = self.provider.weather_forecast(
+                round(latitude, COORDINATE_PRECISION),
+                round(longitude, COORDINATE_PRECISION),
+                start_date,
+                end_date,
+            )
+        except VenueError:
+            if cached is None:
+                return ForecastResult()
+            return ForecastResult(days=cached.days, fetched_at_utc=cached.fetched_at_utc, is_stale=True)
+
+        entry = CachedForecast(days=days, fetched_at_utc=now, expires_at_utc=next_model_update(now))
+        # The underlying TTL only bounds how long a stale fallback is kept;
+        # freshness is decided by `expires_at_utc` against the injected clock.
+        self.cache.set(key, entry, ttl_seconds=int((entry.expires_at_utc - now + STALE_RETENTION).total_seconds()))
+        return ForecastResult(days=days, fetched_at_utc=now)
+
+    def prefetch(self, locations: list[tuple[float, float, date, date]]) -> int:
+        """Warm the cache for upcoming meetings; returns the number of upstream calls."""
+        now = self.clock()
+        horizon = (now + FORECAST_HORIZON).date()
+        fetched = 0
+        for latitude, longitude, start_date, end_date in locations:
+            if start_date > horizon or end_date < now.date():
+                continue
+            cached = self.cache.get_stale(forecast_cache_key(latitude, longitude, start_date, end_date))
+            if cached is not None and cached.expires_at_utc > now:
+                continue
+            self.get(latitude, longitude, start_date, end_date)
+            fetched += 1
+        return fetched
+
+
+def forecast_cache_key(latitude: float, longitude: float, start_date: date, end_date: date) -> str:
+    return (
+        f"forecast:{round(latitude, COORDINATE_PRECISION):.{COORDINATE_PRECISION}f}:"
+        f"{round(longitude, COORDINATE_PRECISION):.{COORDINATE_PRECISION}f}:"
+        f"{start_date.isoformat()}:{end_date.isoformat()}"
+    )
+
+
+def next_model_update(now: datetime) -> datetime:
+    """Return when the next model run after `now` becomes available upstream."""
+    now = now.astimezone(timezone.utc)
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    runs_since_midnight = (now - MODEL_PUBLICATION_DELAY - midnight) // MODEL_RUN_INTERVAL
+    return midnight + (runs_since_midnight + 1) * MODEL_RUN_INTERVAL + MODEL_PUBLICATION_DELAY
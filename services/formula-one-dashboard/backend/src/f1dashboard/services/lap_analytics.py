@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Callable
+
+from f1dashboard.analytics import coded_slopes, grouped_slopes, optional_numpy, summarize_codes, summarize_groups
+from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error, parse_utc_timestamp
+from f1dashboard.services.pit_analytics import SESSION_FINAL_AFTER
+
+LAP_FIELDS = ("driver_number", "lap_number", "lap_duration", "duration_sector_1", "duration_sector_2", "duration_sector_3", "is_pit_out_lap")
+STINT_FIELDS = ("driver_number", "stint_number", "compound", "lap_start", "lap_end", "tyre_age_at_start")
+
+# Laps slower than this share of the driver's median (safety car, traffic,
+# in-laps) are left out of pace and degradation figures.
+SLOW_LAP_FACTOR = 1.07
+
+# Laps are matched to stints on driver * LAP_KEY_SPAN + lap number.
+LAP_KEY_SPAN = 10_000
+
+
+@dataclass(slots=True)
+class DriverPace:
+    driver_number: int
+    laps: int
+    best_lap_seconds: float
+    median_lap_seconds: float
+
+
+@dataclass(slots=True)
+class StintSummary:
+    driver_number: int
+    stint_number: int
+    compound: str | None
+    laps: int
+    degradation_seconds_per_lap: float | None = None
+
+
+@dataclass(slots=True)
+class LapMetrics:
+    session_key: int | None = None
+    fastest_lap_seconds: float | None = None
+    fastest_lap_driver_number: int | None = None
+    best_sector_seconds: list[float | None] = field(default_factory=lambda: [None, None, None])
+    driver_pace: list[DriverPace] = field(default_factory=list)
+    stints: list[StintSummary] = field(default_factory=list)
+
+
+class LapAnalytics:
+    """Lap and stint metrics for a session, computed column-wise.
+
+    Metrics of a finished session never change, so they are kept for good;
+    running sessions are recomputed from fresh `laps`/`stints` rows.
+    """
+
+    def __init__(self, client: OpenF1Client, clock: Callable[[], datetime] | None = None) -> None:
+        self.client = client
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self._final: dict[int, LapMetrics] = {}
+        self._lock = Lock()
+
+    def session(self, session_row: dict[str, Any] | None) -> LapMetrics:
+        if not session_row or session_row.get("session_key") is None:
+            return LapMetrics()
+        session_key = int(session_row["session_key"])
+        with self._lock:
+            cached = self._final.get(session_key)
+        if cached is not None:
+            return cached
+        try:
+            lap_rows = self._rows("laps", session_key, LAP_FIELDS)
+        except OpenF1Error:
+            return LapMetrics(session_key=session_key)
+        try:
+            stint_rows = self._rows("stints", session_key, STINT_FIELDS) if lap_rows else []
+        except (AttributeError, OpenF1Error):
+            stint_rows = []
+        metrics = lap_metrics(session_key, lap_rows, stint_rows)
+        end = parse_utc_timestamp(session_row.get("date_end"))
+        if lap_rows and end is not None and end + SESSION_FINAL_AFTER <= self.clock():
+            with self._lock:
+                self._final[session_key] = metrics
+        return metrics
+
+    def _rows(self, endpoint: str, session_key: int, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+        try:
+            query = self.client.query(endpoint)
+        except AttributeError:
+            return getattr(self.client, endpoint)(session_key)
+        return query.filter(session_key=session_key).select(*fields).fetch()
+
+
+def lap_metrics(session_key: int | None, lap_rows: list[dict[str, Any]], stint_rows: list[dict[str, Any]]) -> LapMetrics:
+    """Fastest lap, best sectors, per-driver pace and per-stint degradation.
+
+    With NumPy installed the rows are turned into columns once and every
+    figure is a column operation; laps are matched to stints with a
+    `searchsorted` over the stints' first laps.
+    """
+    numpy = optional_numpy()
+    if numpy is None:
+        return _lap_metrics_python(session_key, lap_rows, stint_rows)
+    metrics = LapMetrics(session_key=session_key)
+    drivers = _column(numpy, lap_rows, "driver_number", _int)
+    lap_numbers = _column(numpy, lap_rows, "lap_number", _int)
+    durations = _column(numpy, lap_rows, "lap_duration", _float)
+    pit_out = numpy.fromiter((bool(row.get("is_pit_out_lap")) for row in lap_rows), dtype=bool, count=len(lap_rows))
+    best_sectors: list[float | None] = []
+    for sector in (1, 2, 3):
+        column = _column(numpy, lap_rows, f"duration_sector_{sector}", _float)
+        column[column == 0] = numpy.nan
+        best_sectors.append(None if numpy.isnan(column).all() else float(numpy.nanmin(column)))
+    metrics.best_sector_seconds = best_sectors
+
+    timed = numpy.flatnonzero(~numpy.isnan(drivers) & ~numpy.isnan(durations) & ~pit_out)
+    if not timed.size:
+        return metrics
+    drivers, lap_numbers, durations = drivers[timed], lap_numbers[timed], durations[timed]
+    fastest = int(numpy.argmin(durations))
+    metrics.fastest_lap_seconds = float(durations[fastest])
+    metrics.fastest_lap_driver_number = int(drivers[fastest])
+
+    driver_labels, driver_codes = numpy.unique(drivers, return_inverse=True)
+    pace = summarize_codes(driver_codes, durations, len(driver_labels))
+    metrics.driver_pace = sorted(
+        (
+            DriverPace(driver_number=int(driver), laps=summary.count, best_lap_seconds=summary.minimum, median_lap_seconds=summary.median)
+            for driver, summary in zip(driver_labels, pace)
+        ),
+        key=lambda row: (row.median_lap_seconds, row.driver_number),
+    )
+
+    stint_drivers = _column(numpy, stint_rows, "driver_number", _int)
+    stint_numbers = _column(numpy, stint_rows, "stint_number", _int)
+    lap_starts = _column(numpy, stint_rows, "lap_start", _int)
+    lap_ends = _column(numpy, stint_rows, "lap_end", _int)
+    valid = numpy.flatnonzero(~(numpy.isnan(stint_drivers) | numpy.isnan(stint_numbers) | numpy.isnan(lap_starts) | numpy.isnan(lap_ends)))
+    if not valid.size:
+        return metrics
+    stint_drivers, stint_numbers, lap_starts, lap_ends = stint_drivers[valid], stint_numbers[valid], lap_starts[valid], lap_ends[valid]
+
+    # A lap belongs to the driver's stint with the latest first lap at or
+    # before it, provided the stint has not ended yet.
+    order = numpy.lexsort((lap_starts, stint_drivers))
+    start_keys = stint_drivers[order] * LAP_KEY_SPAN + lap_starts[order]
+    found = numpy.searchsorted(start_keys, drivers * LAP_KEY_SPAN + lap_numbers, side="right") - 1
+    stint = order[numpy.clip(found, 0, None)]
+    in_stint = (found >= 0) & ~numpy.isnan(lap_numbers) & (stint_drivers[stint] == drivers) & (lap_numbers <= lap_ends[stint])
+    # Degradation: lap time over lap number within each stint, on the
+    # representative laps only.
+    medians = numpy.array([summary.median for summary in pace])
+    fitted = in_stint & (durations <= medians[driver_codes] * SLOW_LAP_FACTOR)
+    slopes = coded_slopes(stint[fitted], lap_numbers[fitted], durations[fitted], len(valid))
+
+    stints: dict[tuple[int, int], StintSummary] = {}
+    for index, row_index in enumerate(valid):
+        driver, stint_number = int(stint_drivers[index]), int(stint_numbers[index])
+        stints[(driver, stint_number)] = StintSummary(
+            driver_number=driver,
+            stint_number=stint_number,
+            compound=stint_rows[row_index].get("compound"),
+            laps=int(lap_ends[index] - lap_starts[index]) + 1,
+            degradation_seconds_per_lap=slopes[index],
+        )
+    metrics.stints = sorted(stints.values(), key=lambda row: (row.driver_number, row.stint_number))
+    return metrics
+
+
+def _lap_metrics_python(session_key: int | None, lap_rows: list[dict[str, Any]], stint_rows: list[dict[str, Any]]) -> LapMetrics:
+    """`lap_metrics` without NumPy: the same figures from plain loops."""
+    drivers = [_int(row.get("driver_number")) for row in lap_rows]
+    lap_numbers = [_int(row.get("lap_number")) for row in lap_rows]
+    durations = [_float(row.get("lap_duration")) for row in lap_rows]
+    timed = [
+        index
+        for index, duration in enumerate(durations)
+        if duration is not None and drivers[index] is not None and not lap_rows[index].get("is_pit_out_lap")
+    ]
+    metrics = LapMetrics(session_key=session_key)
+    metrics.best_sector_seconds = [
+        min(filter(None, (_float(row.get(f"duration_sector_{sector}")) for row in lap_rows)), default=None) for sector in (1, 2, 3)
+    ]
+    if not timed:
+        return metrics
+
+    fastest = min(timed, key=durations.__getitem__)
+    metrics.fastest_lap_seconds = durations[fastest]
+    metrics.fastest_lap_driver_number = drivers[fastest]
+
+    pace = summarize_groups([drivers[index] for index in timed], [durations[index] for index in timed])
+    metrics.driver_pace = sorted(
+        (
+            DriverPace(driver_number=driver, laps=summary.count, best_lap_seconds=summary.minimum, median_lap_seconds=summary.median)
+            for driver, summary in pace.items()
+        ),
+        key=lambda row: (row.median_lap_seconds, row.driver_number),
+    )
+
+    # Each lap's stint, from the stint with the latest first lap at or before it.
+    stints: dict[tuple[int, int], StintSummary] = {}
+    spans: dict[int, list[tuple[int, int, int]]] = {}
+    for row in stint_rows:
+        driver, stint_number = _int(row.get("driver_number")), _int(row.get("stint_number"))
+        lap_start, lap_end = _int(row.get("lap_start")), _int(row.get("lap_end"))
+        if driver is None or stint_number is None or lap_start is None or lap_end is None:
+            continue
+        stints[(driver, stint_number)] = StintSummary(
+            driver_number=driver, stint_number=stint_number, compound=row.get("compound"), laps=lap_end - lap_start + 1
+        )
+        spans.setdefault(driver, []).append((lap_start, lap_end, stint_number))
+
+    keys: list[tuple[int, int]] = []
+    x: list[float] = []
+    y: list[float] = []
+    for index in timed:
+        driver, lap_number = drivers[index], lap_numbers[index]
+        if lap_number is None or durations[index] > pace[driver].median * SLOW_LAP_FACTOR:
+            continue
+        started = [span for span in spans.get(driver, []) if span[0] <= lap_number]
+        if not started:
+            continue
+        lap_start, lap_end, stint_number = max(started, key=lambda span: span[0])
+        if lap_number > lap_end:
+            continue
+        keys.append((driver, stint_number))
+        x.append(float(lap_number))
+        y.append(durations[index])
+    for key, slope in grouped_slopes(keys, x, y).items():
+        stints[key].degradation_seconds_per_lap = slope
+    metrics.stints = sorted(stints.values(), key=lambda row: (row.driver_number, row.stint_number))
+    return metrics
+
+
+def _column(numpy, rows: list[dict[str, Any]], key: str, parse: Callable[[Any], float | int | None]):
+    """One float column of `rows`; missing or unparsable values are NaN."""
+    return numpy.fromiter(
+        (numpy.nan if (value := parse(row.get(key))) is None else value for row in rows),
+        dtype=float,
+        count=len(rows),
+    )
+
+
+def _int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
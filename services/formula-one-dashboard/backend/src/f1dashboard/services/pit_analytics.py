@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Any, Callable
+
+from f1dashboard.analytics import GroupSummary, summarize_groups
+from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error, parse_utc_timestamp
+
+PIT_FIELDS = ("date", "driver_number", "lap_number", "pit_duration", "stop_duration", "lane_duration")
+DRIVER_TEAM_FIELDS = ("driver_number", "team_name")
+
+# Sessions of one meeting are fetched at most this many at a time.
+PIT_FETCH_CONCURRENCY = 3
+
+# OpenF1 may still amend pit rows shortly after a session; after this they
+# are final and cached for good.
+SESSION_FINAL_AFTER = timedelta(hours=1)
+
+# Pit lane times beyond this are red-flag or garage stops, not pit stops.
+MAX_PIT_STOP_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class SessionPitStops:
+    session_key: int
+    session_name: str
+    # One entry per stop: (driver_number, team_name, seconds).
+    stops: list[tuple[int, str | None, float]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PitStopSummary:
+    name: str
+    stops: int
+    average_seconds: float
+    median_seconds: float
+    fastest_seconds: float
+
+
+@dataclass(slots=True)
+class PitStopBreakdown:
+    meeting_key: int | None = None
+    stops: int = 0
+    average_seconds: float | None = None
+    median_seconds: float | None = None
+    by_session: list[PitStopSummary] = field(default_factory=list)
+    by_team: list[PitStopSummary] = field(default_factory=list)
+
+
+class PitAnalytics:
+    """Pit-stop statistics over every session of a meeting.
+
+    Sessions are fetched concurrently (bounded by `max_workers`) and kept
+    forever once final, so a rebuild only asks OpenF1 for sessions that are
+    still running.
+    """
+
+    def __init__(
+        self,
+        client: OpenF1Client,
+        clock: Callable[[], datetime] | None = None,
+        max_workers: int = PIT_FETCH_CONCURRENCY,
+    ) -> None:
+        self.client = client
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.max_workers = max_workers
+        self._final: dict[int, SessionPitStops] = {}
+        self._lock = Lock()
+
+    def breakdown(self, meeting_key: int, session_rows: list[dict[str, Any]]) -> PitStopBreakdown:
+        now = self.clock()
+        started = [
+            row
+            for row in session_rows
+            if row.get("session_key") is not None and (parse_utc_timestamp(row.get("date_start")) or now) <= now
+        ]
+        with self._lock:
+            cached = dict(self._final)
+        pending = [row for row in started if int(row["session_key"]) not in cached]
+        fetched: list[tuple[dict[str, Any], SessionPitStops | None]] = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending)), thread_name_prefix="pit-fetch") as executor:
+                fetched = list(zip(pending, executor.map(self._fetch_session, pending)))
+
+        for row, session in fetched:
+            end = parse_utc_timestamp(row.get("date_end"))
+            if session is None:
+                continue
+            cached[session.session_key] = session
+            if end is not None and end + SESSION_FINAL_AFTER <= now:
+                with self._lock:
+                    self._final[session.session_key] = session
+        sessions = [cached[int(row["session_key"])] for row in started if int(row["session_key"]) in cached]
+        return summarize_pit_stops(meeting_key, sessions)
+
+    def _fetch_session(self, session_row: dict[str, Any]) -> SessionPitStops | None:
+        session_key = int(session_row["session_key"])
+        try:
+            pit_rows = self._rows("pit", session_key, PIT_FIELDS)
+        except OpenF1Error:
+            return None
+        teams: dict[int, str | None] = {}
+        if pit_rows:
+            try:
+                teams = {
+                    int(row["driver_number"]): row.get("team_name")
+                    for row in self._rows("drivers", session_key, DRIVER_TEAM_FIELDS)
+                    if row.get("driver_number") is not None
+                }
+            except OpenF1Error:
+                teams = {}
+        stops = []
+        for row in pit_rows:
+            seconds = pit_stop_seconds(row)
+            if seconds is None or row.get("driver_number") is None:
+                continue
+            driver_number = int(row["driver_number"])
+            stops.append((driver_number, teams.get(driver_number), seconds))
+        session_name = str(session_row.get("session_name") or session_row.get("session_type") or session_key)
+        return SessionPitStops(session_key=session_key, session_name=session_name, stops=stops)
+
+    def _rows(self, endpoint: str, session_key: int, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+        try:
+            query = self.client.query(endpoint)
+        except AttributeError:
+            return getattr(self.client, endpoint)(session_key)
+        return query.filter(session_key=session_key).select(*fields).fetch()
+
+
+def pit_stop_seconds(row: dict[str, Any]) -> float | None:
+    """Pit lane time of a stop in seconds, or None when missing or implausible."""
+    for key in ("pit_duration", "stop_duration", "lane_duration"):
+        value = row.get(key)
+        if value in (None, ""):
+            continue
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            return None
+        return seconds if 0 < seconds <= MAX_PIT_STOP_SECONDS else None
+    return None
+
+
+def summarize_pit_stops(meeting_key: int | None, sessions: list[SessionPitStops]) -> PitStopBreakdown:
+    session_names = [session.session_name for session in sessions for _ in session.stops]
+    teams = [team or "Unknown" for session in sessions for _, team, _ in session.stops]
+    durations = [seconds for session in sessions for _, _, seconds in session.stops]
+    if not durations:
+        return PitStopBreakdown(meeting_key=meeting_key)
+    overall = summarize_groups(["all"] * len(durations), durations)["all"]
+    return PitStopBreakdown(
+        meeting_key=meeting_key,
+        stops=overall.count,
+        average_seconds=overall.mean,
+        median_seconds=overall.median,
+        by_session=[_summary(name, summary) for name, summary in summarize_groups(session_names, durations).items()],
+        by_team=sorted(
+            (_summary(team, summary) for team, summary in summarize_groups(teams, durations).items()),
+            key=lambda row: row.median_seconds,
+        ),
+    )
+
+
+def _summary(name: Any, summary: GroupSummary) -> PitStopSummary:
+    return PitStopSummary(
+        name=str(name),
+        stops=summary.count,
+        average_seconds=summary.mean,
+        median_seconds=summary.median,
+        fastest_seconds=summary.minimum,
+    )
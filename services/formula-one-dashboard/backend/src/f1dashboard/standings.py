@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from bisect import insort
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+
+from f1dashboard.models import ChampionshipStandingRow, StandingsHistoryPoint
+
+
+@dataclass(slots=True)
+class StandingsEngine:
+    """Per-round championship series with points gaps.
+
+    Rounds are applied one at a time as they are archived, in any order (the
+    archive backfills newest first). Series are keyed by competitor id, so a
+    renamed team keeps its history. Applying a round only inserts one point
+    per competitor, so a refresh costs O(competitors) however far into the
+    season it is.
+    """
+
+    season: int | None = None
+    rounds: set[int] = field(default_factory=set)
+    series: dict[str, list[StandingsHistoryPoint]] = field(default_factory=dict)
+
+    def apply_round(self, season: int, round_number: int, rows: Iterable[ChampionshipStandingRow]) -> bool:
+        """Add the standings after `round_number`; returns False if the round is already applied."""
+        if season != self.season:
+            self.season = season
+            self.rounds = set()
+            self.series = {}
+        if round_number in self.rounds:
+            return False
+        for row in rows:
+            insort(
+                self.series.setdefault(_series_key(row), []),
+                StandingsHistoryPoint(round=round_number, position=row.position, points=row.points),
+                key=lambda point: point.round,
+            )
+        self.rounds.add(round_number)
+        return True
+
+    def annotate(self, rows: list[ChampionshipStandingRow]) -> list[ChampionshipStandingRow]:
+        """Return `rows` with gaps to the leader and the car ahead, and each competitor's series."""
+        ordered = sorted(rows, key=lambda row: (row.position is None, row.position or 0, -row.points))
+        annotated: list[ChampionshipStandingRow] = []
+        leader_points = ordered[0].points if ordered else 0.0
+        ahead_points: float | None = None
+        for row in ordered:
+            gap_to_leader = leader_points - row.points if ahead_points is not None else None
+            annotated.append(
+                replace(
+                    row,
+                    gap=format_gap(gap_to_leader),
+                    gap_to_leader=gap_to_leader,
+                    gap_to_ahead=ahead_points - row.points if ahead_points is not None else None,
+                    history=list(self.series.get(_series_key(row), ())),
+                )
+            )
+            ahead_points = row.points
+        return annotated
+
+
+def _series_key(row: ChampionshipStandingRow) -> str:
+    return row.competitor_id or row.competitor_name
+
+
+def format_gap(points: float | None) -> str | None:
+    if points is None:
+        return None
+    return f"-{points:g}"
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from f1dashboard.admission import AdmissionGate, Overloaded
+
+
+def test_requests_beyond_the_queue_are_shed_at_once() -> None:
+    gate = AdmissionGate(max_active=1, max_queued=0, retry_after_seconds=7)
+
+    with gate.admit():
+        with pytest.raises(Overloaded) as excinfo:
+            with gate.admit():
+                pass
+
+    assert excinfo.value.retry_after_seconds == 7
+    assert (gate.stats.admitted, gate.stats.shed, gate.stats.active) == (1, 1, 0)
+
+
+def test_queued_requests_give_up_after_the_queue_timeout() -> None:
+    gate = AdmissionGate(max_active=1, max_queued=1, queue_timeout_seconds=0.01)
+
+    with gate.admit():
+        with pytest.raises(Overloaded):
+            with gate.admit():
+                pass
+
+    with gate.admit():
+        pass
+    assert (gate.stats.queued, gate.stats.shed, gate.stats.waiting, gate.stats.admitted) == (1, 1, 0, 2)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+from json import loads
+
+import pytest
+
+from f1dashboard import api
+from f1dashboard.admission import STALE_WARNING, AdmissionGate
+from f1dashboard.archive import SeasonArchive
+from f1dashboard.cache import MemoryTTLCache
+from f1dashboard.models import DashboardSnapshot, Session
+from f1dashboard.services.dashboard import LAP_METRICS_CACHE_KEY, PIT_STOPS_CACHE_KEY, SNAPSHOT_CACHE_KEY, DashboardService
+from f1dashboard.services.lap_analytics import LapMetrics
+from f1dashboard.services.pit_analytics import PitStopBreakdown
+
+NOW = datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc)
+
+
+def _snapshot() -> DashboardSnapshot:
+    return DashboardSnapshot(
+        meeting=None,
+        sessions=[
+            Session(
+                session_key=11284,
+                meeting_key=1285,
+                session_name="Grand Prix",
+                session_type="Race",
+                date_start_utc=datetime(2026, 5, 24, 20, 0, tzinfo=timezone.utc),
+                date_end_utc=datetime(2026, 5, 24, 22, 0, tzinfo=timezone.utc),
+            )
+        ],
+        latest_positions=[],
+        latest_laps=[],
+        race_control=[],
+        latest_results=[],
+        driver_standings=[],
+        constructor_standings=[],
+        generated_at_utc=NOW,
+    )
+
+
+class FakeRequest:
+    def __init__(self, **headers: str) -> None:
+        self.headers = {name.replace("_", "-"): value for name, value in headers.items()}
+
+
+@pytest.fixture
+def service(monkeypatch) -> DashboardService:
+    service = DashboardService(cache=MemoryTTLCache(), clock=lambda: NOW)
+    service.cache.set(SNAPSHOT_CACHE_KEY, _snapshot(), ttl_seconds=600)
+    monkeypatch.setattr(api, "_service", service)
+    return service
+
+
+@pytest.fixture
+def overloaded(monkeypatch, tmp_path):
+    """A service whose only admission slot is taken and that has no queue."""
+    gate = AdmissionGate(max_active=1, max_queued=0, retry_after_seconds=7)
+    service = DashboardService(cache=MemoryTTLCache(), clock=lambda: NOW, admission=gate, archive=SeasonArchive(tmp_path / "archive.sqlite3"))
+    monkeypatch.setattr(api, "_service", service)
+    with gate.admit():
+        yield service
+
+
+def test_overloaded_requests_without_a_snapshot_are_shed(overloaded) -> None:
+    for response in (api.get_dashboard(FakeRequest()), api.get_driver_standings(), api.get_season_history(2026)):
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "7"
+        assert response.headers["Cache-Control"] == "no-store"
+        assert loads(response.body)["detail"]
+    assert overloaded.admission.stats.shed == 3
+
+
+def test_overloaded_requests_get_the_expired_snapshot_with_a_warning(overloaded) -> None:
+    overloaded.cache.set(SNAPSHOT_CACHE_KEY, _snapshot(), ttl_seconds=0)
+
+    response = api.get_dashboard(FakeRequest(accept_encoding="identity"))
+    assert response.status_code == 200
+    assert response.headers["Warning"] == STALE_WARNING
+    assert loads(response.body)["generated_at_utc"] == "2026-05-23T14:00:00Z"
+    assert api.get_countdown().headers["Warning"] == STALE_WARNING
+
+
+def test_fresh_snapshots_skip_admission_and_carry_no_warning(service) -> None:
+    with service.admission.admit(), service.admission.admit(), service.admission.admit(), service.admission.admit():
+        response = api.get_dashboard(FakeRequest())
+    assert response.status_code == 200
+    assert "Warning" not in response.headers
+
+
+def test_schedule_endpoints_format_times_like_the_dashboard(service) -> None:
+    dashboard = loads(service.encoded_snapshot(service.cache.get(SNAPSHOT_CACHE_KEY)).variants["identity"])
+    schedule = loads(api.get_next_schedule().body)
+    countdown = loads(api.get_countdown().body)
+
+    assert schedule["sessions"][0]["date_start_utc"] == dashboard["sessions"][0]["date_start_utc"] == "2026-05-24T20:00:00Z"
+    assert countdown["target_utc"] == "2026-05-24T20:00:00Z"
+
+
+def test_pit_stops_are_served_from_the_cache_or_empty(service) -> None:
+    assert api.get_pit_stops() == asdict(PitStopBreakdown())
+
+    service.analytics_cache.set(PIT_STOPS_CACHE_KEY, asdict(PitStopBreakdown(meeting_key=1285, stops=3)), ttl_seconds=0)
+    assert api.get_pit_stops()["stops"] == 3
+
+
+def test_lap_metrics_are_served_from_the_cache_or_empty(service) -> None:
+    assert api.get_lap_metrics() == asdict(LapMetrics())
+
+    service.analytics_cache.set(LAP_METRICS_CACHE_KEY, asdict(LapMetrics(session_key=11282, fastest_lap_seconds=72.965)), ttl_seconds=0)
+    assert api.get_lap_metrics()["fastest_lap_seconds"] == 72.965
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from f1dashboard.archive import CONSTRUCTOR, DRIVER, QUALIFYING, RACE, SeasonArchive
+from f1dashboard.providers.jolpica import RacePage
+from f1dashboard.services.archive_sync import ArchiveSync
+
+
+def _race(round_number: int, winner: str, key: str = "Results") -> dict:
+    return {
+        "season": "2026",
+        "round": str(round_number),
+        "raceName": f"Round {round_number} Grand Prix",
+        "date": f"2026-03-{round_number:02d}",
+        "time": "14:00:00Z",
+        "Circuit": {"circuitId": f"circuit_{round_number}"},
+        key: [
+            {
+                "position": "1",
+                "points": "25",
+                "Driver": {"driverId": winner},
+                "Constructor": {"constructorId": "mercedes"},
+            },
+            {
+                "position": "2",
+                "points": "18",
+                "Driver": {"driverId": "hamilton"},
+                "Constructor": {"constructorId": "ferrari"},
+            },
+        ],
+    }
+
+
+class SeasonJolpicaClient:
+    """Serves a season the way Jolpica paginates it: by result rows, `page_size` at a time."""
+
+    def __init__(self, rounds: int, page_size: int = 3) -> None:
+        self.rounds = rounds
+        self.page_size = page_size
+        self.calls: list[str] = []
+
+    def season_results(self, season, offset=0, limit=100):
+        self.calls.append(f"{season}/results?offset={offset}")
+        races = [_race(round_number, "antonelli" if round_number % 2 else "russell") for round_number in range(1, self.rounds + 1)]
+        return self._page(races, "Results", offset)
+
+    def season_qualifying(self, season, offset=0, limit=100):
+        self.calls.append(f"{season}/qualifying?offset={offset}")
+        races = [_race(round_number, "antonelli", key="QualifyingResults") for round_number in range(1, self.rounds + 1)]
+        return self._page(races, "QualifyingResults", offset)
+
+    def standings(self, kind, season="current", round_number=None):
+        self.calls.append(f"{season}/{round_number}/{kind}Standings")
+        round_number = round_number or self.rounds
+        if kind == DRIVER:
+            rows = [
+                {"position": "1", "points": str(25 * round_number), "Driver": {"driverId": "russell"}},
+                {"position": "2", "points": str(18 * round_number), "Driver": {"driverId": "antonelli"}},
+            ]
+        else:
+            rows = [{"position": "1", "points": str(43 * round_number), "Constructor": {"constructorId": "mercedes"}}]
+        return round_number, rows
+
+    def _page(self, races, key, offset):
+        rows = [(race, row) for race in races for row in race[key]]
+        page: list[dict] = []
+        for race, row in rows[offset : offset + self.page_size]:
+            if not page or page[-1]["round"] != race["round"]:
+                page.append({**race, key: []})
+            page[-1][key].append(row)
+        return RacePage(races=page, offset=offset, total=len(rows))
+
+
+def _sync_until_caught_up(sync: ArchiveSync, season: int = 2026) -> list[str]:
+    requests = []
+    while True:
+        result = sync.sync()
+        requests.append(result.request)
+        races = sync.archive.round_numbers(season, RACE)
+        if (
+            sync.archive.feed_state(season, RACE).caught_up
+            and sync.archive.feed_state(season, QUALIFYING).caught_up
+            and races <= sync.archive.standings_rounds(season, DRIVER)
+            and races <= sync.archive.standings_rounds(season, CONSTRUCTOR)
+        ):
+            return requests
+
+
+def test_archive_sync_reads_the_season_page_by_page(tmp_path) -> None:
+    archive = SeasonArchive(tmp_path / "archive.sqlite3")
+    client = SeasonJolpicaClient(rounds=3)
+    sync = ArchiveSync(archive, client, clock=lambda: datetime(2026, 6, 1, tzinfo=timezone.utc))
+
+    first = sync.sync()
+
+    # One request per run; the first page ends half-way through round 2.
+    assert client.calls == ["2026/results?offset=0"]
+    assert first.request == "race@0"
+    assert first.fetched_rounds == [1, 2]
+    assert first.latest_race_round == 2
+    assert [row["Driver"]["driverId"] for row in archive.race(2026, 2, RACE)["Results"]] == ["russell"]
+
+    second = sync.sync()
+
+    assert client.calls[-1] == "2026/results?offset=3"
+    assert second.latest_race_round == 3
+    # The rest of round 2 was merged into the stored copy.
+    assert [row["Driver"]["driverId"] for row in archive.race(2026, 2, RACE)["Results"]] == ["russell", "hamilton"]
+    assert archive.feed_state(2026, RACE).caught_up
+
+
+def test_archive_sync_backfills_standings_and_then_only_refreshes_the_newest_round(tmp_path) -> None:
+    archive = SeasonArchive(tmp_path / "archive.sqlite3")
+    client = SeasonJolpicaClient(rounds=3)
+    sync = ArchiveSync(archive, client, clock=lambda: datetime(2026, 6, 1, tzinfo=timezone.utc))
+
+    requests = _sync_until_caught_up(sync)
+
+    assert len(client.calls) == len(requests)
+    # Newest standings first; older rounds alternate with refreshes.
+    assert requests[4:] == ["driver@3", "constructor@3", "race@4", "driver@2", "qualifying@4", "constructor@2", "driver@current", "driver@1", "constructor@current", "constructor@1"]
+    assert archive.standings_rounds(2026, DRIVER) == {1, 2, 3}
+    assert archive.standings_rounds(2026, CONSTRUCTOR) == {1, 2, 3}
+
+    client.calls.clear()
+    for _ in range(4):
+        sync.sync()
+
+    # Caught up: each feed is re-read from where its newest round starts.
+    assert sorted(client.calls) == ["2026/None/constructorStandings", "2026/None/driverStandings", "2026/qualifying?offset=4", "2026/results?offset=4"]
+
+
+def test_archive_sync_picks_up_a_new_round_from_the_refresh_page(tmp_path) -> None:
+    archive = SeasonArchive(tmp_path / "archive.sqlite3")
+    client = SeasonJolpicaClient(rounds=2)
+    sync = ArchiveSync(archive, client, clock=lambda: datetime(2026, 6, 1, tzinfo=timezone.utc))
+    _sync_until_caught_up(sync)
+
+    client.rounds = 3
+    results = [sync.sync() for _ in range(6)]
+    refresh = next(index for index, result in enumerate(results) if result.request == "race@2")
+
+    assert results[refresh].fetched_rounds == [2, 3]
+    assert results[refresh].latest_race_round == 3
+    # The rest of the new round is read by the next run.
+    assert results[refresh + 1].request == "race@5"
+    assert len(archive.race(2026, 3, RACE)["Results"]) == 2
+
+
+def test_archive_answers_history_queries(tmp_path) -> None:
+    archive = SeasonArchive(tmp_path / "archive.sqlite3")
+    client = SeasonJolpicaClient(rounds=3)
+    _sync_until_caught_up(ArchiveSync(archive, client, clock=lambda: datetime(2026, 6, 1, tzinfo=timezone.utc)))
+
+    assert [row["winner_driver_id"] for row in archive.season_rounds(2026)] == ["antonelli", "russell", "antonelli"]
+    assert [(row["round"], row["position"]) for row in archive.driver_results("hamilton", 2026) if row["kind"] == RACE] == [(1, 2), (2, 2), (3, 2)]
+    assert archive.standings(2026, 2, DRIVER)[0]["points"] == "50"
+    assert archive.race(2026, 3, QUALIFYING)["raceName"] == "Round 3 Grand Prix"
+
+
+class SessionsOpenF1Client:
+    def __init__(self) -> None:
+        self.session_calls: list[int] = []
+
+    def sessions(self, meeting_key):
+        self.session_calls.append(meeting_key)
+        return [{"session_key": meeting_key * 10, "meeting_key": meeting_key, "session_name": "Race", "date_start": "2026-03-01T14:00:00+00:00"}]
+
+
+def test_archive_sync_archives_finished_meetings_from_the_callers_rows(tmp_path) -> None:
+    archive = SeasonArchive(tmp_path / "archive.sqlite3")
+    openf1 = SessionsOpenF1Client()
+    sync = ArchiveSync(archive, SeasonJolpicaClient(rounds=1), openf1, clock=lambda: datetime(2026, 6, 1, tzinfo=timezone.utc))
+    meetings = [
+        {"meeting_key": 1280, "year": 2026, "date_start": "2026-03-01T10:00:00+00:00", "date_end": "2026-03-01T16:00:00+00:00"},
+        {"meeting_key": 1290, "year": 2026, "date_start": "2026-06-05T10:00:00+00:00", "date_end": "2026-06-07T16:00:00+00:00"},
+    ]
+
+    assert sync.sync(meetings).fetched_meetings == [1280]
+    assert sync.sync(meetings).fetched_meetings == []
+    assert sync.sync().fetched_meetings == []
+
+    # Only the finished meeting, and its sessions only once.
+    assert openf1.session_calls == [1280]
+    assert [row["meeting_key"] for row in archive.meetings(2026)] == [1280]
+    assert [row["session_key"] for row in archive.sessions(1280)] == [12800]
+
+
+def test_archive_sync_refreshes_the_feed_of_a_session_that_just_ended(tmp_path) -> None:
+    archive = SeasonArchive(tmp_path / "archive.sqlite3")
+    client = SeasonJolpicaClient(rounds=3)
+    now = [datetime(2026, 6, 1, 14, 0, tzinfo=timezone.utc)]
+    sync = ArchiveSync(archive, client, clock=lambda: now[0])
+    _sync_until_caught_up(sync)
+    race = {"session_name": "Race", "date_end": "2026-06-01T15:40:00+00:00"}
+    qualifying = {"session_name": "Qualifying", "date_end": "2026-06-01T15:40:00+00:00"}
+
+    # The 5, 20 and 60 minute checks after the race all re-read race results.
+    checks = []
+    for minutes in (5, 20, 60):
+        now[0] = datetime(2026, 6, 1, 15, 40, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+        checks.append(sync.sync(last_session=race).request)
+    assert checks == ["race@4", "race@4", "race@4"]
+    assert sync.sync(last_session=qualifying).request == "qualifying@4"
+
+    # Once the checks are over the rotation takes over again.
+    now[0] = datetime(2026, 6, 1, 18, 0, tzinfo=timezone.utc)
+    assert len({sync.sync(last_session=race).request for _ in range(4)}) == 4
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gzip
+
+from f1dashboard.assets import IMMUTABLE_CACHE_CONTROL, AssetStore, asset_response
+from f1dashboard.compression import negotiate_encoding
+
+SVG = ("<svg viewBox='0 0 180 120'>" + "<path d='M1 1l2 2 3 3'/>" * 40 + "</svg>").encode("utf-8")
+
+
+def test_asset_store_names_assets_by_content_and_persists_variants(tmp_path) -> None:
+    store = AssetStore(tmp_path)
+
+    asset = store.put(SVG, "svg")
+
+    assert asset.url == f"/api/venue/assets/{asset.name}"
+    assert store.put(SVG, "svg") is asset
+    assert (tmp_path / asset.name).read_bytes() == SVG
+    assert gzip.decompress((tmp_path / f"{asset.name}.gz").read_bytes()) == SVG
+
+    restarted = AssetStore(tmp_path).get(asset.name)
+    assert restarted is not None
+    assert restarted.variants["identity"] == SVG
+    assert "gzip" in restarted.variants
+
+
+def test_asset_store_rejects_unknown_or_tampered_names(tmp_path) -> None:
+    store = AssetStore(tmp_path)
+    asset = store.put(SVG, "svg")
+    (tmp_path / asset.name).write_bytes(b"<svg/>")
+
+    assert AssetStore(tmp_path).get(asset.name) is None
+    assert store.get("../secrets.svg") is None
+
+
+def test_asset_response_serves_precompressed_variant_with_immutable_caching() -> None:
+    asset = AssetStore().put(SVG, "svg")
+
+    response = asset_response(asset, accept_encoding="gzip, deflate")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Content-Type"] == "image/svg+xml"
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(response.body) == SVG
+
+    revalidated = asset_response(asset, accept_encoding="gzip", if_none_match=asset.etag)
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
+
+    assert asset_response(None, accept_encoding="gzip").status_code == 404
+
+
+def test_negotiate_encoding_honours_quality_values() -> None:
+    available = {"identity", "gzip", "br"}
+
+    assert negotiate_encoding(None, available) == "identity"
+    assert negotiate_encoding("gzip, br", available) == "br"
+    assert negotiate_encoding("br;q=0, gzip;q=0.8", available) == "gzip"
+    assert negotiate_encoding("br", {"identity", "gzip"}) == "identity"
+    assert negotiate_encoding("*;q=0.5", {"identity", "gzip"}) == "gzip"
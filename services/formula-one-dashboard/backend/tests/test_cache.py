@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
-from f1dashboard.cache import MemoryTTLCache
+from f1dashboard.cache import MemoryTTLCache, SQLiteTTLCache
 from f1dashboard.models import DashboardSnapshot
 
 
@@ -21,3 +22,41 @@ def test_ttl_cache_expires_entries() -> None:
     )
     cache.set("key", snapshot, ttl_seconds=0)
     assert cache.get("key") is None
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    writer: SQLiteTTLCache[dict] = SQLiteTTLCache(path, encode=json.dumps, decode=json.loads)
+    reader: SQLiteTTLCache[dict] = SQLiteTTLCache(path, encode=json.dumps, decode=json.loads)
+
+    writer.set("key", {"value": 1}, ttl_seconds=60)
+    writer.set("expired", {"value": 2}, ttl_seconds=0)
+
+    assert reader.get("key") == {"value": 1}
+    assert reader.get("expired") is None
+    assert reader.get_stale("expired") == {"value": 2}
+
+
+def test_sqlite_cache_decodes_each_stored_value_once_per_process(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    decoded: list[str] = []
+
+    def decode(text: str) -> dict:
+        decoded.append(text)
+        return json.loads(text)
+
+    writer: SQLiteTTLCache[dict] = SQLiteTTLCache(path, encode=json.dumps, decode=decode)
+    reader: SQLiteTTLCache[dict] = SQLiteTTLCache(path, encode=json.dumps, decode=decode)
+
+    writer.set("key", {"value": 1}, ttl_seconds=60)
+    assert writer.get("key") == {"value": 1}
+    assert decoded == []
+
+    first = reader.get("key")
+    assert reader.get("key") is first
+    assert reader.get_stale("key") is first
+    assert len(decoded) == 1
+
+    writer.set("key", {"value": 2}, ttl_seconds=60)
+    assert reader.get("key") == {"value": 2}
+    assert len(decoded) == 2
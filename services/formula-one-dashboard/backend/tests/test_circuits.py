@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from f1dashboard.circuits import CircuitMatcher
+from f1dashboard.devtools.circuit_bench import linear_match, queries
+
+FIXTURE = Path(__file__).parent / "fixtures" / "jolpica" / "current-circuits.json"
+
+
+def _circuits() -> list[dict]:
+    return json.loads(FIXTURE.read_text(encoding="utf-8"))["MRData"]["CircuitTable"]["Circuits"]
+
+
+def test_matcher_finds_circuits_by_exact_key_then_substring() -> None:
+    matcher = CircuitMatcher(_circuits())
+
+    assert matcher.match(("Sao Paulo", None, "Brazil", "São Paulo Grand Prix"))["circuitId"] == "interlagos"
+    assert matcher.match(("Yas Marina", "Yas Island", "United Arab Emirates", "Abu Dhabi Grand Prix"))["circuitId"] == "yas_marina"
+    assert matcher.match(("Nowhere", None, None, None)) is None
+
+
+def test_matcher_agrees_with_a_linear_scan_on_the_full_circuit_list() -> None:
+    circuits = _circuits()
+    matcher = CircuitMatcher(circuits)
+
+    for candidates in queries(circuits):
+        assert matcher.match(candidates) is linear_match(circuits, candidates), candidates
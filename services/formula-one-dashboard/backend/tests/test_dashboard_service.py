@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import gzip
 from datetime import datetime, timezone
 from json import loads
 from pathlib import Path
+from threading import Event, Thread
 
 import pytest
 
+from f1dashboard.admission import AdmissionGate, Overloaded
+from f1dashboard.archive import SeasonArchive
 from f1dashboard.cache import MemoryTTLCache
+from f1dashboard.leader import SQLiteLease
 from f1dashboard.models import DashboardSnapshot
-from f1dashboard.providers.jolpica import JolpicaClient
+from f1dashboard.providers.jolpica import JolpicaClient, RacePage
 from f1dashboard.providers.jolpica import JolpicaError
-from f1dashboard.providers.openf1 import OpenF1Error
+from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error
 from f1dashboard.providers.venue import VenueError
-from f1dashboard.services.dashboard import DashboardService
+from f1dashboard.services.dashboard import SNAPSHOT_CACHE_KEY, DashboardService
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "openf1"
@@ -179,8 +184,9 @@ class FakeClient:
 
     def pit(self, session_key):
         return [
-            {"meeting_key": 1285, "session_key": session_key, "driver_number": 12, "pit_duration": 349.9},
-            {"meeting_key": 1285, "session_key": session_key, "driver_number": 44, "pit_duration": 349.9},
+            {"meeting_key": 1285, "session_key": session_key, "driver_number": 12, "pit_duration": 22.5},
+            {"meeting_key": 1285, "session_key": session_key, "driver_number": 44, "pit_duration": 24.0},
+            {"meeting_key": 1285, "session_key": session_key, "driver_number": 63, "pit_duration": 23.0},
             {"meeting_key": 1285, "session_key": session_key, "driver_number": 63, "pit_duration": 349.9},
         ]
 
@@ -411,8 +417,13 @@ def test_dashboard_service_builds_a_snapshot() -> None:
     assert snapshot.venue is not None
     assert snapshot.venue.circuit_name == "Circuit Gilles Villeneuve"
     assert snapshot.venue.track_length_km == 4.361
-    assert snapshot.venue.fastest_lap_seconds is None
-    assert snapshot.venue.average_pit_stop_seconds == 3.499
+    assert snapshot.venue.track_map_url is not None
+    assert snapshot.venue.track_map_url.startswith("/api/venue/assets/")
+    asset = service.asset_store.get(snapshot.venue.track_map_url.rsplit("/", 1)[-1])
+    assert asset is not None
+    assert asset.variants["identity"] == b"<svg viewBox='0 0 10 10'><path d='M1 1 L9 9'/></svg>"
+    assert snapshot.venue.fastest_lap_seconds == 72.965
+    assert snapshot.venue.average_pit_stop_seconds == pytest.approx(23.1667, abs=1e-4)
     assert len(snapshot.venue.weather_forecast) == 3
     assert snapshot.venue.weather_forecast[1].is_wet is True
     assert snapshot.generated_at_utc.tzinfo == timezone.utc
@@ -638,14 +649,372 @@ def test_dashboard_service_returns_fallback_results_when_jolpica_times_out() ->
     assert snapshot.latest_results[0].status == "Sprint Qualifying"
 
 
-def test_dashboard_service_skips_venue_when_venue_requests_fail() -> None:
+def test_dashboard_service_keeps_openf1_venue_figures_when_venue_requests_fail() -> None:
     service = DashboardService(
         client=FakeClient(),
         standings_client=FakeStandingsClient(),
         venue_client=BrokenVenueClient(),
+        clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
     )
 
     snapshot = service.get_snapshot(refresh=True)
 
     assert snapshot.meeting is not None
-    assert snapshot.venue is None
+    assert snapshot.venue is not None
+    assert snapshot.venue.circuit_name == "Montreal"
+    assert snapshot.venue.track_length_km is None
+    assert snapshot.venue.fastest_lap_seconds == 72.965
+    assert snapshot.venue.average_pit_stop_seconds == pytest.approx(23.1667, abs=1e-4)
+    assert service.pit_stops()["stops"] == 3
+
+
+class CursorOpenF1Client(OpenF1Client):
+    def __init__(self) -> None:
+        super().__init__(base_url="https://openf1.test")
+        self.requests: list[tuple[str, str]] = []
+        self.position_rows = [
+            {"date": "2026-06-07T13:00:00+00:00", "driver_number": 16, "position": 2},
+            {"date": "2026-06-07T13:00:00+00:00", "driver_number": 81, "position": 1},
+        ]
+
+    def iter_rows(self, path, params=None, fields=None, where=None):
+        self.requests.append((path, params))
+        rows = self.position_rows if path == "/v1/position" else []
+        for row in rows:
+            yield {key: value for key, value in row.items() if fields is None or key in fields}
+
+
+def test_dashboard_service_requests_only_new_positions_after_the_first_refresh() -> None:
+    client = CursorOpenF1Client()
+    service = DashboardService(client=client, clock=lambda: datetime(2026, 6, 7, 14, 0, tzinfo=timezone.utc))
+    session_raw = {"session_key": 11296, "meeting_key": 1286, "session_name": "Race"}
+
+    first = service._latest_results(session_raw)
+    client.position_rows = [{"date": "2026-06-07T13:01:00+00:00", "driver_number": 16, "position": 1}]
+    second = service._latest_results(session_raw)
+    # Published late: older than the cursor, but newer than driver 81's row.
+    client.position_rows = [
+        {"date": "2026-06-07T13:01:00+00:00", "driver_number": 16, "position": 1},
+        {"date": "2026-06-07T13:00:58+00:00", "driver_number": 81, "position": 3},
+    ]
+    third = service._latest_results(session_raw)
+
+    position_requests = [params for path, params in client.requests if path == "/v1/position"]
+    assert position_requests == [
+        "session_key=11296",
+        "session_key=11296&date>2026-06-07T12:59:55%2B00:00",
+        "session_key=11296&date>2026-06-07T13:00:55%2B00:00",
+    ]
+    assert [row.driver_number for row in first] == [81, 16]
+    assert [row.driver_number for row in second] == [16, 81]
+    assert [(row.driver_number, row.position) for row in third] == [(16, 1), (81, 3)]
+
+    service._latest_results({"session_key": 11297, "meeting_key": 1286, "session_name": "Race"})
+    assert list(service._position_cursors) == [11297]
+
+
+class CountingClient(FakeClient):
+    def __init__(self) -> None:
+        self.latest_session_calls = 0
+
+    def latest_session(self):
+        self.latest_session_calls += 1
+        return super().latest_session()
+
+
+def test_dashboard_workers_share_one_snapshot_through_the_sqlite_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DASHBOARD_SHARED_CACHE_PATH", str(tmp_path / "dashboard-cache.sqlite3"))
+    clients = [CountingClient(), CountingClient()]
+    workers = [
+        DashboardService(
+            client=client,
+            standings_client=FakeStandingsClient(),
+            venue_client=FakeVenueClient(),
+            clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
+        )
+        for client in clients
+    ]
+
+    built = workers[0].get_snapshot()
+    shared = workers[1].get_snapshot()
+
+    assert clients[0].latest_session_calls > 0
+    assert clients[1].latest_session_calls == 0
+    assert shared.meeting == built.meeting
+    assert shared.latest_results == built.latest_results
+    # Analytics come from the shared cache too, not from OpenF1.
+    assert workers[1].pit_stops() == workers[0].pit_stops()
+    assert workers[1].pit_stops()["stops"] > 0
+    assert workers[1].lap_metrics() == workers[0].lap_metrics()
+    assert workers[1].lap_metrics()["fastest_lap_seconds"] == 72.965
+    assert clients[1].latest_session_calls == 0
+
+
+def test_dashboard_follower_serves_stale_snapshot_while_the_leader_holds_the_lease(tmp_path) -> None:
+    cache: MemoryTTLCache[DashboardSnapshot] = MemoryTTLCache()
+    leader = SQLiteLease(tmp_path / "lease.sqlite3", holder="leader")
+    follower = SQLiteLease(tmp_path / "lease.sqlite3", holder="follower")
+    warm_service = DashboardService(
+        client=FakeClient(),
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        cache=cache,
+        clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
+        refresh_lease=leader,
+    )
+    cached_snapshot = warm_service.get_snapshot()
+    cache.set("dashboard:snapshot", cached_snapshot, ttl_seconds=0)
+
+    client = CountingClient()
+    service = DashboardService(
+        client=client,
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        cache=cache,
+        clock=lambda: datetime(2026, 5, 23, 14, 5, tzinfo=timezone.utc),
+        refresh_lease=follower,
+    )
+
+    assert service.get_snapshot() is cached_snapshot
+    assert client.latest_session_calls == 0
+    assert leader.is_leader and not follower.is_leader
+    assert service.serve_snapshot() == (cached_snapshot, True)
+
+
+def test_dashboard_follower_does_not_build_while_the_leader_holds_the_lease(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("f1dashboard.services.dashboard.SNAPSHOT_BUILD_WAIT_SECONDS", 0.2)
+    monkeypatch.setattr("f1dashboard.services.dashboard.SNAPSHOT_BUILD_POLL_SECONDS", 0.05)
+    leader = SQLiteLease(tmp_path / "lease.sqlite3", holder="leader")
+    assert leader.acquire()
+    client = CountingClient()
+    service = DashboardService(
+        client=client,
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
+        refresh_lease=SQLiteLease(tmp_path / "lease.sqlite3", holder="follower"),
+    )
+
+    with pytest.raises(Overloaded):
+        service.serve_snapshot()
+    assert client.latest_session_calls == 0
+
+
+def test_dashboard_service_warm_starts_from_the_persisted_snapshot(tmp_path) -> None:
+    snapshot_cache_path = tmp_path / "dashboard-snapshot.json"
+    DashboardService(
+        client=FakeClient(),
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
+        snapshot_cache_path=str(snapshot_cache_path),
+    ).get_snapshot()
+
+    client = CountingClient()
+    service = DashboardService(
+        client=client,
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        clock=lambda: datetime(2026, 5, 23, 14, 5, tzinfo=timezone.utc),
+        snapshot_cache_path=str(snapshot_cache_path),
+    )
+    warmed = service.warm_start()
+    served = service.get_snapshot()
+
+    assert warmed is not None
+    assert served is warmed
+    assert served.generated_at_utc == datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc)
+
+    # The request kicked off a refresh; wait for it to land.
+    assert service._background_refresh.acquire(timeout=5)
+    service._background_refresh.release()
+    assert client.latest_session_calls > 0
+    assert service.get_snapshot().generated_at_utc == datetime(2026, 5, 23, 14, 5, tzinfo=timezone.utc)
+
+
+class BlockingClient(CountingClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.building = Event()
+        self.release = Event()
+
+    def latest_session(self):
+        self.building.set()
+        self.release.wait(timeout=5)
+        return super().latest_session()
+
+
+def test_dashboard_service_cold_start_requests_wait_for_the_running_build() -> None:
+    client = BlockingClient()
+    service = DashboardService(
+        client=client,
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
+    )
+    served: list[DashboardSnapshot] = []
+    assert service.refresh_in_background()
+    assert client.building.wait(timeout=5)
+    requests = [Thread(target=lambda: served.append(service.get_snapshot())) for _ in range(4)]
+    for request in requests:
+        request.start()
+    client.release.set()
+    for request in requests:
+        request.join(timeout=5)
+
+    assert len(served) == 4
+    assert all(snapshot is served[0] for snapshot in served)
+    assert service._builds_completed == 1
+
+
+class SeasonFeedStandingsClient(FakeStandingsClient):
+    def __init__(self) -> None:
+        self.season_calls: list[str] = []
+        self.live_standings_calls = 0
+
+    def season_results(self, season, offset=0, limit=100):
+        self.season_calls.append(f"results@{offset}")
+        race = self.latest_race_results()
+        return RacePage(races=[race] if offset == 0 else [], offset=offset, total=len(race["Results"]))
+
+    def season_qualifying(self, season, offset=0, limit=100):
+        self.season_calls.append(f"qualifying@{offset}")
+        return RacePage(races=[], offset=offset, total=0)
+
+    def standings(self, kind, season="current", round_number=None):
+        self.season_calls.append(f"{kind}@{round_number}")
+        rows = FakeStandingsClient.driver_standings(self) if kind == "driver" else FakeStandingsClient.constructor_standings(self)
+        return 7, rows
+
+    def driver_standings(self):
+        self.live_standings_calls += 1
+        return super().driver_standings()
+
+    def constructor_standings(self):
+        self.live_standings_calls += 1
+        return super().constructor_standings()
+
+    def latest_race_results(self):
+        return {**super().latest_race_results(), "season": "2026"}
+
+
+class SessionCountingClient(FakeClient):
+    def __init__(self) -> None:
+        self.session_calls: list[int] = []
+
+    def sessions(self, meeting_key):
+        self.session_calls.append(meeting_key)
+        return super().sessions(meeting_key)
+
+
+def test_dashboard_service_reads_results_and_standings_from_the_archive(tmp_path) -> None:
+    standings_client = SeasonFeedStandingsClient()
+    client = SessionCountingClient()
+    service = DashboardService(
+        client=client,
+        standings_client=standings_client,
+        venue_client=FakeVenueClient(),
+        clock=lambda: datetime(2026, 5, 26, 14, 0, tzinfo=timezone.utc),
+        archive=SeasonArchive(tmp_path / "season-archive.sqlite3"),
+    )
+
+    first = service.get_snapshot(refresh=True)
+    assert standings_client.season_calls == ["results@0"]
+    assert first.latest_results[0].status == "Race result"
+
+    for _ in range(3):
+        service.get_snapshot(refresh=True)
+    assert standings_client.season_calls == ["results@0", "qualifying@0", "driver@7", "constructor@7"]
+    live_calls = standings_client.live_standings_calls
+
+    snapshot = service.get_snapshot(refresh=True)
+
+    # One Jolpica request per rebuild, and nothing live once the archive has standings.
+    assert len(standings_client.season_calls) == 5
+    assert standings_client.live_standings_calls == live_calls
+    assert snapshot.driver_standings[0].competitor_name == "Kimi Antonelli"
+    assert [point.round for point in snapshot.driver_standings[0].history] == [7]
+    assert snapshot.constructor_standings[0].competitor_name == "Mercedes"
+    assert snapshot.latest_results[0].status == "Race result"
+
+    # The finished Canadian meeting was archived from the schedule the
+    # refresh fetched anyway; its sessions are now read locally.
+    assert service.archive.meeting_keys(2026) == {1285}
+    client.session_calls.clear()
+    service.meeting_pit_breakdown({"meeting_key": 1285})
+    assert client.session_calls == []
+
+
+class CountingStandingsClient(FakeStandingsClient):
+    def __init__(self) -> None:
+        self.standings_calls = 0
+
+    def driver_standings(self):
+        self.standings_calls += 1
+        return super().driver_standings()
+
+
+def test_dashboard_service_reuses_sections_that_are_not_due() -> None:
+    now = [datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc)]
+    standings_client = CountingStandingsClient()
+    service = DashboardService(
+        client=FakeClient(),
+        standings_client=standings_client,
+        venue_client=FakeVenueClient(),
+        clock=lambda: now[0],
+    )
+    first = service.get_snapshot(refresh=True)
+    plan = service.refresh_plan
+
+    assert first.next_refresh_utc == plan.next_refresh_utc
+    assert service.snapshot_expires_at(first) == plan.next_refresh_utc
+    assert standings_client.standings_calls == 1
+
+    now[0] = plan.due_utc["schedule"]
+    assert not plan.is_due("standings", now[0])
+    second = service.get_snapshot(refresh=True, reuse_sections=True)
+
+    assert standings_client.standings_calls == 1
+    assert second.driver_standings == first.driver_standings
+    assert second.generated_at_utc == now[0]
+
+    service.get_snapshot(refresh=True)
+    assert standings_client.standings_calls == 2
+
+
+def test_dashboard_service_compresses_each_snapshot_once() -> None:
+    service = DashboardService(
+        client=FakeClient(),
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
+    )
+    snapshot = service.get_snapshot(refresh=True)
+    encoded = service.encoded_snapshot(snapshot)
+
+    assert service.encoded_snapshot(service.get_snapshot()) is encoded
+    encoding, body = encoded.negotiate("gzip, deflate")
+    assert encoding == "gzip"
+    assert loads(gzip.decompress(body))["meeting"]["meeting_name"] == "Canadian Grand Prix"
+    assert encoded.negotiate(None) == ("identity", encoded.variants["identity"])
+
+
+def test_dashboard_service_serves_the_stale_snapshot_when_overloaded() -> None:
+    gate = AdmissionGate(max_active=1, max_queued=0)
+    service = DashboardService(
+        client=FakeClient(),
+        standings_client=FakeStandingsClient(),
+        venue_client=FakeVenueClient(),
+        clock=lambda: datetime(2026, 5, 23, 14, 0, tzinfo=timezone.utc),
+        admission=gate,
+    )
+    with gate.admit():
+        with pytest.raises(Overloaded):
+            service.serve_snapshot()
+
+    snapshot = service.get_snapshot(refresh=True)
+    assert service.serve_snapshot() == (snapshot, False)
+
+    service.cache.set(SNAPSHOT_CACHE_KEY, snapshot, ttl_seconds=0)
+    with gate.admit():
+        assert service.serve_snapshot() == (snapshot, True)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timezone
+
+from f1dashboard.decoding import DRIVER_STANDINGS, JOLPICA_QUALIFYING_RESULTS, JOLPICA_RACE_RESULTS, LAPS, SESSIONS
+from f1dashboard.models import ChampionshipStandingRow, ClassificationRow
+
+
+def test_jolpica_rows_decode_into_classification_rows() -> None:
+    rows = JOLPICA_RACE_RESULTS.decode_all(
+        [
+            {
+                "position": "1",
+                "number": "12",
+                "points": "25",
+                "Driver": {"givenName": "Kimi", "familyName": "Antonelli"},
+                "Constructor": {"name": "Mercedes"},
+            },
+            {"position": "", "Driver": {"driverId": "hamilton", "permanentNumber": "44"}, "points": "n/a"},
+        ],
+        status="Race result",
+    )
+
+    assert rows == [
+        ClassificationRow(position=1, driver_number=12, driver_name="Kimi Antonelli", team_name="Mercedes", points=25.0, status="Race result"),
+        ClassificationRow(position=None, driver_number=44, driver_name="hamilton", team_name=None, points=None, status="Race result"),
+    ]
+    qualifying = JOLPICA_QUALIFYING_RESULTS.decode({"position": "3", "Q1": "1:12.1", "Q2": "1:11.9", "Driver": {}})
+    assert (qualifying.driver_name, qualifying.status) == ("Unknown driver", "Qualifying result · 1:11.9")
+
+
+def test_standings_rows_decode_with_defaults() -> None:
+    rows = DRIVER_STANDINGS.decode_all([{"position": "2", "points": "", "Driver": {"givenName": "Lewis", "familyName": "Hamilton"}}])
+
+    assert rows == [ChampionshipStandingRow(position=2, competitor_name="Lewis Hamilton", points=0.0, wins=None)]
+
+
+def test_invalid_rows_are_skipped_and_counted_per_endpoint() -> None:
+    errors: Counter[str] = Counter()
+    now = datetime(2026, 6, 5, 12, 0, tzinfo=timezone.utc)
+
+    laps = LAPS.decode_all(
+        [
+            {"driver_number": 1, "lap_number": 2, "lap_duration": 80.1, "segments_sector_1": [2048, 2049]},
+            {"driver_number": "x", "lap_number": 3},
+            {"lap_number": 4},
+        ],
+        errors,
+        meeting_key=1,
+        session_key=2,
+    )
+    sessions = SESSIONS.decode_all([{"session_key": 5, "meeting_key": 1}, {"meeting_key": 1}], errors, date_start_utc=now)
+
+    assert [(lap.lap_number, lap.payload) for lap in laps] == [(2, {"lap_duration": 80.1})]
+    assert [(session.session_key, session.session_name, session.date_start_utc) for session in sessions] == [(5, "Session", now)]
+    assert errors == Counter({"openf1.laps": 2, "openf1.sessions": 1})
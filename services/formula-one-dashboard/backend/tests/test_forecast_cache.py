@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from f1dashboard.providers.venue import VenueError
+from f1dashboard.services.forecast import ForecastCache, next_model_update
+
+
+class CountingForecastProvider:
+    def __init__(self) -> None:
+        self.calls: list[tuple[float, float, date, date]] = []
+        self.fail = False
+
+    def weather_forecast(self, latitude, longitude, start_date, end_date):
+        if self.fail:
+            raise VenueError("Venue request timed out")
+        self.calls.append((latitude, longitude, start_date, end_date))
+        return [{"date": start_date.isoformat(), "label": "Fri", "summary": "Dry", "is_wet": False}]
+
+
+class MutableClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_next_model_update_follows_three_hourly_runs() -> None:
+    assert next_model_update(datetime(2026, 6, 5, 10, 0, tzinfo=timezone.utc)) == datetime(2026, 6, 5, 12, 45, tzinfo=timezone.utc)
+    assert next_model_update(datetime(2026, 6, 5, 12, 44, tzinfo=timezone.utc)) == datetime(2026, 6, 5, 12, 45, tzinfo=timezone.utc)
+    assert next_model_update(datetime(2026, 6, 5, 12, 45, tzinfo=timezone.utc)) == datetime(2026, 6, 5, 15, 45, tzinfo=timezone.utc)
+    assert next_model_update(datetime(2026, 6, 5, 0, 30, tzinfo=timezone.utc)) == datetime(2026, 6, 5, 0, 45, tzinfo=timezone.utc)
+
+
+def test_forecast_cache_reuses_forecast_until_next_model_update() -> None:
+    provider = CountingForecastProvider()
+    clock = MutableClock(datetime(2026, 6, 5, 10, 0, tzinfo=timezone.utc))
+    forecasts = ForecastCache(provider, clock=clock)
+
+    first = forecasts.get(43.7347, 7.42056, date(2026, 6, 5), date(2026, 6, 7))
+    clock.now = datetime(2026, 6, 5, 12, 30, tzinfo=timezone.utc)
+    second = forecasts.get(43.7349, 7.4199, date(2026, 6, 5), date(2026, 6, 7))
+    clock.now = datetime(2026, 6, 5, 12, 50, tzinfo=timezone.utc)
+    forecasts.get(43.7347, 7.42056, date(2026, 6, 5), date(2026, 6, 7))
+
+    assert provider.calls == [(43.73, 7.42, date(2026, 6, 5), date(2026, 6, 7))] * 2
+    assert second.days == first.days
+    assert second.fetched_at_utc == datetime(2026, 6, 5, 10, 0, tzinfo=timezone.utc)
+    assert second.is_stale is False
+
+
+def test_forecast_cache_serves_last_forecast_when_open_meteo_is_down() -> None:
+    provider = CountingForecastProvider()
+    clock = MutableClock(datetime(2026, 6, 5, 10, 0, tzinfo=timezone.utc))
+    forecasts = ForecastCache(provider, clock=clock)
+    forecasts.get(43.73, 7.42, date(2026, 6, 5), date(2026, 6, 7))
+
+    provider.fail = True
+    clock.now = datetime(2026, 6, 5, 16, 0, tzinfo=timezone.utc)
+    result = forecasts.get(43.73, 7.42, date(2026, 6, 5), date(2026, 6, 7))
+
+    assert result.is_stale is True
+    assert result.fetched_at_utc == datetime(2026, 6, 5, 10, 0, tzinfo=timezone.utc)
+    assert result.days[0]["date"] == "2026-06-05"
+    assert forecasts.get(45.5, -73.52, date(2026, 6, 12), date(2026, 6, 14)).days == []
+
+
+def test_forecast_prefetch_skips_cached_and_out_of_horizon_meetings() -> None:
+    provider = CountingForecastProvider()
+    clock = MutableClock(datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc))
+    forecasts = ForecastCache(provider, clock=clock)
+    forecasts.get(43.73, 7.42, date(2026, 6, 5), date(2026, 6, 7))
+
+    fetched = forecasts.prefetch(
+        [
+            (43.73, 7.42, date(2026, 6, 5), date(2026, 6, 7)),
+            (41.57, 2.26, date(2026, 6, 12), date(2026, 6, 14)),
+            (47.22, 14.76, date(2026, 7, 24), date(2026, 7, 26)),
+        ]
+    )
+
+    assert fetched == 1
+    assert [call[2] for call in provider.calls] == [date(2026, 6, 5), date(2026, 6, 12)]
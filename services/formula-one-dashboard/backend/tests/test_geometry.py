@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import re
+
+from f1dashboard.geometry import ViewBox, encode_path, fit_to_viewbox, simplify
+
+
+def _decode_path(path: str) -> list[tuple[float, float]]:
+    move, _, relative = path[1:].partition("l")
+    numbers = [float(value) for value in re.findall(r"-?(?:\d+\.?\d*|\.\d+)", move)]
+    points = [(numbers[0], numbers[1])]
+    deltas = [float(value) for value in re.findall(r"-?(?:\d+\.?\d*|\.\d+)", relative)]
+    for dx, dy in zip(deltas[::2], deltas[1::2]):
+        x, y = points[-1]
+        points.append((round(x + dx, 1), round(y + dy, 1)))
+    return points
+
+
+def test_simplify_drops_collinear_points_and_keeps_corners() -> None:
+    points = [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (3.0, 0.0), (3.0, 1.0), (3.0, 2.0)]
+
+    assert simplify(points, tolerance=0.1) == [(0.0, 0.0), (3.0, 0.0), (3.0, 2.0)]
+
+
+def test_encode_path_uses_relative_commands_without_rounding_drift() -> None:
+    points = [(10.04, 20.06), (10.51, 19.94), (11.0, 19.5), (11.46, 19.03), (12.0, 18.51)]
+
+    path = encode_path(points)
+
+    assert path.startswith("M10 20.1l")
+    assert _decode_path(path) == [(round(x, 1), round(y, 1)) for x, y in points]
+
+
+def test_fit_to_viewbox_keeps_outline_inside_padding() -> None:
+    view = ViewBox()
+    fitted = fit_to_viewbox([0.0, 1000.0, 500.0], [0.0, 0.0, 800.0], view)
+
+    assert all(view.padding - 1e-9 <= x <= view.width - view.padding + 1e-9 for x, _ in fitted)
+    assert all(view.padding - 1e-9 <= y <= view.height - view.padding + 1e-9 for _, y in fitted)
+    # SVG y grows downwards, so the highest raw point ends up nearest the top.
+    assert fitted[2][1] < fitted[0][1]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+
+import pytest
+
+from f1dashboard.jsonstream import JSONStreamError, iter_json_array
+
+
+def _chunked(payload: bytes, size: int) -> list[bytes]:
+    return [payload[index : index + size] for index in range(0, len(payload), size)]
+
+
+def test_iter_json_array_decodes_across_chunk_boundaries() -> None:
+    rows = [{"driver_number": 16, "name": "Charles Leclerc", "team": "Scuderia Ferrari"}, {"driver_number": 11, "name": "Sergio Pérez"}, 123, "x"]
+    payload = json.dumps(rows, ensure_ascii=False).encode("utf-8")
+
+    for size in (1, 2, 3, 7, 64):
+        assert list(iter_json_array(_chunked(payload, size))) == rows
+
+
+def test_iter_json_array_projects_and_filters_rows() -> None:
+    payload = json.dumps(
+        [
+            {"date": "2026-06-07T13:00:00", "driver_number": 16, "position": 1, "meeting_key": 1286},
+            {"date": "2026-06-07T13:00:01", "driver_number": 81, "position": 2, "meeting_key": 1286},
+        ]
+    ).encode("utf-8")
+
+    rows = list(iter_json_array(_chunked(payload, 5), fields=("driver_number", "position"), where=lambda row: row["position"] == 2))
+
+    assert rows == [{"driver_number": 81, "position": 2}]
+
+
+def test_iter_json_array_projects_top_level_rows_only() -> None:
+    payload = b'[{"driver_number": 16, "meta": {"driver_number": 1, "team": "Ferrari"}, "position": 1}]'
+
+    rows = list(iter_json_array(_chunked(payload, 4), fields=("driver_number", "meta")))
+
+    assert rows == [{"driver_number": 16, "meta": {"driver_number": 1, "team": "Ferrari"}}]
+
+
+def test_iter_json_array_rejects_non_array_and_malformed_payloads() -> None:
+    assert list(iter_json_array([b" [ ] "])) == []
+    assert list(iter_json_array([])) == []
+
+    for payload in (
+        b'{"detail": "No results found."}',
+        b'[{"position": 1}, {"posi',
+        b"[1 2]",
+        b"[,,1]",
+        b"[1,,2]",
+        b"[1,]",
+        b"[1] 2",
+    ):
+        with pytest.raises(JSONStreamError):
+            list(iter_json_array(_chunked(payload, 2), fields=("position",)))
+
+
+def test_iter_json_array_memory_does_not_grow_with_stream_length() -> None:
+    row = b'{"date": "2026-06-07T13:00:00.000000+00:00", "session_key": 11296, "meeting_key": 1286, "driver_number": 16, "position": 1},'
+
+    def stream(rows: int):
+        yield b"["
+        for _ in range(rows // 100):
+            yield row * 100
+        yield b'{"position": 1}]'
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iter_json_array(stream(100_000), fields=("driver_number", "position")))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 100_001
+    # The stream is ~12 MB; only a chunk and one row are ever held.
+    assert peak < 1_000_000
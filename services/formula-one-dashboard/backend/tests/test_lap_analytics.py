@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from f1dashboard.analytics import grouped_slopes
+from f1dashboard.services.lap_analytics import LapAnalytics, _lap_metrics_python, lap_metrics
+
+LAPS = [
+    {"driver_number": 1, "lap_number": 1, "lap_duration": 95.0, "is_pit_out_lap": True},
+    {"driver_number": 1, "lap_number": 2, "lap_duration": 80.0, "duration_sector_1": 25.1, "duration_sector_2": 30.0, "duration_sector_3": 24.9},
+    {"driver_number": 1, "lap_number": 3, "lap_duration": 80.1, "duration_sector_1": 25.0, "duration_sector_2": 30.2, "duration_sector_3": 24.9},
+    {"driver_number": 1, "lap_number": 4, "lap_duration": 80.2, "duration_sector_1": 25.2, "duration_sector_2": 30.1, "duration_sector_3": 24.9},
+    {"driver_number": 1, "lap_number": 5, "lap_duration": 99.0},
+    {"driver_number": 16, "lap_number": 2, "lap_duration": 79.9, "duration_sector_1": 25.3, "duration_sector_2": 29.8, "duration_sector_3": 24.8},
+    {"driver_number": 16, "lap_number": 3, "lap_duration": None},
+]
+STINTS = [
+    {"driver_number": 1, "stint_number": 1, "compound": "MEDIUM", "lap_start": 1, "lap_end": 5},
+    {"driver_number": 16, "stint_number": 1, "compound": "SOFT", "lap_start": 1, "lap_end": 3},
+]
+
+
+def test_lap_metrics_compute_fastest_lap_sectors_pace_and_degradation() -> None:
+    metrics = lap_metrics(9001, LAPS, STINTS)
+
+    assert (metrics.fastest_lap_seconds, metrics.fastest_lap_driver_number) == (79.9, 16)
+    assert metrics.best_sector_seconds == [25.0, 29.8, 24.8]
+    assert [(row.driver_number, row.laps, row.best_lap_seconds) for row in metrics.driver_pace] == [(16, 1, 79.9), (1, 4, 80.0)]
+    medium = metrics.stints[0]
+    assert (medium.driver_number, medium.compound, medium.laps) == (1, "MEDIUM", 5)
+    # The out-lap and the slow in-lap are left out of the fit.
+    assert medium.degradation_seconds_per_lap == pytest.approx(0.1)
+    assert metrics.stints[1].degradation_seconds_per_lap is None
+
+
+class LapClient:
+    def __init__(self) -> None:
+        self.lap_calls = 0
+
+    def laps(self, session_key):
+        self.lap_calls += 1
+        return LAPS
+
+    def stints(self, session_key):
+        return STINTS
+
+
+def test_lap_analytics_caches_finished_sessions_only() -> None:
+    client = LapClient()
+    now = [datetime(2026, 5, 24, 20, 30, tzinfo=timezone.utc)]
+    analytics = LapAnalytics(client, clock=lambda: now[0])
+    session = {"session_key": 9001, "date_end": "2026-05-24T22:00:00+00:00"}
+
+    analytics.session(session)
+    analytics.session(session)
+    assert client.lap_calls == 2
+
+    now[0] = datetime(2026, 5, 25, 0, 0, tzinfo=timezone.utc)
+    analytics.session(session)
+    assert analytics.session(session).fastest_lap_seconds == 79.9
+    assert client.lap_calls == 3
+
+
+def test_grouped_slopes_fits_each_group() -> None:
+    slopes = grouped_slopes(["a", "a", "a", "b"], [1.0, 2.0, 3.0, 1.0], [10.0, 12.0, 14.0, 5.0])
+
+    assert slopes == {"a": pytest.approx(2.0), "b": None}
+
+
+def test_lap_metrics_numpy_columns_match_the_python_fallback() -> None:
+    pytest.importorskip("numpy")
+    laps = LAPS + [
+        {"driver_number": 16, "lap_number": 4, "lap_duration": 80.4, "duration_sector_1": 0},
+        {"driver_number": 16, "lap_number": 5, "lap_duration": 80.1},
+        {"driver_number": 16, "lap_number": 6, "lap_duration": 80.3},
+        {"driver_number": 16, "lap_number": 7, "lap_duration": 80.0},
+        {"driver_number": 44, "lap_number": 1, "lap_duration": 81.0},
+        {"driver_number": None, "lap_number": 2, "lap_duration": 70.0},
+    ]
+    stints = STINTS + [
+        {"driver_number": 16, "stint_number": 2, "compound": "HARD", "lap_start": 4, "lap_end": 7},
+        {"driver_number": 44, "stint_number": 1, "compound": "HARD", "lap_start": None, "lap_end": 9},
+    ]
+
+    assert lap_metrics(9001, laps, stints) == _lap_metrics_python(9001, laps, stints)
+    assert lap_metrics(9001, laps, stints).stints[2].degradation_seconds_per_lap == pytest.approx(-0.1)
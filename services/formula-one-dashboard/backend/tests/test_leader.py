@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from f1dashboard.leader import FileLease, SQLiteLease
+
+
+def test_sqlite_lease_has_one_holder_and_is_taken_over_after_expiry(tmp_path) -> None:
+    now = [1000.0]
+    path = tmp_path / "lease.sqlite3"
+    first = SQLiteLease(path, lease_seconds=30, holder="first", clock=lambda: now[0])
+    second = SQLiteLease(path, lease_seconds=30, holder="second", clock=lambda: now[0])
+
+    assert first.acquire()
+    assert not second.acquire()
+    now[0] += 20
+    assert first.acquire()  # renewal
+    now[0] += 20
+    assert not second.acquire()
+
+    # The leader stops renewing, e.g. because its process died.
+    now[0] += 31
+    assert second.acquire()
+    assert not first.acquire()
+
+    assert (second.stats.acquisitions, second.stats.takeovers) == (1, 1)
+    assert (first.stats.acquisitions, first.stats.losses) == (1, 1)
+
+
+def test_sqlite_lease_extended_to_the_next_refresh_is_not_taken_over(tmp_path) -> None:
+    now = [1000.0]
+    path = tmp_path / "lease.sqlite3"
+    first = SQLiteLease(path, lease_seconds=30, holder="first", clock=lambda: now[0])
+    second = SQLiteLease(path, lease_seconds=30, holder="second", clock=lambda: now[0])
+
+    assert first.acquire()
+    # A snapshot was stored that is next refreshed in 12 hours.
+    first.extend(12 * 3600 + 30)
+    second.extend(24 * 3600)  # not the holder: no effect
+    now[0] += 6 * 3600
+    assert first.acquire()  # renewing does not shorten the extended lease
+    now[0] += 6 * 3600
+    assert not second.acquire()
+
+    now[0] += 31
+    assert second.acquire()
+    assert second.stats.takeovers == 1
+
+
+def test_sqlite_lease_release_hands_over_without_takeover(tmp_path) -> None:
+    path = tmp_path / "lease.sqlite3"
+    first = SQLiteLease(path, holder="first")
+    second = SQLiteLease(path, holder="second")
+
+    assert first.acquire()
+    first.release()
+
+    assert second.acquire()
+    assert second.stats.takeovers == 0
+
+
+def test_file_lease_is_exclusive_until_the_holder_releases(tmp_path) -> None:
+    path = tmp_path / "refresh.lock"
+    first = FileLease(path, holder="first")
+    second = FileLease(path, holder="second")
+
+    assert first.acquire()
+    assert first.acquire()
+    assert not second.acquire()
+
+    first.release()
+    assert second.acquire()
+    assert second.stats.takeovers == 0
+    assert path.read_text(encoding="utf-8") == "second"
+    second.release()
@@ -1,3 +1,6 @@
+from datetime import datetime, timezone
+from io import BytesIO
+
 import pytest
 
 from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error, parse_utc_timestamp
@@ -18,3 +21,55 @@ def test_openf1_client_wraps_timeout_error(monkeypatch) -> None:
 
     with pytest.raises(OpenF1Error, match="timed out"):
         OpenF1Client().meetings(2026)
+
+
+def test_openf1_client_streams_projected_position_rows(monkeypatch) -> None:
+    body = (
+        b'[{"date": "2026-06-07T13:00:00+00:00", "session_key": 11296, "meeting_key": 1286, "driver_number": 16, "position": 2},'
+        b' {"date": "2026-06-07T13:05:00+00:00", "session_key": 11296, "meeting_key": 1286, "driver_number": 16, "position": 1}]'
+    )
+    requested: list[str] = []
+
+    def fake_urlopen(url, timeout):
+        requested.append(url)
+        return BytesIO(body)
+
+    monkeypatch.setattr("f1dashboard.providers.openf1.urlopen", fake_urlopen)
+
+    rows = list(OpenF1Client(base_url="https://openf1.test").iter_positions(11296, fields=("driver_number", "position")))
+
+    assert requested == ["https://openf1.test/v1/position?session_key=11296"]
+    assert rows == [{"driver_number": 16, "position": 2}, {"driver_number": 16, "position": 1}]
+
+
+def test_openf1_client_wraps_truncated_stream(monkeypatch) -> None:
+    monkeypatch.setattr("f1dashboard.providers.openf1.urlopen", lambda url, timeout: BytesIO(b'[{"position": 1}, {"pos'))
+
+    with pytest.raises(OpenF1Error, match="invalid JSON"):
+        OpenF1Client(base_url="https://openf1.test").positions(11296)
+
+
+def test_openf1_query_pushes_operator_filters_into_the_url(monkeypatch) -> None:
+    requested: list[str] = []
+
+    def fake_urlopen(url, timeout):
+        requested.append(url)
+        return BytesIO(b'[{"driver_number": 1, "position": 3, "lap_number": 12}]')
+
+    monkeypatch.setattr("f1dashboard.providers.openf1.urlopen", fake_urlopen)
+
+    rows = (
+        OpenF1Client(base_url="https://openf1.test")
+        .query("position")
+        .filter(session_key=11296, date__gt=datetime(2026, 6, 7, 13, 0, tzinfo=timezone.utc), position__lte=3)
+        .select("driver_number", "position")
+        .fetch()
+    )
+
+    assert requested == ["https://openf1.test/v1/position?session_key=11296&date>2026-06-07T13:00:00%2B00:00&position<=3"]
+    assert rows == [{"driver_number": 1, "position": 3}]
+
+
+def test_openf1_query_rejects_unknown_operators() -> None:
+    with pytest.raises(ValueError, match="near"):
+        OpenF1Client().query("laps").filter(lap_number__near=3)
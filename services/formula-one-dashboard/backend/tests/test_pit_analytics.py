@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from f1dashboard.analytics import summarize_groups
+from f1dashboard.services.pit_analytics import PitAnalytics, pit_stop_seconds
+
+SESSIONS = [
+    {"session_key": 1, "session_name": "Sprint", "date_start": "2026-05-23T18:00:00+00:00", "date_end": "2026-05-23T19:00:00+00:00"},
+    {"session_key": 2, "session_name": "Race", "date_start": "2026-05-24T20:00:00+00:00", "date_end": "2026-05-24T22:00:00+00:00"},
+    {"session_key": 3, "session_name": "Next", "date_start": "2026-05-30T20:00:00+00:00", "date_end": "2026-05-30T22:00:00+00:00"},
+]
+
+
+class PitClient:
+    def __init__(self) -> None:
+        self.pit_calls: list[int] = []
+
+    def pit(self, session_key):
+        self.pit_calls.append(session_key)
+        durations = {1: [22.0, 24.0], 2: [21.0, 23.0, 25.0, 999.0]}[session_key]
+        return [{"driver_number": 12 if index % 2 == 0 else 44, "pit_duration": value} for index, value in enumerate(durations)]
+
+    def drivers(self, session_key):
+        return [{"driver_number": 12, "team_name": "Mercedes"}, {"driver_number": 44, "team_name": "Ferrari"}]
+
+
+def test_pit_analytics_summarizes_a_meeting_and_caches_final_sessions() -> None:
+    client = PitClient()
+    now = [datetime(2026, 5, 24, 21, 0, tzinfo=timezone.utc)]
+    analytics = PitAnalytics(client, clock=lambda: now[0])
+
+    breakdown = analytics.breakdown(1285, SESSIONS)
+
+    assert sorted(client.pit_calls) == [1, 2]
+    assert breakdown.stops == 5
+    assert breakdown.average_seconds == pytest.approx(23.0)
+    assert breakdown.median_seconds == 23.0
+    assert [(row.name, row.stops, row.median_seconds) for row in breakdown.by_session] == [("Sprint", 2, 23.0), ("Race", 3, 23.0)]
+    assert [(row.name, row.fastest_seconds) for row in breakdown.by_team] == [("Mercedes", 21.0), ("Ferrari", 23.0)]
+
+    # Session 1 is final; the race is still running and is fetched again.
+    analytics.breakdown(1285, SESSIONS)
+    assert sorted(client.pit_calls) == [1, 2, 2]
+
+
+def test_pit_stop_seconds_drops_implausible_durations() -> None:
+    assert pit_stop_seconds({"pit_duration": "22.4"}) == 22.4
+    assert pit_stop_seconds({"pit_duration": None, "stop_duration": 2.3}) == 2.3
+    assert pit_stop_seconds({"pit_duration": 349.9}) is None
+    assert pit_stop_seconds({}) is None
+
+
+def test_summarize_groups_computes_per_group_medians() -> None:
+    summary = summarize_groups(["a", "b", "a", "a", "b"], [3.0, 10.0, 1.0, 2.0, 20.0])
+
+    assert (summary["a"].count, summary["a"].median, summary["a"].minimum) == (3, 2.0, 1.0)
+    assert (summary["b"].mean, summary["b"].median) == (15.0, 15.0)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from f1dashboard.registry import EntityRegistry
+
+
+def _result(number: str, driver_id: str, given_name: str, family_name: str, team: str) -> dict:
+    return {
+        "position": "1",
+        "number": number,
+        "points": "25",
+        "Driver": {"driverId": driver_id, "givenName": given_name, "familyName": family_name, "code": driver_id[:3].upper()},
+        "Constructor": {"constructorId": team.lower(), "name": team},
+    }
+
+
+def test_rows_share_the_registry_records() -> None:
+    registry = EntityRegistry()
+    registry.start_season(2026)
+
+    first = registry.race_results.decode_all([_result("12", "antonelli", "Kimi", "Antonelli", "Mercedes")])
+    second = registry.race_results.decode_all([_result("12", "antonelli", "Kimi", "Antonelli", "Mercedes")])
+    standings = registry.driver_standings.decode_all([{"position": "1", "points": "25", "Driver": {"driverId": "antonelli"}}])
+
+    assert first[0].driver_name == "Kimi Antonelli"
+    assert second[0].driver_name is first[0].driver_name
+    assert second[0].team_name is first[0].team_name
+    assert standings[0].competitor_name is first[0].driver_name
+    assert standings[0].competitor_id == "antonelli"
+
+
+def test_openf1_drivers_resolve_to_jolpica_records_by_number() -> None:
+    registry = EntityRegistry()
+    registry.start_season(2026)
+    jolpica = registry.driver({"driverId": "antonelli", "givenName": "Kimi", "familyName": "Antonelli", "permanentNumber": "12"})
+
+    assert registry.openf1_driver({"full_name": "Andrea Kimi ANTONELLI"}, 12) is jolpica
+    assert registry.openf1_driver({"name_acronym": "HAM"}, 44).name == "HAM"
+
+    registry.start_season(2027)
+    assert registry.openf1_driver({"full_name": "Andrea Kimi ANTONELLI"}, 12) is not jolpica
+
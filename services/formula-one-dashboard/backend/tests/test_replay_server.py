@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+from json import loads
+from urllib.request import urlopen
+
+import pytest
+
+from f1dashboard.devtools.loadtest import percentile
+from f1dashboard.devtools.replay import FaultProfile, RecordedResponse, RecordingStore, ReplayServer
+from f1dashboard.providers.openf1 import OpenF1Client, OpenF1Error
+
+
+@pytest.fixture
+def replay_server(tmp_path):
+    servers: list[ReplayServer] = []
+
+    def start(faults: FaultProfile | None = None) -> ReplayServer:
+        store = RecordingStore(tmp_path)
+        store.save(
+            "openf1",
+            "/v1/sessions",
+            "session_key=latest",
+            RecordedResponse(
+                url="https://api.openf1.org/v1/sessions?session_key=latest",
+                status=200,
+                content_type="application/json",
+                body=b'[{"session_key": 11282, "meeting_key": 1285}]',
+            ),
+        )
+        server = ReplayServer(("127.0.0.1", 0), store, mode="replay", faults=faults)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_replay_server_serves_recorded_provider_responses(replay_server) -> None:
+    server = replay_server()
+    client = OpenF1Client(base_url=f"{server.base_url}/openf1")
+
+    assert client.latest_session() == {"session_key": 11282, "meeting_key": 1285}
+    with pytest.raises(OpenF1Error, match="404"):
+        client.meetings(2026)
+
+    with urlopen(f"{server.base_url}/__stats") as response:
+        stats = loads(response.read())
+    assert stats["total"] == 2
+    assert stats["outcome:hit"] == 1
+    assert stats["outcome:miss"] == 1
+
+
+def test_replay_server_injects_rate_limit_errors(replay_server) -> None:
+    server = replay_server(FaultProfile(rate_limit_ratio=1.0, seed=1))
+    client = OpenF1Client(base_url=f"{server.base_url}/openf1")
+
+    with pytest.raises(OpenF1Error, match="429"):
+        client.latest_session()
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    samples = [float(value) for value in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) is None
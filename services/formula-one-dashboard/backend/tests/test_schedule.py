@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from f1dashboard.models import Session
+from f1dashboard.schedule import (
+    BETWEEN_WEEKENDS,
+    LIVE,
+    LIVE_SESSION,
+    NONE,
+    OFF_SEASON,
+    RACE_WEEKEND,
+    RESULTS,
+    SCHEDULE,
+    STANDINGS,
+    UPCOMING,
+    VENUE,
+    cache_headers,
+    countdown,
+    next_state_change,
+    plan_refresh,
+)
+
+
+def _session(key: int, name: str, start_hour: int, end_hour: int) -> Session:
+    return Session(
+        session_key=key,
+        meeting_key=1,
+        session_name=name,
+        session_type=name,
+        date_start_utc=datetime(2026, 6, 6, start_hour, 0, tzinfo=timezone.utc),
+        date_end_utc=datetime(2026, 6, 6, end_hour, 0, tzinfo=timezone.utc),
+    )
+
+
+SESSIONS = [_session(2, "Qualifying", 14, 15), _session(1, "Practice 3", 10, 11)]
+
+
+def test_next_state_change_is_the_next_session_start_or_end() -> None:
+    assert next_state_change(SESSIONS, datetime(2026, 6, 6, 9, 0, tzinfo=timezone.utc)) == datetime(2026, 6, 6, 10, 0, tzinfo=timezone.utc)
+    assert next_state_change(SESSIONS, datetime(2026, 6, 6, 10, 30, tzinfo=timezone.utc)) == datetime(2026, 6, 6, 11, 0, tzinfo=timezone.utc)
+    assert next_state_change(SESSIONS, datetime(2026, 6, 6, 16, 0, tzinfo=timezone.utc)) is None
+
+
+def test_countdown_targets_the_live_session_end_then_the_next_start() -> None:
+    live = countdown(SESSIONS, datetime(2026, 6, 6, 10, 30, tzinfo=timezone.utc))
+    upcoming = countdown(SESSIONS, datetime(2026, 6, 6, 11, 30, tzinfo=timezone.utc))
+
+    assert (live.state, live.session_name, live.target_utc.hour) == (LIVE, "Practice 3", 11)
+    assert (upcoming.state, upcoming.session_name, upcoming.target_utc.hour) == (UPCOMING, "Qualifying", 14)
+    assert countdown(SESSIONS, datetime(2026, 6, 6, 16, 0, tzinfo=timezone.utc)).state == NONE
+
+
+def test_cache_headers_expire_at_the_boundary_within_the_cap() -> None:
+    now = datetime(2026, 6, 6, 13, 45, 30, tzinfo=timezone.utc)
+
+    assert cache_headers(datetime(2026, 6, 6, 14, 0, tzinfo=timezone.utc), now) == {
+        "Cache-Control": "public, max-age=870",
+        "Expires": "Sat, 06 Jun 2026 14:00:00 GMT",
+    }
+    assert cache_headers(None, now)["Cache-Control"] == "public, max-age=3600"
+    assert cache_headers(datetime(2026, 6, 6, 13, 0, tzinfo=timezone.utc), now)["Cache-Control"] == "public, max-age=0"
+
+
+def test_refresh_plan_follows_the_weekend_phase() -> None:
+    live = plan_refresh(SESSIONS, datetime(2026, 6, 6, 10, 30, tzinfo=timezone.utc))
+    weekend = plan_refresh(SESSIONS, datetime(2026, 6, 5, 12, 0, tzinfo=timezone.utc))
+    between = plan_refresh(SESSIONS, datetime(2026, 5, 25, 12, 0, tzinfo=timezone.utc))
+    off_season = plan_refresh(SESSIONS, datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc))
+
+    assert (live.phase, weekend.phase, between.phase, off_season.phase) == (LIVE_SESSION, RACE_WEEKEND, BETWEEN_WEEKENDS, OFF_SEASON)
+    assert live.next_refresh_utc == datetime(2026, 6, 6, 10, 31, tzinfo=timezone.utc)
+    assert between.due_utc[SCHEDULE] == datetime(2026, 5, 25, 14, 0, tzinfo=timezone.utc)
+    assert off_season.due_utc[STANDINGS] == datetime(2026, 1, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def test_refresh_plan_rechecks_results_after_a_session_ends() -> None:
+    now = datetime(2026, 6, 6, 11, 2, tzinfo=timezone.utc)
+    plan = plan_refresh(SESSIONS, now, last_session_end=datetime(2026, 6, 6, 11, 0, tzinfo=timezone.utc))
+
+    assert plan.phase == RACE_WEEKEND
+    assert plan.due_utc[RESULTS] == datetime(2026, 6, 6, 11, 5, tzinfo=timezone.utc)
+    assert plan.due_utc[STANDINGS] == datetime(2026, 6, 6, 11, 5, tzinfo=timezone.utc)
+    assert plan.due_utc[VENUE] == datetime(2026, 6, 6, 12, 2, tzinfo=timezone.utc)
+    assert not plan.is_due(RESULTS, now)
+    assert plan.is_due(RESULTS, datetime(2026, 6, 6, 11, 5, tzinfo=timezone.utc))
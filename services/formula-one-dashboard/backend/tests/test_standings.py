@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from f1dashboard.models import ChampionshipStandingRow
+from f1dashboard.standings import StandingsEngine
+
+
+def _rows(*points: float) -> list[ChampionshipStandingRow]:
+    return [
+        ChampionshipStandingRow(position=index + 1, competitor_name=f"Driver {index + 1}", points=value)
+        for index, value in enumerate(points)
+    ]
+
+
+def test_standings_engine_computes_gaps_to_leader_and_car_ahead() -> None:
+    rows = StandingsEngine().annotate(_rows(100, 82, 82, 40.5))
+
+    assert [row.gap_to_leader for row in rows] == [None, 18, 18, 59.5]
+    assert [row.gap_to_ahead for row in rows] == [None, 18, 0, 41.5]
+    assert [row.gap for row in rows] == [None, "-18", "-18", "-59.5"]
+
+
+def test_standings_engine_builds_series_from_rounds_in_any_order() -> None:
+    engine = StandingsEngine()
+
+    assert engine.apply_round(2026, 3, _rows(75, 50))
+    assert engine.apply_round(2026, 1, _rows(25, 18))
+    assert engine.apply_round(2026, 2, _rows(50, 36))
+    assert not engine.apply_round(2026, 2, _rows(999, 999))
+
+    leader = engine.annotate(_rows(75, 50))[0]
+    assert [(point.round, point.points) for point in leader.history] == [(1, 25), (2, 50), (3, 75)]
+
+    engine.apply_round(2027, 1, _rows(25, 18))
+    assert [point.round for point in engine.annotate(_rows(25, 18))[0].history] == [1]
+
+
+def test_standings_engine_keeps_history_across_a_team_rename() -> None:
+    engine = StandingsEngine()
+    engine.apply_round(2026, 1, [ChampionshipStandingRow(position=1, competitor_name="Sauber", points=10, competitor_id="sauber")])
+    engine.apply_round(2026, 2, [ChampionshipStandingRow(position=1, competitor_name="Audi", points=22, competitor_id="sauber")])
+
+    row = engine.annotate([ChampionshipStandingRow(position=1, competitor_name="Audi", points=22, competitor_id="sauber")])[0]
+    assert [(point.round, point.points) for point in row.history] == [(1, 10), (2, 22)]
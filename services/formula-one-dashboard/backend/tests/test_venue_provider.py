@@ -4,6 +4,7 @@ import pytest
 
 from f1dashboard.providers.venue import VenueClient
 from f1dashboard.providers.venue import VenueError
+from f1dashboard.registry import EntityRegistry
 
 
 def test_weather_forecast_requests_meeting_date_range() -> None:
@@ -56,3 +57,83 @@ def test_venue_client_wraps_timeout_error(monkeypatch) -> None:
 
     with pytest.raises(VenueError, match="timed out"):
         VenueClient(circuits_client=None)._get_json("https://example.com")
+
+
+def test_track_map_svg_is_built_once_per_circuit_and_year() -> None:
+    requested: list[str] = []
+
+    class StubVenueClient(VenueClient):
+        def _get_json(self, url, params=None, headers=None):
+            requested.append(url)
+            return {"x": [0, 100, 200, 200, 100, 0], "y": [0, 0, 0, 100, 100, 100]}
+
+    client = StubVenueClient(circuits_client=None)
+
+    first = client._track_map_svg("https://api.multiviewer.app/api/v1/circuits/22/2026")
+    second = client._track_map_svg("https://api.multiviewer.app/api/v1/circuits/22/2026?refresh=1")
+
+    assert first is not None
+    assert second is first
+    assert requested == ["https://api.multiviewer.app/api/v1/circuits/22/2026"]
+    assert 'd="M14 ' in first
+
+
+def test_circuit_length_reads_lead_section_wikitext_once_per_season() -> None:
+    requested: list[tuple[str, dict]] = []
+    consumed: list[str] = []
+
+    class StubVenueClient(VenueClient):
+        def _iter_lines(self, url, params=None, headers=None):
+            requested.append((url, params or {}))
+            for line in [
+                "{{Infobox race track\n",
+                "| name = Circuit Gilles Villeneuve\n",
+                "| length_km = 4.361\n",
+                "| length_km2 = 4.421\n",
+                "}}\n",
+            ]:
+                consumed.append(line)
+                yield line
+
+    client = StubVenueClient(circuits_client=None)
+
+    first = client._circuit_length_km("https://en.wikipedia.org/wiki/Circuit_Gilles_Villeneuve")
+    second = client._circuit_length_km("https://en.wikipedia.org/wiki/Circuit_Gilles_Villeneuve")
+
+    assert first == 4.361
+    assert second == 4.361
+    assert requested == [
+        (
+            "https://en.wikipedia.org/w/index.php",
+            {"title": "Circuit_Gilles_Villeneuve", "action": "raw", "section": 0},
+        )
+    ]
+    assert len(consumed) == 3
+
+
+def test_circuit_length_understands_convert_templates() -> None:
+    class StubVenueClient(VenueClient):
+        def _iter_lines(self, url, params=None, headers=None):
+            yield "{{Infobox race track | name = Circuit de Spa-Francorchamps\n"
+            yield "| length = {{convert|7.004|km|mi|abbr=on}}\n"
+
+    assert StubVenueClient(circuits_client=None)._circuit_length_km("https://en.wikipedia.org/wiki/Circuit_de_Spa-Francorchamps") == 7.004
+
+
+def test_circuit_list_is_fetched_once_per_season() -> None:
+    class CountingCircuitsClient:
+        calls = 0
+
+        def current_circuits(self):
+            self.calls += 1
+            return [{"circuitId": "monaco", "circuitName": "Circuit de Monaco", "Location": {"lat": "43.7347", "long": "7.42056", "locality": "Monte-Carlo", "country": "Monaco"}}]
+
+    circuits_client = CountingCircuitsClient()
+    registry = EntityRegistry()
+    client = VenueClient(circuits_client=circuits_client, registry=registry)
+
+    assert client.locate({"location": "Monte Carlo", "country_name": "Monaco"}) == (43.7347, 7.42056)
+    assert client.locate({"circuit_short_name": "Monaco"}) == (43.7347, 7.42056)
+    assert circuits_client.calls == 1
+    # Matches resolve to the registry's circuit records.
+    assert [(circuit.circuit_id, circuit.name, circuit.locality) for circuit in registry.circuits()] == [("monaco", "Circuit de Monaco", "Monte-Carlo")]
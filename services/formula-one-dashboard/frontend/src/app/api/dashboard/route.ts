@@ -17,7 +17,11 @@ export async function GET() {
     return new NextResponse(body, {
       status: response.status,
       headers: {
-        "cache-control": "no-store",
+        // The backend aligns these with the next session boundary.
+        "cache-control": response.headers.get("cache-control") ?? "no-store",
+        ...(response.headers.get("expires")
+          ? { expires: response.headers.get("expires") as string }
+          : {}),
         "content-type":
           response.headers.get("content-type") ??
           "application/json; charset=utf-8",
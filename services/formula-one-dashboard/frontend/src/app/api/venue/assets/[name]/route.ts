@@ -0,0 +1,46 @@
+import { NextResponse } from "next/server";
+
+const BACKEND_URL = process.env.BACKEND_URL ?? "http://backend:8000";
+
+const PASSTHROUGH_HEADERS = [
+  "cache-control",
+  "content-type",
+  "etag",
+  "vary",
+] as const;
+
+export async function GET(
+  request: Request,
+  { params }: { params: Promise<{ name: string }> },
+) {
+  const { name } = await params;
+  const ifNoneMatch = request.headers.get("if-none-match");
+
+  try {
+    // Node's fetch decompresses transparently; the browser-facing encoding is
+    // left to Caddy, so only the immutable caching headers are forwarded.
+    const response = await fetch(
+      `${BACKEND_URL}/api/venue/assets/${encodeURIComponent(name)}`,
+      {
+        headers: ifNoneMatch ? { "if-none-match": ifNoneMatch } : {},
+        cache: "no-store",
+      },
+    );
+
+    const headers = new Headers();
+    for (const header of PASSTHROUGH_HEADERS) {
+      const value = response.headers.get(header);
+      if (value) {
+        headers.set(header, value);
+      }
+    }
+    const body =
+      response.status === 304 ? null : await response.arrayBuffer();
+    return new NextResponse(body, { status: response.status, headers });
+  } catch {
+    return NextResponse.json(
+      { error: "Failed to reach backend venue asset service" },
+      { status: 502 },
+    );
+  }
+}
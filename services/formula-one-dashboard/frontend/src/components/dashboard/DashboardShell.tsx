@@ -99,8 +99,10 @@ function TrackMapPanel({ venue }: { venue: VenueContext | null }) {
         <h2 className="panel-title">{circuitName}</h2>
       </div>
       <div className="venue-map" aria-label="Circuit map">
-        {venue?.track_map_svg ? (
-          <div dangerouslySetInnerHTML={{ __html: venue.track_map_svg }} />
+        {venue?.track_map_url ? (
+          // Immutable, content-addressed SVG asset; next/image adds nothing here.
+          // eslint-disable-next-line @next/next/no-img-element
+          <img src={venue.track_map_url} alt={`${circuitName} track map`} />
         ) : (
           <span>Track map unavailable</span>
         )}
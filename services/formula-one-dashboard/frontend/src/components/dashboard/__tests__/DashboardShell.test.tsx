@@ -34,7 +34,7 @@ const snapshot: DashboardSnapshot = {
     circuit_short_name: "Monaco",
     circuit_image_url: null,
     circuit_wiki_url: null,
-    track_map_svg: "<svg viewBox='0 0 10 10'><path d='M1 1 L9 9'/></svg>",
+    track_map_url: "/api/venue/assets/0123456789abcdef0123456789abcdef.svg",
     track_length_km: null,
     fastest_lap_seconds: null,
     average_pit_stop_seconds: null,
@@ -92,8 +92,11 @@ const snapshot: DashboardSnapshot = {
         temperature_min_c: 18,
       },
     ],
+    weather_forecast_fetched_at_utc: "2026-06-04T09:45:00Z",
+    weather_forecast_is_stale: false,
   },
   generated_at_utc: "2026-06-04T10:00:00Z",
+  next_refresh_utc: "2026-06-04T10:10:00Z",
 };
 
 describe("DashboardShell weather panel", () => {
@@ -103,6 +106,9 @@ describe("DashboardShell weather panel", () => {
     );
 
     expect(html).toContain("Circuit de Monaco");
+    expect(html).toContain(
+      'src="/api/venue/assets/0123456789abcdef0123456789abcdef.svg"',
+    );
     expect(html).toContain("Weekend weather");
     expect(html).toContain("Weekend forecast");
     expect(html).not.toContain("Fri / Sat / Sun");
@@ -11,6 +11,9 @@ const buildRows = (count: number): ChampionshipStandingRow[] =>
     points: 100 - index,
     wins: index % 3,
     gap: null,
+    gap_to_leader: null,
+    gap_to_ahead: null,
+    history: [],
   }));
 
 describe("StandingsTable", () => {
@@ -54,6 +54,7 @@ describe("dashboard type contract", () => {
       constructor_standings: [],
       venue: null,
       generated_at_utc: "2026-06-05T11:40:00Z",
+      next_refresh_utc: null,
     };
 
     expect(snapshot.latest_positions).toHaveLength(1);
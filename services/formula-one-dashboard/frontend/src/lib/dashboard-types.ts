@@ -69,11 +69,19 @@ export interface VenueContext {
   circuit_short_name: string | null;
   circuit_image_url: string | null;
   circuit_wiki_url: string | null;
-  track_map_svg: string | null;
+  track_map_url: string | null;
   track_length_km: number | null;
   fastest_lap_seconds: number | null;
   average_pit_stop_seconds: number | null;
   weather_forecast: WeatherForecastDay[];
+  weather_forecast_fetched_at_utc: string | null;
+  weather_forecast_is_stale: boolean;
+}
+
+export interface StandingsHistoryPoint {
+  round: number;
+  position: number | null;
+  points: number;
 }
 
 export interface ChampionshipStandingRow {
@@ -81,7 +89,11 @@ export interface ChampionshipStandingRow {
   competitor_name: string;
   points: number;
   wins: number | null;
+  competitor_id: string | null;
   gap: string | null;
+  gap_to_leader: number | null;
+  gap_to_ahead: number | null;
+  history: StandingsHistoryPoint[];
 }
 
 export interface DashboardSnapshot {
@@ -95,4 +107,5 @@ export interface DashboardSnapshot {
   constructor_standings: ChampionshipStandingRow[];
   venue: VenueContext | null;
   generated_at_utc: string;
+  next_refresh_utc: string | null;
 }
@@ -1,4 +1,8 @@
 import os
+import threading
+import time
+from datetime import datetime, timezone
+
 import ts3
 from flask import Flask, jsonify
 
@@ -10,34 +14,212 @@ TS3_QUERY_IP = os.getenv("TS3_QUERY_IP", "teamspeak3")
 TS3_QUERY_PORT = int(os.getenv("TS3_QUERY_PORT", 10011))
 TS3_SERVER_ID = int(os.getenv("TS3_SERVER_ID", 1))
 
+# ServerQuery drops connections that stay idle this long (300 s by default);
+# the notification connection is pinged well before that.
+TS3_QUERY_IDLE_TIMEOUT = int(os.getenv("TS3_QUERY_IDLE_TIMEOUT", 300))
+TS3_KEEPALIVE_INTERVAL = TS3_QUERY_IDLE_TIMEOUT / 3
+
+# The TeamSpeak server is polled on this schedule and /status is served
+# from the latest result, however many clients ask. The poller keeps one
+# logged-in connection open between polls (every login counts against the
+# ServerQuery flood limit); polling well inside the idle timeout keeps it
+# alive without pings.
+TS3_POLL_INTERVAL = float(os.getenv("TS3_POLL_INTERVAL", 15))
+
+# Connected users are tracked from server notifications on a dedicated
+# connection and checked against a full clientlist this often.
+TS3_RECONCILE_INTERVAL = float(os.getenv("TS3_RECONCILE_INTERVAL", 300))
+TS3_RECONNECT_DELAY = float(os.getenv("TS3_RECONNECT_DELAY", 5))
+
+# Errors after which a connection is dropped and the next poll logs in again.
+CONNECTION_ERRORS = (ts3.query.TS3TransportError, ts3.query.TS3TimeoutError, OSError, EOFError)
+
+
+def _connect():
+    # Connect using telnet protocol as it is standard for TS3 Query
+    conn = ts3.query.TS3ServerConnection(f"telnet://{TS3_QUERY_IP}:{TS3_QUERY_PORT}")
+    try:
+        conn.exec_("login", client_login_name=TS3_QUERY_USER, client_login_password=TS3_QUERY_PASSWORD)
+        conn.exec_("use", sid=TS3_SERVER_ID)
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+class StatusCache:
+    """The latest polled status, when it was taken and why the last poll failed (if it did)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.status = None
+        self.updated_at = None
+        self.error = None
+
+    def store(self, status):
+        with self._lock:
+            self.status = status
+            self.updated_at = datetime.now(timezone.utc)
+            self.error = None
+
+    def fail(self, error):
+        with self._lock:
+            self.error = str(error) or type(error).__name__
+
+    def read(self):
+        with self._lock:
+            return self.status, self.updated_at, self.error
+
+
+status_cache = StatusCache()
+
+
+class ClientTracker:
+    """Connected users (client_type 0) by clid, kept current from enter/leave notifications.
+
+    `live` is False while the notification connection is down; the count is
+    then not trusted and /status falls back to the polled figure.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = {}
+        self.live = False
+
+    def reconcile(self, clients):
+        users = {c["clid"]: c.get("client_nickname") for c in clients if c.get("client_type") == "0"}
+        with self._lock:
+            self._users = users
+            self.live = True
+
+    def apply(self, event, rows):
+        with self._lock:
+            if event == "notifycliententerview":
+                for row in rows:
+                    if row.get("client_type") == "0":
+                        self._users[row["clid"]] = row.get("client_nickname")
+            elif event == "notifyclientleftview":
+                for row in rows:
+                    self._users.pop(row.get("clid"), None)
+
+    def lost(self):
+        with self._lock:
+            self.live = False
+
+    def count(self):
+        with self._lock:
+            return len(self._users) if self.live else None
+
+
+tracker = ClientTracker()
+
+
+def _close(conn):
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _poll_loop():
+    conn = None
+    while True:
+        try:
+            try:
+                conn = conn or _connect()
+                status = _read_status(conn)
+            except CONNECTION_ERRORS:
+                # The server dropped the connection since the last poll;
+                # log in again once before reporting a failure.
+                _close(conn)
+                conn = None
+                conn = _connect()
+                status = _read_status(conn)
+            status_cache.store(status)
+        except Exception as e:
+            if isinstance(e, CONNECTION_ERRORS):
+                _close(conn)
+                conn = None
+            # Query errors (bad permissions, unknown command) leave the
+            # connection usable.
+            status_cache.fail(e)
+        time.sleep(TS3_POLL_INTERVAL)
+
+
+def _listen_loop():
+    while True:
+        conn = None
+        try:
+            conn = _connect()
+            conn.exec_("servernotifyregister", event="server")
+            # Registered first, so no enter/leave can fall between the list
+            # and the first notification.
+            tracker.reconcile(conn.exec_("clientlist").parsed)
+            reconciled_at = last_command_at = time.monotonic()
+            while True:
+                # Notifications do not count as activity for the idle timeout.
+                keepalive_in = TS3_KEEPALIVE_INTERVAL - (time.monotonic() - last_command_at)
+                try:
+                    event = conn.wait_for_event(timeout=max(keepalive_in, 0.1))
+                except ts3.query.TS3TimeoutError:
+                    conn.send_keepalive()
+                    last_command_at = time.monotonic()
+                else:
+                    tracker.apply(event.event, event.parsed)
+                if time.monotonic() - reconciled_at >= TS3_RECONCILE_INTERVAL:
+                    tracker.reconcile(conn.exec_("clientlist").parsed)
+                    reconciled_at = last_command_at = time.monotonic()
+        except Exception as e:
+            tracker.lost()
+            app.logger.warning("ServerQuery notifications stopped: %s", e)
+        finally:
+            _close(conn)
+        time.sleep(TS3_RECONNECT_DELAY)
+
+
+def _read_status(conn):
+    # Get server info
+    serverinfo = conn.exec_("serverinfo").parsed[0]
+    max_users = int(serverinfo["virtualserver_maxclients"])
+
+    # Real users only: query clients (like this one) are counted separately.
+    connected_users = int(serverinfo["virtualserver_clientsonline"]) - int(serverinfo["virtualserver_queryclientsonline"])
+    return {
+        "users": connected_users,
+        "max_users": max_users,
+        "status": "online"
+    }
+
+
 @app.route("/status")
 def get_status():
-    try:
-        # Connect using telnet protocol as it is standard for TS3 Query
-        with ts3.query.TS3ServerConnection(f"telnet://{TS3_QUERY_IP}:{TS3_QUERY_PORT}") as ts3conn:
-            ts3conn.exec_("login", client_login_name=TS3_QUERY_USER, client_login_password=TS3_QUERY_PASSWORD)
-            ts3conn.exec_("use", sid=TS3_SERVER_ID)
-            
-            # Get server info
-            serverinfo = ts3conn.exec_("serverinfo").parsed[0]
-            max_users = int(serverinfo["virtualserver_maxclients"])
-            
-            # Get clients and filter for real users (client_type=0)
-            clients = ts3conn.exec_("clientlist").parsed
-            connected_users = len([c for c in clients if c.get("client_type") == "0"])
-            
-            return jsonify({
-                "users": connected_users,
-                "max_users": max_users,
-                "status": "online"
-            })
-    except Exception as e:
+    status, updated_at, error = status_cache.read()
+    if status is None:
+        # Nothing polled successfully yet.
         return jsonify({
             "status": "error",
-            "message": str(e),
+            "message": error or "waiting for the first poll",
             "users": 0,
             "max_users": 0
-        }), 500
+        }), 503
+    users = tracker.count()
+    payload = {
+        **status,
+        # Notifications keep the user count current between polls.
+        "users": status["users"] if users is None else users,
+        "updated_at": updated_at.isoformat(),
+        "age_seconds": round((datetime.now(timezone.utc) - updated_at).total_seconds(), 1),
+    }
+    if error is not None:
+        # The last poll failed: serve the last good value and say how old it is.
+        payload["status"] = "stale"
+        payload["message"] = error
+    return jsonify(payload)
+
+
+threading.Thread(target=_poll_loop, name="ts3-poller", daemon=True).start()
+threading.Thread(target=_listen_loop, name="ts3-notifications", daemon=True).start()
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000)